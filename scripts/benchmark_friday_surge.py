@@ -0,0 +1,340 @@
+"""
+Friday-surge load benchmark for the mark-attendance path.
+
+Seeds N members into the fake Sheets backend, freezes the clock inside the
+attendance window of a scheduled session, then drives concurrent
+check-member / mark-attendance / register traffic through the Flask app.
+
+Usage:
+    python scripts/benchmark_friday_surge.py --members 300 --concurrency 32
+    python scripts/benchmark_friday_surge.py --output results.json
+    python scripts/benchmark_friday_surge.py --compare results.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, os.path.abspath(SRC_DIR))
+
+import pytz
+import config.settings as settings
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Friday-surge load benchmark')
+    parser.add_argument('--members', type=int, default=300,
+                        help='Members seeded before the window opens')
+    parser.add_argument('--new-members', type=int, default=20,
+                        help='Members who register during the surge')
+    parser.add_argument('--concurrency', type=int, default=32,
+                        help='Concurrent client threads')
+    parser.add_argument('--duplicate-rate', type=float, default=0.2,
+                        help='Fraction of members who tap "mark" twice')
+    parser.add_argument('--wrong-code-rate', type=float, default=0.05,
+                        help='Fraction of members who first enter a wrong code')
+    parser.add_argument('--session-date', default=None,
+                        help='Scheduled session date to run inside (default: first session)')
+    parser.add_argument('--minutes-after-open', type=int, default=5,
+                        help='Frozen clock position after the window opens')
+    parser.add_argument('--latency-ms', type=float, default=settings.FAKE_SHEETS_LATENCY_MS,
+                        help='Simulated Sheets API latency per call')
+    parser.add_argument('--jitter-ms', type=float, default=settings.FAKE_SHEETS_JITTER_MS,
+                        help='Simulated Sheets API jitter per call')
+    parser.add_argument('--read-quota', type=int, default=settings.FAKE_SHEETS_READ_QUOTA_PER_MINUTE,
+                        help='Read requests per minute before 429 (0 disables)')
+    parser.add_argument('--write-quota', type=int, default=settings.FAKE_SHEETS_WRITE_QUOTA_PER_MINUTE,
+                        help='Write requests per minute before 429 (0 disables)')
+    parser.add_argument('--seed', type=int, default=2026,
+                        help='Random seed for the traffic mix')
+    parser.add_argument('--output', default=None,
+                        help='Write JSON results to this file instead of stdout')
+    parser.add_argument('--compare', default=None,
+                        help='Previous JSON results to compare against')
+    return parser.parse_args()
+
+
+def configure(args):
+    """
+    Point the app at the fake Sheets backend.
+    
+    Must run before any service module is imported, since they read
+    settings at import time.
+    """
+    settings.STORAGE_BACKEND = 'sheets'
+    settings.SHEETS_FAKE = True
+    settings.FAKE_SHEETS_LATENCY_MS = args.latency_ms
+    settings.FAKE_SHEETS_JITTER_MS = args.jitter_ms
+    settings.FAKE_SHEETS_READ_QUOTA_PER_MINUTE = args.read_quota
+    settings.FAKE_SHEETS_WRITE_QUOTA_PER_MINUTE = args.write_quota
+    
+    # Client-side quota buckets match the simulated quotas (0 means unlimited)
+    settings.SHEETS_READ_REQUESTS_PER_MINUTE = args.read_quota or 10 ** 9
+    settings.SHEETS_WRITE_REQUESTS_PER_MINUTE = args.write_quota or 10 ** 9
+    settings.ATTENDANCE_WRITE_BEHIND = False
+
+
+def freeze_clock(session_date, minutes_after_open):
+    """
+    Freeze the application clock inside the session's attendance window.
+    
+    Returns:
+        datetime: The frozen time
+    """
+    from utils.clock import FrozenClock, set_clock
+    
+    day = datetime.strptime(session_date, '%Y-%m-%d')
+    clock = FrozenClock(day.replace(
+        hour=settings.ATTENDANCE_START_HOUR,
+        minute=minutes_after_open
+    ))
+    set_clock(clock)
+    return clock.now()
+
+
+def member_payload(index):
+    """Build registration data for the index-th synthetic member."""
+    departments = settings.VALID_DEPARTMENTS
+    return {
+        'reg_number': f"T/DEG/2024/{index + 1}",
+        'full_name': f"Member {index + 1}",
+        'email': f"member{index + 1}@example.com",
+        'phone': f"+2557{index + 1:08d}",
+        'gender': settings.VALID_GENDERS[index % 2],
+        'year_of_study': settings.VALID_YEARS[index % len(settings.VALID_YEARS)],
+        'course': settings.VALID_COURSES[index % len(settings.VALID_COURSES)],
+        'departments': [departments[index % len(departments)]]
+    }
+
+
+def seed_members(spreadsheet, count, registration_date):
+    """Write members straight into the fake sheets, without API calls."""
+    from services.fake_sheets import MEMBER_HEADERS, ATTENDANCE_HEADERS
+    
+    member_rows = [MEMBER_HEADERS]
+    attendance_rows = [ATTENDANCE_HEADERS]
+    for index in range(count):
+        member = member_payload(index)
+        member_rows.append([
+            member['reg_number'],
+            member['full_name'],
+            member['email'],
+            member['phone'],
+            member['gender'],
+            member['year_of_study'],
+            member['course'],
+            ', '.join(member['departments']),
+            'TRUE',
+            'Member',
+            registration_date
+        ])
+        attendance_rows.append([member['reg_number'], member['full_name']])
+    
+    spreadsheet.add_worksheet(settings.MEMBERS_SHEET, member_rows)
+    spreadsheet.add_worksheet(settings.ATTENDANCE_SHEET, attendance_rows)
+
+
+def build_traffic(args, session_code):
+    """
+    Build the shuffled request list for the surge.
+    
+    Each seeded member checks their reg number, then marks attendance;
+    some retry with a wrong code or tap twice. New members register
+    first. Requests of one member stay in order.
+    """
+    rng = random.Random(args.seed)
+    journeys = []
+    
+    for index in range(args.members):
+        reg_number = member_payload(index)['reg_number']
+        steps = [('check', '/api/check-member', {'reg_number': reg_number})]
+        if rng.random() < args.wrong_code_rate:
+            steps.append(('mark', '/api/mark-attendance',
+                          {'reg_number': reg_number, 'session_code': 'WRONG1'}))
+        steps.append(('mark', '/api/mark-attendance',
+                      {'reg_number': reg_number, 'session_code': session_code}))
+        if rng.random() < args.duplicate_rate:
+            steps.append(('mark', '/api/mark-attendance',
+                          {'reg_number': reg_number, 'session_code': session_code}))
+        journeys.append(steps)
+    
+    for index in range(args.members, args.members + args.new_members):
+        payload = member_payload(index)
+        journeys.append([
+            ('check', '/api/check-member', {'reg_number': payload['reg_number']}),
+            ('register', '/api/register', payload),
+            ('mark', '/api/mark-attendance',
+             {'reg_number': payload['reg_number'], 'session_code': session_code})
+        ])
+    
+    rng.shuffle(journeys)
+    return journeys
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def summarize_latencies(latencies):
+    """Summarize latencies in milliseconds."""
+    values = sorted(latencies)
+    if not values:
+        return {}
+    return {
+        'count': len(values),
+        'mean': round(sum(values) / len(values), 2),
+        'p50': round(percentile(values, 0.50), 2),
+        'p95': round(percentile(values, 0.95), 2),
+        'p99': round(percentile(values, 0.99), 2),
+        'max': round(values[-1], 2)
+    }
+
+
+def run(args):
+    """Run the benchmark and return the results dictionary."""
+    configure(args)
+    
+    from config.sessions import SESSIONS
+    from services.fake_sheets import create_fake_spreadsheet
+    import services.fake_sheets as fake_sheets
+    
+    session_date = args.session_date or sorted(SESSIONS)[0]
+    session = SESSIONS[session_date]
+    frozen = freeze_clock(session_date, args.minutes_after_open)
+    
+    spreadsheet = create_fake_spreadsheet(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        read_quota=args.read_quota,
+        write_quota=args.write_quota
+    )
+    seed_members(spreadsheet, args.members, session_date)
+    fake_sheets._fake_spreadsheet = spreadsheet
+    
+    startup_started = time.perf_counter()
+    from app import app
+    startup_ms = (time.perf_counter() - startup_started) * 1000
+    spreadsheet.reset_call_counts()
+    
+    journeys = build_traffic(args, session['code'])
+    
+    latencies = defaultdict(list)
+    status_codes = Counter()
+    error_codes = Counter()
+    results_lock = threading.Lock()
+    local = threading.local()
+    
+    def run_journey(steps):
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = app.test_client()
+        
+        for endpoint, path, payload in steps:
+            started = time.perf_counter()
+            response = client.post(path, json=payload)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            
+            body = response.get_json(silent=True) or {}
+            code = body.get('error', {}).get('code', 'OK') if not body.get('success') else 'OK'
+            with results_lock:
+                latencies[endpoint].append(elapsed_ms)
+                status_codes[str(response.status_code)] += 1
+                error_codes[code] += 1
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(run_journey, journeys))
+    duration = time.perf_counter() - started
+    
+    all_latencies = [value for values in latencies.values() for value in values]
+    total_requests = len(all_latencies)
+    upstream_calls = spreadsheet.get_total_calls()
+    
+    return {
+        'benchmark': 'friday_surge',
+        'timestamp': datetime.now(pytz.utc).isoformat(),
+        'config': {
+            'members': args.members,
+            'new_members': args.new_members,
+            'concurrency': args.concurrency,
+            'duplicate_rate': args.duplicate_rate,
+            'wrong_code_rate': args.wrong_code_rate,
+            'session_date': session_date,
+            'frozen_time': frozen.isoformat(),
+            'latency_ms': args.latency_ms,
+            'jitter_ms': args.jitter_ms,
+            'read_quota': args.read_quota,
+            'write_quota': args.write_quota,
+            'seed': args.seed
+        },
+        'startup_ms': round(startup_ms, 2),
+        'requests': total_requests,
+        'duration_s': round(duration, 3),
+        'throughput_rps': round(total_requests / duration, 2) if duration else None,
+        'latency_ms': summarize_latencies(all_latencies),
+        'latency_ms_by_endpoint': {
+            endpoint: summarize_latencies(values) for endpoint, values in sorted(latencies.items())
+        },
+        'status_codes': dict(status_codes),
+        'result_codes': dict(error_codes),
+        'upstream_calls': {
+            'total': upstream_calls,
+            'per_request': round(upstream_calls / total_requests, 3) if total_requests else None,
+            'by_method': spreadsheet.get_call_counts()
+        }
+    }
+
+
+def compare(current, baseline_path):
+    """Print key metric changes against a previous run."""
+    with open(baseline_path, 'r', encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+    
+    metrics = [
+        ('throughput_rps', lambda r: r.get('throughput_rps')),
+        ('latency p50 ms', lambda r: r.get('latency_ms', {}).get('p50')),
+        ('latency p95 ms', lambda r: r.get('latency_ms', {}).get('p95')),
+        ('latency p99 ms', lambda r: r.get('latency_ms', {}).get('p99')),
+        ('upstream calls/request', lambda r: r.get('upstream_calls', {}).get('per_request'))
+    ]
+    
+    print(f"{'metric':<24}{'baseline':>12}{'current':>12}{'change':>10}", file=sys.stderr)
+    for name, getter in metrics:
+        before, after = getter(baseline), getter(current)
+        change = ''
+        if before and after is not None:
+            change = f"{(after - before) / before * 100:+.1f}%"
+        print(f"{name:<24}{str(before):>12}{str(after):>12}{change:>10}", file=sys.stderr)
+
+
+def main():
+    """Entry point."""
+    args = parse_args()
+    results = run(args)
+    
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(output + '\n')
+    else:
+        print(output)
+    
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
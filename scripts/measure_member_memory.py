@@ -0,0 +1,133 @@
+"""
+Measure the memory held by the in-process member index.
+
+Builds the member index from synthetic Members sheet rows twice: once as
+plain dicts (the previous representation) and once as Member records,
+and reports the bytes each holds per member.
+
+Rows go through a JSON round trip first, so every cell is a separate
+string object, as it is when parsed from a Sheets API response.
+
+Usage:
+    python scripts/measure_member_memory.py --members 5000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(SCRIPTS_DIR, '..', 'src')
+sys.path.insert(0, os.path.abspath(SRC_DIR))
+sys.path.insert(0, SCRIPTS_DIR)  # For benchmark_friday_surge
+
+from benchmark_friday_surge import member_payload
+from services.fake_sheets import MEMBER_HEADERS
+from services.sheets_service import _values_to_record, _record_to_member
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Member index memory measurement')
+    parser.add_argument('--members', type=int, default=5000,
+                        help='Members in the synthetic Members sheet')
+    parser.add_argument('--registration-days', type=int, default=30,
+                        help='Distinct registration dates across members')
+    return parser.parse_args()
+
+
+def build_rows(count, registration_days):
+    """Build Members sheet values as the API would return them."""
+    rows = [MEMBER_HEADERS]
+    for index in range(count):
+        member = member_payload(index)
+        rows.append([
+            member['reg_number'],
+            member['full_name'],
+            member['email'],
+            member['phone'],
+            member['gender'],
+            str(member['year_of_study']),
+            member['course'],
+            ', '.join(member['departments']),
+            'TRUE',
+            'Member',
+            f"2026-01-{index % registration_days + 1:02d}"
+        ])
+    return json.loads(json.dumps(rows))
+
+
+def record_to_dict(record):
+    """Build a member in the previous dict representation."""
+    return {
+        'reg_number': record.get('Reg Number'),
+        'full_name': record.get('Full Name'),
+        'email': record.get('Email'),
+        'phone': record.get('Phone'),
+        'gender': record.get('Gender'),
+        'year_of_study': record.get('Year of Study'),
+        'course': record.get('Course'),
+        'departments': record.get('Departments'),
+        'active': record.get('Active', 'TRUE') == 'TRUE',
+        'role': record.get('Role', 'Member'),
+        'registration_date': record.get('Registration Date')
+    }
+
+
+def measure(args, convert):
+    """
+    Build a reg_number index from fresh rows and measure what it retains.
+    
+    The rows are dropped before measuring, so only the index and the
+    strings it keeps alive are counted.
+    
+    Returns:
+        int: Bytes still allocated once the index is built
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    
+    rows = build_rows(args.members, args.registration_days)
+    headers = rows[0]
+    index = {}
+    for row in rows[1:]:
+        record = _values_to_record(headers, row)
+        index[record['Reg Number']] = convert(record)
+    del rows, row, record
+    gc.collect()
+    
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del index
+    return retained
+
+
+def main():
+    """Run the measurement and print a JSON report."""
+    args = parse_args()
+    
+    dict_bytes = measure(args, record_to_dict)
+    member_bytes = measure(args, _record_to_member)
+    
+    report = {
+        'members': args.members,
+        'dict': {
+            'total_bytes': dict_bytes,
+            'bytes_per_member': round(dict_bytes / args.members, 1)
+        },
+        'member': {
+            'total_bytes': member_bytes,
+            'bytes_per_member': round(member_bytes / args.members, 1)
+        },
+        'saving_percent': round((1 - member_bytes / dict_bytes) * 100, 1) if dict_bytes else None
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,158 @@
 """API routes for the attendance system."""
 
-from flask import Blueprint, request, jsonify, render_template
-from services import get_member_service, get_attendance_service
+import csv
+import hashlib
+import math
+from datetime import datetime
+from flask import Blueprint, Response, request, jsonify, render_template, current_app, stream_with_context
+from config.settings import VALID_DEPARTMENTS
+from config.sessions import get_schedule
+from services import (
+    get_member_service,
+    get_attendance_service,
+    get_async_attendance_service,
+    get_export_service,
+    get_history_service,
+    EXPORT_FORMATS
+)
 from utils.validators import validate_reg_number
-from utils.helpers import format_error_response, format_success_response
-from utils.session_manager import get_current_session_info
+from utils.helpers import format_error_response, format_success_response, parse_member_csv
+from utils.auth import require_leader_token, require_metrics_token
+from utils.metrics import record_cache, render_metrics
+from utils.session_manager import get_current_datetime, get_current_session_info, get_session_info_expiry
 
 # Create blueprint
 api_bp = Blueprint('api', __name__)
 
-# Initialize services
-member_service = get_member_service()
-attendance_service = get_attendance_service()
+# HTTP status for each mark attendance error code
+MARK_ATTENDANCE_STATUS_CODES = {
+    'MEMBER_NOT_FOUND': 404,
+    'MEMBER_INACTIVE': 403,
+    'TIME_WINDOW_CLOSED': 400,
+    'INVALID_SESSION_CODE': 400,
+    'DUPLICATE_ATTENDANCE': 409,
+    'SERVICE_BUSY': 503
+}
+
+
+def _parse_check_member_request(data):
+    """
+    Validate a check member request body.
+    
+    Args:
+        data: Parsed JSON body
+        
+    Returns:
+        tuple: (error_response, normalized_reg); error_response is None if valid
+    """
+    if not data or 'reg_number' not in data:
+        return (jsonify(format_error_response(
+            'INVALID_REQUEST',
+            'Registration number is required'
+        )), 400), None
+    
+    reg_number = data['reg_number'].strip()
+    
+    # Validate format and normalize
+    is_valid, error, normalized_reg = validate_reg_number(reg_number)
+    if not is_valid:
+        return (jsonify(format_error_response(
+            'INVALID_REG_NUMBER',
+            error
+        )), 400), None
+    
+    return None, normalized_reg
+
+
+def _check_member_response(member):
+    """
+    Build the check member response.
+    
+    Args:
+        member: Member record or None
+        
+    Returns:
+        tuple: (response, status_code)
+    """
+    if member:
+        return jsonify(format_success_response(
+            data={
+                'exists': True,
+                'member': member.to_dict()
+            }
+        )), 200
+    
+    return jsonify(format_success_response(
+        data={
+            'exists': False
+        },
+        message='Member not found. Would you like to register?'
+    )), 200
+
+
+def _parse_mark_request(data):
+    """
+    Validate a mark attendance request body.
+    
+    Args:
+        data: Parsed JSON body
+        
+    Returns:
+        tuple: (error_response, normalized_reg, session_code); error_response is None if valid
+    """
+    if not data:
+        return (jsonify(format_error_response(
+            'INVALID_REQUEST',
+            'Request body is required'
+        )), 400), None, None
+    
+    # Validate required fields
+    if 'reg_number' not in data or 'session_code' not in data:
+        return (jsonify(format_error_response(
+            'INVALID_REQUEST',
+            'Registration number and session code are required'
+        )), 400), None, None
+    
+    reg_number = data['reg_number'].strip()
+    session_code = data['session_code'].strip()
+    
+    # Validate and normalize reg number format
+    is_valid, error, normalized_reg = validate_reg_number(reg_number)
+    if not is_valid:
+        return (jsonify(format_error_response(
+            'INVALID_REG_NUMBER',
+            error
+        )), 400), None, None
+    
+    return None, normalized_reg, session_code
+
+
+def _mark_attendance_response(success, result):
+    """
+    Build the mark attendance response.
+    
+    Args:
+        success: Whether attendance was marked
+        result: Attendance data, or error dictionary on failure
+        
+    Returns:
+        tuple: (response, status_code)
+    """
+    if success:
+        return jsonify(format_success_response(
+            data=result,
+            message='Attendance marked successfully'
+        )), 200
+    
+    # Attendance marking failed
+    error = result
+    status_code = MARK_ATTENDANCE_STATUS_CODES.get(error['code'], 400)
+    
+    return jsonify(format_error_response(
+        error['code'],
+        error['message'],
+        error.get('details')
+    )), status_code
 
 
 @api_bp.route('/')
@@ -50,41 +191,65 @@ def check_member():
         }
     """
     try:
-        data = request.get_json()
-        
-        if not data or 'reg_number' not in data:
-            return jsonify(format_error_response(
-                'INVALID_REQUEST',
-                'Registration number is required'
-            )), 400
+        error_response, normalized_reg = _parse_check_member_request(request.get_json())
+        if error_response:
+            return error_response
         
-        reg_number = data['reg_number'].strip()
+        # Check if exists (using normalized reg number)
+        member = get_member_service().get_member_info(normalized_reg)
+        return _check_member_response(member)
         
-        # Validate format and normalize
-        is_valid, error, normalized_reg = validate_reg_number(reg_number)
+    except Exception as e:
+        return jsonify(format_error_response(
+            'UNKNOWN_ERROR',
+            'An unexpected error occurred',
+            str(e)
+        )), 500
+
+
+@api_bp.route('/api/members/<path:reg_number>/attendance', methods=['GET'])
+def member_attendance(reg_number):
+    """
+    Get a member's attendance history.
+    
+    Registration numbers contain slashes and are passed as is, e.g.
+    /api/members/T/DEG/2020/001/attendance
+    
+    Response:
+        {
+            "success": true,
+            "data": {
+                "reg_number": "T/DEG/2020/1",
+                "attended": 5,
+                "expected": 6,
+                "rate": 0.8333,
+                "current_streak": 3,
+                "history": [{"date": "2026-01-30", "department": "Networking", "present": true}, ...]
+            }
+        }
+    """
+    try:
+        is_valid, error, normalized_reg = validate_reg_number(reg_number.strip().upper())
         if not is_valid:
             return jsonify(format_error_response(
                 'INVALID_REG_NUMBER',
                 error
             )), 400
         
-        # Check if exists (using normalized reg number)
-        member = member_service.get_member_info(normalized_reg)
+        success, result = get_history_service().get_member_history(normalized_reg)
+        if not success:
+            status_codes = {
+                'MEMBER_NOT_FOUND': 404,
+                'SERVICE_BUSY': 503
+            }
+            status_code = status_codes.get(result['code'], 500)
+            return jsonify(format_error_response(
+                result['code'],
+                result['message'],
+                result.get('details')
+            )), status_code
         
-        if member:
-            return jsonify(format_success_response(
-                data={
-                    'exists': True,
-                    'member': member
-                }
-            )), 200
-        else:
-            return jsonify(format_success_response(
-                data={
-                    'exists': False
-                },
-                message='Member not found. Would you like to register?'
-            )), 200
+        return jsonify(format_success_response(data=result)), 200
         
     except Exception as e:
         return jsonify(format_error_response(
@@ -128,7 +293,7 @@ def register():
             )), 400
         
         # Register member
-        success, result = member_service.register_member(data)
+        success, result = get_member_service().register_member(data)
         
         if success:
             return jsonify(format_success_response(
@@ -138,7 +303,11 @@ def register():
         else:
             # Registration failed
             error = result
-            status_code = 409 if error['code'] == 'DUPLICATE_REGISTRATION' else 400
+            status_codes = {
+                'DUPLICATE_REGISTRATION': 409,
+                'SERVICE_BUSY': 503
+            }
+            status_code = status_codes.get(error['code'], 400)
             return jsonify(format_error_response(
                 error['code'],
                 error['message'],
@@ -153,6 +322,71 @@ def register():
         )), 500
 
 
+@api_bp.route('/api/members/import', methods=['POST'])
+@require_leader_token
+def import_members():
+    """
+    Register members in bulk from a CSV file (leaders only).
+    
+    Request:
+        CSV as a multipart "file" upload or as the raw request body, with
+        columns reg_number, full_name, email, phone, gender, year_of_study,
+        course, departments. Add ?dry_run=true to validate without writing.
+    
+    Response:
+        {
+            "success": true,
+            "data": {
+                "total_rows": 3,
+                "accepted": 2,
+                "imported": 2,
+                "rejected": 1,
+                "dry_run": false,
+                "errors": [{"line": 4, "reg_number": "...", "code": "DUPLICATE_IN_FILE", ...}]
+            }
+        }
+    """
+    try:
+        upload = request.files.get('file')
+        raw = upload.read() if upload else request.get_data()
+        
+        try:
+            rows = parse_member_csv(raw.decode('utf-8-sig'))
+        except (UnicodeDecodeError, ValueError, csv.Error) as e:
+            return jsonify(format_error_response(
+                'INVALID_CSV',
+                'Could not read the CSV file',
+                str(e)
+            )), 400
+        
+        dry_run = request.args.get('dry_run', '').lower() in ('1', 'true', 'yes')
+        success, result = get_member_service().import_members(rows, dry_run=dry_run)
+        
+        if success:
+            if dry_run:
+                message = f"Dry run: {result['accepted']} of {result['total_rows']} rows can be imported"
+            else:
+                message = f"Imported {result['imported']} of {result['total_rows']} rows"
+            return jsonify(format_success_response(data=result, message=message)), 200
+        
+        status_codes = {
+            'TOO_MANY_ROWS': 413,
+            'SERVICE_BUSY': 503
+        }
+        return jsonify(format_error_response(
+            result['code'],
+            result['message'],
+            result.get('details')
+        )), status_codes.get(result['code'], 500)
+        
+    except Exception as e:
+        return jsonify(format_error_response(
+            'UNKNOWN_ERROR',
+            'An unexpected error occurred',
+            str(e)
+        )), 500
+
+
 @api_bp.route('/api/mark-attendance', methods=['POST'])
 def mark_attendance():
     """
@@ -171,58 +405,308 @@ def mark_attendance():
             "data": {...}
         }
     """
+    try:
+        error_response, normalized_reg, session_code = _parse_mark_request(request.get_json())
+        if error_response:
+            return error_response
+        
+        # Mark attendance (using normalized reg number)
+        success, result = get_attendance_service().mark_attendance(normalized_reg, session_code)
+        return _mark_attendance_response(success, result)
+        
+    except Exception as e:
+        return jsonify(format_error_response(
+            'UNKNOWN_ERROR',
+            'An unexpected error occurred',
+            str(e)
+        )), 500
+
+
+@api_bp.route('/api/attendance/bulk', methods=['POST'])
+@require_leader_token
+def mark_attendance_bulk():
+    """
+    Mark attendance from a list collected offline (leaders only).
+    
+    Request Body:
+        {
+            "session_date": "2026-01-30",
+            "reg_numbers": ["T/DEG/2020/001", "t/dip/2024/15"]
+        }
+    
+    reg_numbers may also be a single string with one entry per line.
+    
+    Response:
+        {
+            "success": true,
+            "data": {
+                "session_date": "2026-01-30",
+                "total": 2,
+                "marked": 1,
+                "rejected": 1,
+                "results": [{"input": "...", "reg_number": "...", "status": "marked", ...}]
+            }
+        }
+    """
     try:
         data = request.get_json()
         
-        if not data:
+        if not data or 'session_date' not in data or 'reg_numbers' not in data:
             return jsonify(format_error_response(
                 'INVALID_REQUEST',
-                'Request body is required'
+                'Session date and registration numbers are required'
             )), 400
         
-        # Validate required fields
-        if 'reg_number' not in data or 'session_code' not in data:
+        reg_numbers = data['reg_numbers']
+        if isinstance(reg_numbers, str):
+            reg_numbers = [line for line in reg_numbers.replace(',', '\n').splitlines() if line.strip()]
+        if not isinstance(reg_numbers, list):
             return jsonify(format_error_response(
                 'INVALID_REQUEST',
-                'Registration number and session code are required'
-            )), 400
-        
-        reg_number = data['reg_number'].strip()
-        session_code = data['session_code'].strip()
-        
-        # Validate and normalize reg number format
-        is_valid, error, normalized_reg = validate_reg_number(reg_number)
-        if not is_valid:
-            return jsonify(format_error_response(
-                'INVALID_REG_NUMBER',
-                error
+                'Registration numbers must be a list or one per line'
             )), 400
         
-        # Mark attendance (using normalized reg number)
-        success, result = attendance_service.mark_attendance(normalized_reg, session_code)
+        success, result = get_attendance_service().mark_attendance_bulk(str(data['session_date']).strip(), reg_numbers)
         
         if success:
             return jsonify(format_success_response(
                 data=result,
-                message='Attendance marked successfully'
+                message=f"Marked {result['marked']} of {result['total']} entries"
             )), 200
-        else:
-            # Attendance marking failed
-            error = result
-            status_codes = {
-                'MEMBER_NOT_FOUND': 404,
-                'MEMBER_INACTIVE': 403,
-                'TIME_WINDOW_CLOSED': 400,
-                'INVALID_SESSION_CODE': 400,
-                'DUPLICATE_ATTENDANCE': 409
-            }
-            status_code = status_codes.get(error['code'], 400)
-            
-            return jsonify(format_error_response(
-                error['code'],
-                error['message'],
-                error.get('details')
-            )), status_code
+        
+        status_codes = {
+            'INVALID_SESSION_DATE': 400,
+            'SESSION_NOT_STARTED': 400,
+            'TOO_MANY_ENTRIES': 413,
+            'SERVICE_BUSY': 503
+        }
+        return jsonify(format_error_response(
+            result['code'],
+            result['message'],
+            result.get('details')
+        )), status_codes.get(result['code'], 500)
+        
+    except Exception as e:
+        return jsonify(format_error_response(
+            'UNKNOWN_ERROR',
+            'An unexpected error occurred',
+            str(e)
+        )), 500
+
+
+def _export_response(chunks, export_format, filename):
+    """
+    Build a streaming download response.
+    
+    Args:
+        chunks: Generator of encoded text
+        export_format: 'csv' or 'ndjson'
+        filename: Download file name without extension
+        
+    Returns:
+        Response: Streaming response
+    """
+    mimetypes = {
+        'csv': 'text/csv',
+        'ndjson': 'application/x-ndjson'
+    }
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetypes[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}.{export_format}"'}
+    )
+
+
+def _parse_export_args():
+    """
+    Validate the shared export query parameters.
+    
+    Returns:
+        tuple: (error_response, export_format, department); error_response is None if valid
+    """
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        return (jsonify(format_error_response(
+            'INVALID_FORMAT',
+            f"Format must be one of: {', '.join(EXPORT_FORMATS)}"
+        )), 400), None, None
+    
+    department = request.args.get('department') or None
+    if department is not None and department not in VALID_DEPARTMENTS:
+        return (jsonify(format_error_response(
+            'INVALID_DEPARTMENT',
+            f"Unknown department: {department}"
+        )), 400), None, None
+    
+    return None, export_format, department
+
+
+@api_bp.route('/api/export/members', methods=['GET'])
+@require_leader_token
+def export_members():
+    """
+    Download the member roster (leaders only).
+    
+    Query Parameters:
+        format: csv (default) or ndjson
+        department: Only members of this department
+    """
+    try:
+        error_response, export_format, department = _parse_export_args()
+        if error_response:
+            return error_response
+        
+        chunks = get_export_service().export_members(export_format, department)
+        return _export_response(chunks, export_format, 'members')
+        
+    except Exception as e:
+        return jsonify(format_error_response(
+            'UNKNOWN_ERROR',
+            'An unexpected error occurred',
+            str(e)
+        )), 500
+
+
+@api_bp.route('/api/export/attendance', methods=['GET'])
+@require_leader_token
+def export_attendance():
+    """
+    Download the attendance matrix (leaders only).
+    
+    Query Parameters:
+        format: csv (default, one column per session date) or ndjson
+            (one object per member with a list of dates present)
+        from: First session date, YYYY-MM-DD
+        to: Last session date, YYYY-MM-DD
+        department: Only members of this department
+    """
+    try:
+        error_response, export_format, department = _parse_export_args()
+        if error_response:
+            return error_response
+        
+        dates = {}
+        for param in ('from', 'to'):
+            value = request.args.get(param)
+            if value:
+                try:
+                    dates[param] = datetime.strptime(value, '%Y-%m-%d').strftime('%Y-%m-%d')
+                except ValueError:
+                    return jsonify(format_error_response(
+                        'INVALID_DATE',
+                        f"'{param}' must be a date in YYYY-MM-DD format"
+                    )), 400
+        
+        chunks = get_export_service().export_attendance(
+            export_format,
+            start_date=dates.get('from'),
+            end_date=dates.get('to'),
+            department=department
+        )
+        filename = '_'.join(['attendance'] + list(dates.values()))
+        return _export_response(chunks, export_format, filename)
+        
+    except Exception as e:
+        return jsonify(format_error_response(
+            'UNKNOWN_ERROR',
+            'An unexpected error occurred',
+            str(e)
+        )), 500
+
+
+REPORT_ORDERS = ('desc', 'asc')
+
+
+def _report_response(build_report):
+    """
+    Run a report and wrap it in the standard response.
+    
+    Args:
+        build_report: Callable taking the AnalyticsService and returning the report
+        
+    Returns:
+        tuple: (response, status)
+    """
+    # numpy is slow to import, so the analytics service is loaded with the first report
+    from services.analytics_service import get_analytics_service
+    
+    try:
+        report = build_report(get_analytics_service())
+        return jsonify(format_success_response(data=report)), 200
+        
+    except Exception as e:
+        return jsonify(format_error_response(
+            'UNKNOWN_ERROR',
+            'An unexpected error occurred',
+            str(e)
+        )), 500
+
+
+@api_bp.route('/api/reports/sessions', methods=['GET'])
+@require_leader_token
+def session_report():
+    """Turnout for each session held so far (leaders only)."""
+    return _report_response(lambda service: service.session_report())
+
+
+@api_bp.route('/api/reports/departments', methods=['GET'])
+@require_leader_token
+def department_report():
+    """Turnout for each department's sessions (leaders only)."""
+    return _report_response(lambda service: service.department_report())
+
+
+@api_bp.route('/api/reports/members', methods=['GET'])
+@require_leader_token
+def member_report():
+    """
+    Attendance rate and streaks per member (leaders only).
+    
+    Query Parameters:
+        limit: Maximum members to return (default 50)
+        order: desc (default, highest rate first) or asc
+    """
+    try:
+        limit = int(request.args.get('limit', 50))
+        if limit < 1:
+            raise ValueError
+    except ValueError:
+        return jsonify(format_error_response(
+            'INVALID_LIMIT',
+            'limit must be a positive integer'
+        )), 400
+    
+    order = request.args.get('order', 'desc').lower()
+    if order not in REPORT_ORDERS:
+        return jsonify(format_error_response(
+            'INVALID_ORDER',
+            f"order must be one of: {', '.join(REPORT_ORDERS)}"
+        )), 400
+    
+    return _report_response(lambda service: service.member_report(limit, order))
+
+
+@api_bp.route('/api/reports/cohorts', methods=['GET'])
+@require_leader_token
+def cohort_report():
+    """Attendance rate by year of study and by course (leaders only)."""
+    return _report_response(lambda service: service.cohort_report())
+
+
+@api_bp.route('/api/async/check-member', methods=['POST'])
+async def check_member_async():
+    """
+    Async variant of /api/check-member.
+    
+    Request and response are the same as /api/check-member.
+    """
+    try:
+        error_response, normalized_reg = _parse_check_member_request(request.get_json())
+        if error_response:
+            return error_response
+        
+        member = await get_async_attendance_service().get_member_info(normalized_reg)
+        return _check_member_response(member)
         
     except Exception as e:
         return jsonify(format_error_response(
@@ -232,11 +716,66 @@ def mark_attendance():
         )), 500
 
 
+@api_bp.route('/api/async/mark-attendance', methods=['POST'])
+async def mark_attendance_async():
+    """
+    Async variant of /api/mark-attendance.
+    
+    Request and response are the same as /api/mark-attendance; the member
+    lookup and duplicate check run concurrently.
+    """
+    try:
+        error_response, normalized_reg, session_code = _parse_mark_request(request.get_json())
+        if error_response:
+            return error_response
+        
+        success, result = await get_async_attendance_service().mark_attendance(normalized_reg, session_code)
+        return _mark_attendance_response(success, result)
+        
+    except Exception as e:
+        return jsonify(format_error_response(
+            'UNKNOWN_ERROR',
+            'An unexpected error occurred',
+            str(e)
+        )), 500
+
+
+# Encoded session info, reused until it can next change:
+# (schedule, expires_at, body, etag)
+_session_info_cache = None
+
+
+def _session_info_body(now):
+    """
+    Get the encoded session info and its ETag, rebuilding them once expired.
+    
+    Args:
+        now: Current datetime
+        
+    Returns:
+        tuple: (body, etag, expires_at)
+    """
+    global _session_info_cache
+    schedule = get_schedule()
+    cached = _session_info_cache
+    hit = cached is not None and cached[0] is schedule and now < cached[1]
+    record_cache('session_info', hit)
+    if not hit:
+        body = current_app.json.dumps(format_success_response(data=get_current_session_info()))
+        etag = hashlib.sha1(body.encode('utf-8')).hexdigest()
+        cached = _session_info_cache = (schedule, get_session_info_expiry(now), body, etag)
+    return cached[2], cached[3], cached[1]
+
+
 @api_bp.route('/api/session-info', methods=['GET'])
 def session_info():
     """
     Get current session information.
     
+    The response is cached and carries an ETag, with a max-age that
+    runs out when the information next changes (see
+    get_session_info_expiry); a matching If-None-Match gets a 304.
+    
     Response:
         {
             "success": true,
@@ -247,8 +786,14 @@ def session_info():
         }
     """
     try:
-        info = get_current_session_info()
-        return jsonify(format_success_response(data=info)), 200
+        now = get_current_datetime()
+        body, etag, expires_at = _session_info_body(now)
+        
+        response = current_app.response_class(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = max(math.ceil((expires_at - now).total_seconds()), 0)
+        return response.make_conditional(request)
     
     except Exception as e:
         return jsonify(format_error_response(
@@ -267,29 +812,60 @@ def health():
         {
             "status": "healthy",
             "timestamp": "2026-01-30T14:30:00+03:00",
-            "version": "1.0"
+            "version": "1.0",
+            "startup": {"import_ms": 120.5, "create_app_ms": 3.2, "connect_ms": 840.1}
         }
     """
-    from datetime import datetime
-    import pytz
-    from config.settings import TIMEZONE
+    now = get_current_datetime()
     
-    tz = pytz.timezone(TIMEZONE)
-    now = datetime.now(tz)
+    from config.settings import STORAGE_BACKEND
     
-    # Try to connect to Google Sheets
+    # Try to connect to the storage backend
+    write_queue = None
+    client_pool = None
+    startup = dict(current_app.config.get('STARTUP_TIMINGS', {}))
     try:
-        from services import get_sheets_service
-        sheets = get_sheets_service()
-        sheets_status = "connected"
+        from services import get_storage_backend
+        storage = get_storage_backend()
+        storage_status = "connected"
+        write_queue = storage.get_write_queue_stats()
+        client_pool = storage.get_client_pool_stats()
+        startup['connect_ms'] = storage.connect_ms
     except:
-        sheets_status = "error"
+        storage_status = "error"
     
-    return jsonify({
-        'status': 'healthy' if sheets_status == 'connected' else 'degraded',
+    storage_name = 'google_sheets' if STORAGE_BACKEND == 'sheets' else STORAGE_BACKEND
+    
+    response = {
+        'status': 'healthy' if storage_status == 'connected' else 'degraded',
         'timestamp': now.isoformat(),
         'version': '1.0',
         'services': {
-            'google_sheets': sheets_status
+            storage_name: storage_status
         }
-    }), 200
+    }
+    
+    if startup:
+        response['startup'] = startup
+    
+    if write_queue is not None:
+        response['write_queue'] = write_queue
+    
+    if client_pool is not None:
+        response['client_pool'] = client_pool
+    
+    return jsonify(response), 200
+
+
+@api_bp.route('/metrics', methods=['GET'])
+@require_metrics_token
+def metrics():
+    """
+    Prometheus metrics (metrics token).
+    
+    Request latency and status per route, service result codes, Sheets
+    API calls and latency per worksheet method, and cache lookups by
+    result, in the Prometheus text format.
+    """
+    body, content_type = render_metrics()
+    return Response(body, content_type=content_type)
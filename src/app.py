@@ -1,7 +1,13 @@
 """Main Flask application for MWECAU ICT Club Attendance System."""
 
+import time
+
+_import_started = time.perf_counter()
+
+import logging
 import sys
 import os
+import threading
 
 # Add current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -9,24 +15,106 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from flask import Flask
 from flask_cors import CORS
 from api import api_bp, register_error_handlers
-from config.settings import SECRET_KEY, DEBUG
+from cli import register_commands
+from config.settings import SECRET_KEY, DEBUG, WARM_UP_ON_START, REPORTS_PUBLISH_AFTER_WINDOW
+from services.report_service import ReportScheduler
+from utils.metrics import register_metrics
+from utils.tracing import register_tracing
+
+logger = logging.getLogger(__name__)
 
-# Create Flask app
-app = Flask(__name__)
+# Time spent importing Flask, the API package and services (no storage connection)
+IMPORT_MS = (time.perf_counter() - _import_started) * 1000
 
-# Configuration
-app.config['SECRET_KEY'] = SECRET_KEY
-app.config['DEBUG'] = DEBUG
-app.config['JSON_SORT_KEYS'] = False
 
-# Enable CORS
-CORS(app)
+def _warm_up(app):
+    """
+    Connect to storage and load caches in the background.
+    
+    Args:
+        app: Flask application whose startup timings are updated
+    """
+    started = time.perf_counter()
+    try:
+        from services import get_member_service, get_attendance_service
+        
+        get_attendance_service()
+        member_service = get_member_service()
+        member_service.storage.list_members()
+        
+        timings = app.config['STARTUP_TIMINGS']
+        timings['connect_ms'] = member_service.storage.connect_ms
+        timings['warm_up_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info("Warm-up finished in %.1f ms", timings['warm_up_ms'])
+    except Exception:
+        # Services retry the connection on the next request
+        logger.exception("Warm-up failed")
 
-# Register blueprints
-app.register_blueprint(api_bp)
 
-# Register error handlers
-register_error_handlers(app)
+def create_app(warm_up=WARM_UP_ON_START, publish_reports=REPORTS_PUBLISH_AFTER_WINDOW):
+    """
+    Create and configure the Flask application.
+    
+    Storage is not touched here: services connect on first use, so the
+    app still boots if Google Sheets is unreachable.
+    
+    Args:
+        warm_up: Start a background thread that connects to storage immediately
+        publish_reports: Start a background thread that publishes the report
+            after each attendance window closes
+        
+    Returns:
+        Flask: Configured application
+    """
+    started = time.perf_counter()
+    
+    app = Flask(__name__)
+    
+    # Configuration
+    app.config['SECRET_KEY'] = SECRET_KEY
+    app.config['DEBUG'] = DEBUG
+    app.config['JSON_SORT_KEYS'] = False
+    
+    # Enable CORS
+    CORS(app)
+    
+    # Register blueprints
+    app.register_blueprint(api_bp)
+    
+    # Register error handlers
+    register_error_handlers(app)
+    
+    # Register CLI commands
+    register_commands(app)
+    
+    # Time requests for /metrics
+    register_metrics(app)
+    
+    # Log per-request spans and Sheets call counts
+    register_tracing(app)
+    
+    app.config['STARTUP_TIMINGS'] = {
+        'import_ms': round(IMPORT_MS, 1),
+        'create_app_ms': round((time.perf_counter() - started) * 1000, 1)
+    }
+    logger.info(
+        "Startup: imports %.1f ms, create_app %.1f ms",
+        IMPORT_MS,
+        app.config['STARTUP_TIMINGS']['create_app_ms']
+    )
+    
+    if warm_up:
+        threading.Thread(target=_warm_up, args=(app,), name='warm-up', daemon=True).start()
+    
+    if publish_reports:
+        app.extensions['report_scheduler'] = ReportScheduler()
+        app.extensions['report_scheduler'].start()
+    
+    return app
+
+
+# Application instance for WSGI servers
+app = create_app()
 
 
 if __name__ == '__main__':
@@ -42,4 +130,3 @@ if __name__ == '__main__':
 # @app.route('/')
 # def hello_world():
 #     return 'Hello from Flask!'
-
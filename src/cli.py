@@ -0,0 +1,52 @@
+"""Flask CLI commands for club leaders."""
+
+import click
+from services import get_member_service
+from services.report_service import get_report_service, record_published_window
+from utils.helpers import parse_member_csv
+from utils.session_manager import get_last_closed_window
+
+
+def register_commands(app):
+    """Register CLI commands with Flask app."""
+    
+    @app.cli.command('import-members')
+    @click.argument('csv_file', type=click.File('r', encoding='utf-8-sig'))
+    @click.option('--dry-run', is_flag=True, help='Validate the file without writing members.')
+    def import_members_command(csv_file, dry_run):
+        """Register members in bulk from CSV_FILE."""
+        try:
+            rows = parse_member_csv(csv_file.read())
+        except ValueError as e:
+            raise click.ClickException(f"Could not read {csv_file.name}: {e}")
+        
+        success, result = get_member_service().import_members(rows, dry_run=dry_run)
+        if not success:
+            raise click.ClickException(f"{result['code']}: {result['message']}")
+        
+        for error in result['errors']:
+            click.echo(f"line {error['line']}: {error['code']} {error['reg_number'] or ''} - {error['message']}", err=True)
+            for field, message in (error.get('details') or {}).items():
+                click.echo(f"    {field}: {message}", err=True)
+        
+        if dry_run:
+            click.echo(f"Dry run: {result['accepted']} of {result['total_rows']} rows can be imported, {result['rejected']} rejected")
+        else:
+            click.echo(f"Imported {result['imported']} of {result['total_rows']} rows, {result['rejected']} rejected")
+    
+    @app.cli.command('materialize-reports')
+    def materialize_reports_command():
+        """Publish session and department turnout to the Reports sheet."""
+        success, result = get_report_service().materialize()
+        if not success:
+            raise click.ClickException(f"{result['code']}: {result['message']}")
+        
+        # The background publisher then skips windows this run already covered
+        window = get_last_closed_window()
+        if window is not None:
+            record_published_window(window.date_str)
+        
+        if result['cells_written']:
+            click.echo(f"Report updated: {result['cells_written']} cells written across {result['rows']} rows")
+        else:
+            click.echo("Report already up to date")
@@ -1,105 +1,211 @@
 """Session codes and schedule configuration."""
 
-from datetime import datetime, timedelta
-import pytz
-from .settings import TIMEZONE
-
-# Hardcoded session codes for each Friday
-SESSIONS = {
-    "2026-01-30": {
-        "department": "Networking",
-        "code": "NET30JAN",
-        "description": "Design and implementation of robust networks"
-    },
-    "2026-02-06": {
-        "department": "Computer Maintenance",
-        "code": "COMP06FEB",
-        "description": "Hardware/software troubleshooting and repair"
-    },
-    "2026-02-13": {
-        "department": "Graphic Design",
-        "code": "GRAPH13FEB",
-        "description": "Visual design using Adobe tools & Canva"
-    },
-    "2026-02-20": {
-        "department": "Artificial Intelligence (AI) & Machine Learning",
-        "code": "AI20FEB",
-        "description": "AI-driven automation and prototyping"
-    },
-    "2026-02-27": {
-        "department": "Cybersecurity",
-        "code": "CYBER27FEB",
-        "description": "Ethical hacking, digital forensics, and secure computing"
-    },
-    "2026-03-06": {
-        "department": "Programming",
-        "code": "PROG06MAR",
-        "description": "Software development in Python, JavaScript, PHP, etc."
-    },
-    "2026-03-13": {
-        "department": "Networking",
-        "code": "NET13MAR",
-        "description": "Design and implementation of robust networks"
-    },
-    "2026-03-20": {
-        "department": "Computer Maintenance",
-        "code": "COMP20MAR",
-        "description": "Hardware/software troubleshooting and repair"
-    },
-    "2026-03-27": {
-        "department": "Graphic Design",
-        "code": "GRAPH27MAR",
-        "description": "Visual design using Adobe tools & Canva"
-    },
-    "2026-04-03": {
-        "department": "Artificial Intelligence (AI) & Machine Learning",
-        "code": "AI03APR",
-        "description": "AI-driven automation and prototyping"
-    },
-}
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_right
+from collections.abc import Mapping
+from datetime import datetime
+from types import MappingProxyType
+from .settings import SESSIONS_FILE, SESSIONS_RELOAD_CHECK_SECONDS
 
+logger = logging.getLogger(__name__)
 
+SESSION_FIELDS = ('department', 'code', 'description')
 
-def get_session(date_str):
+
+class Schedule(Mapping):
     """
-    Get session by date string (YYYY-MM-DD).
+    Immutable session schedule: date string -> session details.
+
+    Dates are kept sorted, so date lookups are bisects,
+    and session codes are indexed case-folded for validation. Session
+    details are read-only mappings; copy() them to get a dict.
+    """
+
+    def __init__(self, sessions):
+        """
+        Build and validate a schedule.
+
+        Args:
+            sessions: Dictionary of date (YYYY-MM-DD) to session details
+
+        Raises:
+            ValueError: If a date, field or code is invalid or a code is reused
+        """
+        entries = {}
+        codes = {}
+        for date_str, session in sessions.items():
+            try:
+                datetime.strptime(date_str, '%Y-%m-%d')
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid session date: {date_str!r}")
+
+            if not isinstance(session, dict):
+                raise ValueError(f"Session {date_str} must be an object")
+            missing = [field for field in SESSION_FIELDS if not session.get(field)]
+            if missing:
+                raise ValueError(f"Session {date_str} is missing {', '.join(missing)}")
+            if not isinstance(session['code'], str):
+                raise ValueError(f"Session {date_str} code must be a string")
+
+            code = session['code'].strip().casefold()
+            if code in codes:
+                raise ValueError(f"Session code {session['code']} is used on {codes[code]} and {date_str}")
+            codes[code] = date_str
+            entries[date_str] = MappingProxyType(dict(session))
+
+        self.dates = tuple(sorted(entries))
+        self._sessions = entries
+        self._codes = codes
+
+    def __getitem__(self, date_str):
+        return self._sessions[date_str]
+
+    def __iter__(self):
+        return iter(self.dates)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def _with_date(self, index):
+        """Get a copy of the session at a sorted index, with its 'date' added."""
+        if index < 0 or index >= len(self.dates):
+            return None
+        date_str = self.dates[index]
+        session = self._sessions[date_str].copy()
+        session['date'] = date_str
+        return session
+
+    def date_for_code(self, code):
+        """
+        Look up the session date for a code, ignoring case.
+
+        Args:
+            code: Session code
+
+        Returns:
+            str: Session date (YYYY-MM-DD) or None
+        """
+        return self._codes.get(code.strip().casefold())
+
+    def dates_through(self, date_str):
+        """
+        Get session dates on or before a date.
+
+        Args:
+            date_str: Date string in format YYYY-MM-DD
+
+        Returns:
+            tuple: Session dates, oldest first
+        """
+        return self.dates[:bisect_right(self.dates, date_str)]
+
+    def next_after(self, date_str):
+        """Get the first session after date_str, with 'date' key."""
+        return self._with_date(bisect_right(self.dates, date_str))
+
+
+def load_schedule(path=SESSIONS_FILE):
+    """
+    Load a schedule from a JSON file.
 
     Args:
-        date_str: Date string in format YYYY-MM-DD
+        path: JSON file mapping dates to session details
 
     Returns:
-        dict: Session details or None if not found
+        Schedule: Loaded schedule
+
+    Raises:
+        ValueError: If the file is not a valid schedule
     """
-    return SESSIONS.get(date_str)
+    with open(path, encoding='utf-8') as f:
+        try:
+            sessions = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path} is not valid JSON: {e}")
+
+    if not isinstance(sessions, dict):
+        raise ValueError(f"{path} must contain an object of date -> session")
+    return Schedule(sessions)
+
+
+def _file_signature(path):
+    """Get the (mtime, size) used to detect schedule file changes."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Current schedule, replaced as a whole when the file changes
+_schedule = load_schedule()
+_schedule_signature = _file_signature(SESSIONS_FILE)
+_schedule_checked_at = time.monotonic()
+_schedule_lock = threading.Lock()
 
 
-def get_current_friday_session():
+def get_schedule():
     """
-    Get current or upcoming Friday session based on current time.
+    Get the current schedule, reloading it if the file has changed.
+
+    A file that fails to load is logged and the previous schedule is
+    kept, so a bad edit never takes attendance offline.
 
     Returns:
-        dict: Session details with 'date' key added, or None
+        Schedule: Current schedule
     """
-    tz = pytz.timezone(TIMEZONE)
-    now = datetime.now(tz)
-
-    # Find current Friday or next Friday
-    days_until_friday = (4 - now.weekday()) % 7  # Friday is 4
-    if days_until_friday == 0:
-        # Today is Friday
-        friday_date = now.date()
-    else:
-        # Get next Friday
-        friday_date = (now + timedelta(days=days_until_friday)).date()
-
-    date_str = friday_date.strftime('%Y-%m-%d')
-    session = SESSIONS.get(date_str)
-
-    if session:
-        session = session.copy()
-        session['date'] = date_str
+    global _schedule, _schedule_signature, _schedule_checked_at
+
+    if time.monotonic() - _schedule_checked_at < SESSIONS_RELOAD_CHECK_SECONDS:
+        return _schedule
+
+    with _schedule_lock:
+        if time.monotonic() - _schedule_checked_at < SESSIONS_RELOAD_CHECK_SECONDS:
+            return _schedule
+        _schedule_checked_at = time.monotonic()
+
+        try:
+            signature = _file_signature(SESSIONS_FILE)
+            if signature != _schedule_signature:
+                # Recorded first, so a bad file is only reported once
+                _schedule_signature = signature
+                _schedule = load_schedule()
+                logger.info("Reloaded %d sessions from %s", len(_schedule), SESSIONS_FILE)
+        except (OSError, ValueError) as e:
+            logger.error("Keeping previous session schedule: %s", e)
+
+    return _schedule
+
+
+class _CurrentSessions(Mapping):
+    """Read-only view of whichever schedule is current."""
+
+    def __getitem__(self, date_str):
+        return get_schedule()[date_str]
+
+    def __iter__(self):
+        return iter(get_schedule())
+
+    def __len__(self):
+        return len(get_schedule())
+
 
-    return session
+# Session details by date (always the current schedule)
+SESSIONS = _CurrentSessions()
+
+
+def get_session(date_str):
+    """
+    Get session by date string (YYYY-MM-DD).
+
+    Args:
+        date_str: Date string in format YYYY-MM-DD
+
+    Returns:
+        Mapping: Session details (read-only) or None if not found
+    """
+    return get_schedule().get(date_str)
 
 
 def get_next_session_after(date_str):
@@ -112,10 +218,4 @@ def get_next_session_after(date_str):
     Returns:
         dict: Next session details with 'date' key, or None
     """
-    dates = sorted(SESSIONS.keys())
-    for d in dates:
-        if d > date_str:
-            session = SESSIONS[d].copy()
-            session['date'] = d
-            return session
-    return None
+    return get_schedule().next_after(date_str)
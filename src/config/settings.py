@@ -10,6 +10,48 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 SECRET_KEY = 'mwecau-ict-club-secret-key-2026'
 DEBUG = False
 
+# Leader Endpoints
+# Bulk import and other leader-only endpoints require this bearer token.
+# They are disabled while it is empty.
+LEADER_API_TOKEN = os.environ.get('LEADER_API_TOKEN', '')
+
+# Startup
+# Services connect to storage on first use. When enabled, create_app() also
+# starts a background thread that connects and loads caches straight away,
+# so the first request after a reload does not pay the connect cost.
+WARM_UP_ON_START = False
+
+# Reports
+# The report on the Reports sheet is published with `flask materialize-reports`,
+# e.g. from a scheduled task after each session. REPORTS_PUBLISH_AFTER_WINDOW
+# makes create_app() also start a thread that publishes it once each attendance
+# window has closed (checked every REPORTS_CHECK_INTERVAL_SECONDS); enable it
+# in one process only, as every worker would start its own. The last window
+# published is recorded in REPORTS_STATE_FILE, so restarts neither skip nor
+# repeat one. Failed attempts are retried with backoff.
+REPORTS_PUBLISH_AFTER_WINDOW = False
+REPORTS_CHECK_INTERVAL_SECONDS = 60
+REPORTS_RETRY_MAX_SECONDS = 3600  # Longest wait between retries after failures
+REPORTS_STATE_FILE = BASE_DIR / 'data' / 'reports_published.json'
+
+# Metrics
+# /metrics serves Prometheus metrics to scrapers that send METRICS_API_TOKEN
+# as a bearer token; it is disabled while the token is empty. When the app
+# runs in several worker processes, point PROMETHEUS_MULTIPROC_DIR at an
+# empty directory (cleared before each start) so /metrics aggregates every
+# worker.
+METRICS_API_TOKEN = os.environ.get('METRICS_API_TOKEN', '')
+PROMETHEUS_MULTIPROC_DIR = os.environ.get('PROMETHEUS_MULTIPROC_DIR', '')
+
+# Request Tracing
+# Each request's service stages and Sheets calls are timed as spans and
+# logged as one JSON line (logger utils.tracing, INFO). Requests making
+# more than TRACE_SHEETS_CALL_BUDGET Sheets calls or taking longer than
+# TRACE_DURATION_BUDGET_MS are logged at WARNING; 0 disables a budget.
+REQUEST_TRACING = True
+TRACE_SHEETS_CALL_BUDGET = 5
+TRACE_DURATION_BUDGET_MS = 2000
+
 # Google Service Account Credentials (stored directly)
 GOOGLE_CREDENTIALS = {
     "type": "service_account",
@@ -25,11 +67,64 @@ GOOGLE_CREDENTIALS = {
     "universe_domain": "googleapis.com"
 }
 
+# Storage Backend
+# 'sheets' stores data in Google Sheets, 'sqlite' in a local SQLite database
+STORAGE_BACKEND = 'sheets'
+SQLITE_DATABASE_PATH = BASE_DIR / 'data' / 'attendance.db'
+
 # Google Sheets Configuration
 SPREADSHEET_ID = 'xxxx'
-MEMBERS_SHEET = 'xxxx'
-ATTENDANCE_SHEET = 'xxxx'
-REPORTS_SHEET = 'xxxx'
+MEMBERS_SHEET = 'Members'
+ATTENDANCE_SHEET = 'Attendance_2026'
+REPORTS_SHEET = 'Reports'
+
+# Google Sheets API Client
+# Client-side token buckets keep each process under the per-minute quotas;
+# 429/5xx responses are retried with jittered exponential backoff.
+SHEETS_READ_REQUESTS_PER_MINUTE = 60
+SHEETS_WRITE_REQUESTS_PER_MINUTE = 60
+SHEETS_QUOTA_WAIT_SECONDS = 10  # Longest a call waits for quota before failing
+SHEETS_MAX_RETRIES = 4
+SHEETS_BACKOFF_BASE_SECONDS = 0.5
+SHEETS_BACKOFF_MAX_SECONDS = 16
+
+# Google Sheets Client Pool
+# Each request thread checks out its own authorized client (with a keep-alive
+# HTTP session) per API call, so concurrent calls do not share a session.
+SHEETS_CLIENT_POOL_SIZE = 4
+SHEETS_CLIENT_CHECKOUT_TIMEOUT_SECONDS = 10  # Longest a call waits for a free client
+SHEETS_TOKEN_REFRESH_MARGIN_SECONDS = 300  # Refresh access tokens 5 minutes before expiry
+
+# Async Routes
+# Threads that run blocking storage calls for the /api/async/* routes
+ASYNC_STORAGE_THREADS = 16
+
+# Fake Google Sheets (offline load testing)
+# When enabled, GoogleSheetsService talks to an in-memory spreadsheet that
+# simulates API latency and per-minute quotas instead of the real API.
+SHEETS_FAKE = False
+FAKE_SHEETS_LATENCY_MS = 150  # Base latency per API call
+FAKE_SHEETS_JITTER_MS = 100  # Random extra latency per API call
+FAKE_SHEETS_READ_QUOTA_PER_MINUTE = 60  # 0 disables the read quota
+FAKE_SHEETS_WRITE_QUOTA_PER_MINUTE = 60  # 0 disables the write quota
+
+# Cache Settings
+MEMBER_CACHE_TTL_SECONDS = 300  # Fetch newly appended members every 5 minutes
+MEMBER_CACHE_FULL_CHECK_SECONDS = 1800  # Check loaded members for manual edits every 30 minutes
+ATTENDANCE_GEOMETRY_TTL_SECONDS = 600  # Reload attendance date/row maps every 10 minutes
+MARKED_SET_TTL_SECONDS = 300  # Re-read a session's attendance column every 5 minutes
+
+# Write-behind Attendance Marks
+# When enabled, marks are journaled and acknowledged immediately, then written
+# to the Attendance sheet in one batch_update per flush. Each worker process
+# journals to its own file (attendance_queue.<pid>.jsonl); marks left by
+# workers that have exited are taken over at startup.
+ATTENDANCE_WRITE_BEHIND = False
+WRITE_BEHIND_JOURNAL = BASE_DIR / 'data' / 'attendance_queue.jsonl'
+WRITE_BEHIND_FLUSH_INTERVAL_MS = 2000  # Flush at least every 2 seconds
+WRITE_BEHIND_BATCH_SIZE = 50  # ...or as soon as 50 marks are waiting
+WRITE_BEHIND_MAX_QUEUE = 1000  # Pending marks before new marks must wait
+WRITE_BEHIND_ENQUEUE_TIMEOUT_SECONDS = 5  # Wait for room before rejecting a mark
 
 # Attendance Window Settings
 ATTENDANCE_START_HOUR = 13  # 13:00 (1:00 PM)
@@ -39,6 +134,13 @@ ATTENDANCE_END_HOUR = 0  # 00:00 (Midnight)
 # Timezone
 TIMEZONE = 'Africa/Dar_es_Salaam'  # EAT (UTC+3)
 
+# Session Schedule
+# Sessions (date -> department, code, description) are loaded from this
+# JSON file. Edits are picked up without a restart: the file is checked
+# for changes at most every SESSIONS_RELOAD_CHECK_SECONDS.
+SESSIONS_FILE = Path(os.environ.get('SESSIONS_FILE', BASE_DIR / 'src' / 'config' / 'sessions.json'))
+SESSIONS_RELOAD_CHECK_SECONDS = 5
+
 # Validation Patterns
 REG_NUMBER_PATTERN = r'^T\/(DEG|DIP)\/(19|20)\d{2}\/\d{1,4}$'  # 1 to 4 digits at end
 EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
@@ -59,5 +161,10 @@ VALID_YEARS = [1, 2, 3]
 
 # Application Settings
 MAX_DEPARTMENTS_PER_MEMBER = 6
+MAX_IMPORT_ROWS = 5000  # Rows accepted by one bulk member import
+MAX_BULK_ATTENDANCE = 1000  # Entries accepted by one bulk attendance request
+EXPORT_CHUNK_ROWS = 500  # Rows read per storage call when streaming exports
+ANALYTICS_CACHE_TTL_SECONDS = 300  # Seconds an attendance report snapshot is reused
+HISTORY_ROLLUP_TTL_SECONDS = 900  # Rebuild member history rollups to pick up other workers' marks
 MIN_YEAR = 1
 MAX_YEAR = 3
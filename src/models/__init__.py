@@ -0,0 +1,5 @@
+"""Models package exports."""
+
+from models.member import Member
+
+__all__ = ['Member']
@@ -0,0 +1,93 @@
+"""Member record shared by the storage backends and services."""
+
+import sys
+
+# Fields that repeat across many members (a handful of genders, courses,
+# department combinations, roles and registration dates)
+INTERNED_FIELDS = ('gender', 'course', 'departments', 'role', 'registration_date')
+
+
+def _intern(value):
+    """Intern strings so members with the same value share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Member:
+    """
+    Compact member record.
+    
+    Uses __slots__ instead of a per-instance dict, and interns repeated
+    strings, so a worker holding thousands of cached members stays small.
+    Instances held in storage caches are shared between requests and must
+    not be modified; convert with to_dict() at the response boundary.
+    """
+    
+    __slots__ = (
+        'reg_number',
+        'full_name',
+        'email',
+        'phone',
+        'gender',
+        'year_of_study',
+        'course',
+        'departments',
+        'active',
+        'role',
+        'registration_date'
+    )
+    
+    def __init__(self, reg_number, full_name, email=None, phone=None, gender=None,
+                 year_of_study=None, course=None, departments=None, active=True,
+                 role='Member', registration_date=None):
+        """
+        Initialize member.
+        
+        Args:
+            reg_number: Registration number
+            full_name: Full name
+            email: Email address
+            phone: Phone number
+            gender: Gender
+            year_of_study: Year of study
+            course: Course
+            departments: Comma-separated departments
+            active: Whether membership is active
+            role: Club role
+            registration_date: Registration date (YYYY-MM-DD)
+        """
+        self.reg_number = reg_number
+        self.full_name = full_name
+        self.email = email
+        self.phone = phone
+        self.gender = _intern(gender)
+        self.year_of_study = year_of_study
+        self.course = _intern(course)
+        self.departments = _intern(departments)
+        self.active = active
+        self.role = _intern(role)
+        self.registration_date = _intern(registration_date)
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a member from member data.
+        
+        Args:
+            data: Dictionary keyed by field name
+            
+        Returns:
+            Member: Member record
+        """
+        return cls(**{field: data[field] for field in cls.__slots__ if field in data})
+    
+    def to_dict(self):
+        """
+        Convert to member data for JSON responses.
+        
+        Returns:
+            dict: Member data
+        """
+        return {field: getattr(self, field) for field in self.__slots__}
+    
+    def __repr__(self):
+        return f"Member({self.reg_number!r}, {self.full_name!r})"
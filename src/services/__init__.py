@@ -2,13 +2,52 @@
 
 from services.member_service import MemberService, get_member_service
 from services.attendance_service import AttendanceService, get_attendance_service
+from services.history_service import HistoryService, get_history_service
+from services.async_service import AsyncAttendanceService, get_async_attendance_service
+from services.export_service import ExportService, get_export_service, EXPORT_FORMATS
 from services.sheets_service import GoogleSheetsService, get_sheets_service
+from services.sqlite_service import SQLiteService, get_sqlite_service
+from services.storage import (
+    StorageBackend,
+    DuplicateMemberError,
+    DuplicateAttendanceError,
+    MemberNotFoundError,
+    StorageBusyError,
+    get_storage_backend
+)
+from services.sheets_client import (
+    SheetsError,
+    SheetsRetryableError,
+    SheetsQuotaError,
+    SheetsFatalError,
+    SheetsNotFoundError
+)
 
 __all__ = [
     'MemberService',
     'get_member_service',
     'AttendanceService',
     'get_attendance_service',
+    'HistoryService',
+    'get_history_service',
+    'AsyncAttendanceService',
+    'get_async_attendance_service',
+    'ExportService',
+    'get_export_service',
+    'EXPORT_FORMATS',
     'GoogleSheetsService',
-    'get_sheets_service'
+    'get_sheets_service',
+    'SQLiteService',
+    'get_sqlite_service',
+    'StorageBackend',
+    'DuplicateMemberError',
+    'DuplicateAttendanceError',
+    'MemberNotFoundError',
+    'StorageBusyError',
+    'get_storage_backend',
+    'SheetsError',
+    'SheetsRetryableError',
+    'SheetsQuotaError',
+    'SheetsFatalError',
+    'SheetsNotFoundError'
 ]
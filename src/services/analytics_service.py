@@ -0,0 +1,344 @@
+"""Attendance analytics computed on a members x sessions matrix."""
+
+import threading
+import time
+import numpy as np
+from config.settings import ANALYTICS_CACHE_TTL_SECONDS, VALID_DEPARTMENTS
+from config.sessions import get_schedule, get_session
+from services.storage import get_storage_backend
+from utils.helpers import parse_departments
+from utils.metrics import record_cache
+from utils.session_manager import get_current_datetime
+
+# Session departments whose name differs from the member department name
+SESSION_DEPARTMENT_ALIASES = {
+    'Artificial Intelligence (AI) & Machine Learning': 'AI & Machine Learning'
+}
+
+
+def _rate(numerator, denominator):
+    """Divide element-wise, giving 0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+
+def _session_department(date_str):
+    """Get the member department that ran a session, or None."""
+    department = (get_session(date_str) or {}).get('department')
+    return SESSION_DEPARTMENT_ALIASES.get(department, department)
+
+
+class AttendanceMatrix:
+    """
+    Attendance snapshot as NumPy arrays.
+    
+    present[i, j] is True when member i attended session j. eligible[i, j]
+    is True when the member was expected at the session: active and
+    registered by then, or present anyway. Today's session only counts
+    for members who have already attended it. Member metadata is held in
+    parallel arrays so groupings are computed without Python loops
+    over members.
+    """
+    
+    def __init__(self, dates, reg_numbers, names, present, eligible, years, courses, departments):
+        """
+        Initialize matrix.
+        
+        Args:
+            dates: Session dates (YYYY-MM-DD), oldest first
+            reg_numbers: Registration numbers, one per row
+            names: Full names, one per row
+            present: Boolean array (members x sessions)
+            eligible: Boolean array (members x sessions)
+            years: Year of study per member (0 if unknown)
+            courses: Course per member
+            departments: Boolean array (members x VALID_DEPARTMENTS)
+        """
+        self.dates = dates
+        self.reg_numbers = reg_numbers
+        self.names = names
+        self.present = present
+        self.eligible = eligible
+        self.years = years
+        self.courses = courses
+        self.departments = departments
+        self.loaded_at = time.monotonic()
+    
+    def streaks(self):
+        """
+        Compute attendance streaks.
+        
+        A streak is broken by a missed session the member was eligible
+        for; sessions before registration neither extend nor break it.
+        
+        Returns:
+            tuple: (current, longest) integer arrays, one value per member
+        """
+        if not self.dates:
+            empty = np.zeros(len(self.reg_numbers), dtype=int)
+            return empty, empty
+        
+        attended = np.cumsum(self.present, axis=1)
+        missed = self.eligible & ~self.present
+        # Sessions attended up to the most recent miss, carried forward
+        at_last_miss = np.maximum.accumulate(np.where(missed, attended, 0), axis=1)
+        runs = attended - at_last_miss
+        return runs[:, -1], runs.max(axis=1)
+
+
+class AnalyticsService:
+    """Service for attendance reports."""
+    
+    def __init__(self):
+        """Initialize analytics service."""
+        self.storage = get_storage_backend()
+        self._matrix = None
+        self._lock = threading.Lock()
+    
+    def _session_dates(self, today):
+        """Dates with attendance recorded, plus scheduled sessions up to today."""
+        dates = set(self.storage.list_attendance_dates())
+        dates.update(get_schedule().dates_through(today))
+        return sorted(dates)
+    
+    def _load_matrix(self):
+        """
+        Build the attendance matrix from storage.
+        
+        Returns:
+            AttendanceMatrix: Snapshot
+        """
+        today = get_current_datetime().strftime('%Y-%m-%d')
+        dates = self._session_dates(today)
+        date_positions = {date_str: index for index, date_str in enumerate(dates)}
+        members = {member.reg_number: member for member in self.storage.list_members()}
+        
+        reg_numbers = []
+        names = []
+        present_rows = []
+        present_cols = []
+        for row, (reg_number, full_name, present) in enumerate(self.storage.iter_attendance_matrix(dates)):
+            reg_numbers.append(reg_number)
+            names.append(full_name)
+            for date_str in present:
+                present_rows.append(row)
+                present_cols.append(date_positions[date_str])
+        
+        present = np.zeros((len(reg_numbers), len(dates)), dtype=bool)
+        present[present_rows, present_cols] = True
+        
+        department_columns = {name: index for index, name in enumerate(VALID_DEPARTMENTS)}
+        years = np.zeros(len(reg_numbers), dtype=int)
+        courses = np.full(len(reg_numbers), '', dtype=object)
+        active = np.zeros(len(reg_numbers), dtype=bool)
+        registered = np.full(len(reg_numbers), '', dtype='<U10')
+        departments = np.zeros((len(reg_numbers), len(VALID_DEPARTMENTS)), dtype=bool)
+        
+        for row, reg_number in enumerate(reg_numbers):
+            member = members.get(reg_number)
+            if member is None:
+                continue
+            try:
+                years[row] = int(member.year_of_study)
+            except (TypeError, ValueError):
+                pass
+            courses[row] = member.course or ''
+            active[row] = member.active
+            registered[row] = str(member.registration_date or '')[:10]
+            for department in parse_departments(member.departments):
+                if department in department_columns:
+                    departments[row, department_columns[department]] = True
+        
+        # Missing registration dates sort before every session date
+        eligible = active[:, None] & (registered[:, None] <= np.array(dates, dtype='<U10')[None, :])
+        if today in date_positions:
+            # Today's session may still be open: only members who attended are expected so far
+            eligible[:, date_positions[today]] = False
+        eligible |= present
+        
+        return AttendanceMatrix(dates, reg_numbers, names, present, eligible, years, courses, departments)
+    
+    def get_matrix(self, refresh=False):
+        """
+        Get the cached attendance matrix, rebuilding it once expired.
+        
+        Args:
+            refresh: Rebuild even if the cached matrix is still fresh
+            
+        Returns:
+            AttendanceMatrix: Snapshot
+        """
+        matrix = self._matrix
+        if refresh or matrix is None or time.monotonic() - matrix.loaded_at >= ANALYTICS_CACHE_TTL_SECONDS:
+            with self._lock:
+                matrix = self._matrix
+                if refresh or matrix is None or time.monotonic() - matrix.loaded_at >= ANALYTICS_CACHE_TTL_SECONDS:
+                    record_cache('analytics_matrix', False)
+                    matrix = self._load_matrix()
+                    self._matrix = matrix
+                    return matrix
+        record_cache('analytics_matrix', True)
+        return matrix
+    
+    def session_report(self):
+        """
+        Turnout for each session.
+        
+        Returns:
+            dict: Report with one entry per session date
+        """
+        matrix = self.get_matrix()
+        attended = matrix.present.sum(axis=0)
+        expected = matrix.eligible.sum(axis=0)
+        rates = _rate(attended, expected)
+        
+        sessions = []
+        for index, date_str in enumerate(matrix.dates):
+            session = get_session(date_str) or {}
+            sessions.append({
+                'date': date_str,
+                'department': session.get('department'),
+                'description': session.get('description'),
+                'attended': int(attended[index]),
+                'expected': int(expected[index]),
+                'turnout': round(float(rates[index]), 4)
+            })
+        
+        return {
+            'members': len(matrix.reg_numbers),
+            'session_count': len(matrix.dates),
+            'average_turnout': round(float(rates.mean()), 4) if len(rates) else 0.0,
+            'sessions': sessions
+        }
+    
+    def department_report(self):
+        """
+        Turnout grouped by the department that ran each session.
+        
+        member_turnout is the share of the department's own members who
+        attended its sessions.
+        
+        Returns:
+            dict: Report with one entry per department
+        """
+        matrix = self.get_matrix()
+        session_departments = np.array([
+            _session_department(date_str) for date_str in matrix.dates
+        ], dtype=object)
+        attended = matrix.present.sum(axis=0)
+        expected = matrix.eligible.sum(axis=0)
+        
+        departments = []
+        for column, department in enumerate(VALID_DEPARTMENTS):
+            sessions = session_departments == department
+            members = matrix.departments[:, column]
+            own_present = matrix.present[members][:, sessions].sum()
+            own_expected = matrix.eligible[members][:, sessions].sum()
+            departments.append({
+                'department': department,
+                'members': int(members.sum()),
+                'sessions': int(sessions.sum()),
+                'attended': int(attended[sessions].sum()),
+                'turnout': round(float(_rate(attended[sessions].sum(), expected[sessions].sum())), 4),
+                'member_turnout': round(float(_rate(own_present, own_expected)), 4)
+            })
+        
+        return {'departments': departments}
+    
+    def member_report(self, limit=50, order='desc'):
+        """
+        Attendance rate and streaks per member.
+        
+        Args:
+            limit: Maximum members to return
+            order: 'desc' for the highest rates first, 'asc' for the lowest
+            
+        Returns:
+            dict: Report with one entry per member, sorted by rate
+        """
+        matrix = self.get_matrix()
+        attended = matrix.present.sum(axis=1)
+        expected = matrix.eligible.sum(axis=1)
+        rates = _rate(attended, expected)
+        current, longest = matrix.streaks()
+        
+        # Sort by rate, then by sessions attended, both in the requested direction
+        ranking = np.lexsort((attended, rates))
+        if order == 'desc':
+            ranking = ranking[::-1]
+        ranking = ranking[:limit]
+        
+        return {
+            'members': len(matrix.reg_numbers),
+            'session_count': len(matrix.dates),
+            'results': [
+                {
+                    'reg_number': matrix.reg_numbers[row],
+                    'full_name': matrix.names[row],
+                    'attended': int(attended[row]),
+                    'expected': int(expected[row]),
+                    'rate': round(float(rates[row]), 4),
+                    'current_streak': int(current[row]),
+                    'longest_streak': int(longest[row])
+                }
+                for row in ranking
+            ]
+        }
+    
+    def cohort_report(self):
+        """
+        Attendance rate by year of study and by course.
+        
+        Returns:
+            dict: Report with by_year and by_course breakdowns
+        """
+        matrix = self.get_matrix()
+        attended = matrix.present.sum(axis=1)
+        expected = matrix.eligible.sum(axis=1)
+        
+        def breakdown(values, key):
+            groups, codes = np.unique(values, return_inverse=True)
+            members = np.bincount(codes, minlength=len(groups))
+            group_attended = np.bincount(codes, weights=attended, minlength=len(groups))
+            group_expected = np.bincount(codes, weights=expected, minlength=len(groups))
+            rates = _rate(group_attended, group_expected)
+            return [
+                {
+                    key: groups[index].item(),
+                    'members': int(members[index]),
+                    'attended': int(group_attended[index]),
+                    'expected': int(group_expected[index]),
+                    'rate': round(float(rates[index]), 4)
+                }
+                for index in range(len(groups))
+            ]
+        
+        if not matrix.reg_numbers:
+            return {'by_year': [], 'by_course': []}
+        
+        return {
+            'by_year': breakdown(matrix.years, 'year_of_study'),
+            'by_course': breakdown(matrix.courses.astype(str), 'course')
+        }
+
+
+# Singleton instance
+_analytics_service = None
+_analytics_service_lock = threading.Lock()
+
+
+def get_analytics_service():
+    """
+    Get singleton instance of AnalyticsService.
+    
+    Returns:
+        AnalyticsService: Service instance
+    """
+    global _analytics_service
+    if _analytics_service is None:
+        # Services are created on first request, possibly from several threads at once
+        with _analytics_service_lock:
+            if _analytics_service is None:
+                _analytics_service = AnalyticsService()
+    return _analytics_service
@@ -0,0 +1,129 @@
+"""Asyncio front end for member and attendance operations."""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import ASYNC_STORAGE_THREADS
+from services.member_service import get_member_service
+from services.attendance_service import get_attendance_service
+from utils.metrics import counts_results
+
+# Storage calls are blocking, so coroutines hand them to this shared pool
+_executor = ThreadPoolExecutor(max_workers=ASYNC_STORAGE_THREADS, thread_name_prefix='storage')
+
+
+async def run_blocking(func, *args):
+    """
+    Run a blocking storage call without blocking the event loop.
+    
+    Args:
+        func: Function to call
+        *args: Positional arguments for func
+        
+    Returns:
+        Result of func
+    """
+    loop = asyncio.get_running_loop()
+    # Run in a copy of this context, so spans join the request's trace
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_executor, functools.partial(context.run, func, *args))
+
+
+class AsyncAttendanceService:
+    """
+    Async variants of the member lookup and mark attendance operations.
+    
+    Uses the same stages and storage as AttendanceService, but reads that
+    do not depend on each other run at the same time instead of one
+    after the other.
+    """
+    
+    def __init__(self):
+        """Initialize async service."""
+        self.member_service = get_member_service()
+        self.attendance_service = get_attendance_service()
+    
+    async def get_member_info(self, reg_number):
+        """
+        Get member information.
+        
+        Args:
+            reg_number: Registration number
+            
+        Returns:
+            Member: Member record or None
+        """
+        return await run_blocking(self.member_service.get_member_info, reg_number)
+    
+    @counts_results('mark_attendance')
+    async def mark_attendance(self, reg_number, session_code):
+        """
+        Mark attendance for a member.
+        
+        The in-process checks run first, as in the sync path. The member
+        lookup and the duplicate check then run concurrently, and their
+        errors are reported in the same order as the sync path.
+        
+        Args:
+            reg_number: Member registration number
+            session_code: Session code provided by leader
+            
+        Returns:
+            tuple: (success, error_or_data)
+        """
+        service = self.attendance_service
+        context = {
+            'reg_number': reg_number,
+            'session_code': session_code
+        }
+        
+        for stage in (service._check_time_window, service._check_session_code):
+            error = stage(context)
+            if error:
+                return False, error
+        
+        member_error, duplicate_error = await asyncio.gather(
+            run_blocking(service._load_member, context),
+            run_blocking(service._check_duplicate, context)
+        )
+        if member_error:
+            return False, member_error
+        
+        error = service._check_member_active(context) or duplicate_error
+        if error:
+            return False, error
+        
+        error = await run_blocking(service._write_attendance, context)
+        if error:
+            return False, error
+        
+        return True, {
+            'reg_number': reg_number,
+            'full_name': context['member'].full_name,
+            'session_date': context['date_str'],
+            'department': context['session']['department'],
+            'message': 'Attendance marked successfully'
+        }
+
+
+# Singleton instance
+_async_attendance_service = None
+_async_attendance_service_lock = threading.Lock()
+
+
+def get_async_attendance_service():
+    """
+    Get singleton instance of AsyncAttendanceService.
+    
+    Returns:
+        AsyncAttendanceService: Service instance
+    """
+    global _async_attendance_service
+    if _async_attendance_service is None:
+        # Services are created on first request, possibly from several threads at once
+        with _async_attendance_service_lock:
+            if _async_attendance_service is None:
+                _async_attendance_service = AsyncAttendanceService()
+    return _async_attendance_service
@@ -1,12 +1,24 @@
 """Attendance service for attendance-related operations."""
 
-from services.sheets_service import get_sheets_service
+import threading
+from services.storage import (
+    get_storage_backend,
+    DuplicateAttendanceError,
+    MemberNotFoundError,
+    StorageBusyError
+)
 from services.member_service import get_member_service
+from services.history_service import get_history_service
+from config.settings import MAX_BULK_ATTENDANCE, ATTENDANCE_START_HOUR
+from config.sessions import get_session
+from utils.validators import validate_reg_number
 from utils.session_manager import (
-    get_current_friday_date,
+    get_current_datetime,
     is_within_time_window,
     validate_session_code
 )
+from utils.metrics import counts_results
+from utils.tracing import traced
 
 
 class AttendanceService:
@@ -14,13 +26,21 @@ class AttendanceService:
     
     def __init__(self):
         """Initialize attendance service."""
-        self.sheets = get_sheets_service()
+        self.storage = get_storage_backend()
         self.member_service = get_member_service()
+        self.history_service = get_history_service()
     
+    @counts_results('mark_attendance')
+    @traced('mark_attendance')
     def mark_attendance(self, reg_number, session_code):
         """
         Mark attendance for a member.
         
+        Runs the mark stages in order and stops at the first failure.
+        In-process checks (time window, session code) come first, so
+        rejected requests never reach storage; the member record is then
+        fetched once and shared by the remaining stages.
+        
         Args:
             reg_number: Member registration number
             session_code: Session code provided by leader
@@ -28,72 +48,261 @@ class AttendanceService:
         Returns:
             tuple: (success, error_or_data)
         """
-        # 1. Check if member exists
-        if not self.member_service.check_member_exists(reg_number):
-            return False, {
-                'code': 'MEMBER_NOT_FOUND',
-                'message': 'Member not found',
-                'details': 'Registration number not in database. Please register first.'
-            }
+        context = {
+            'reg_number': reg_number,
+            'session_code': session_code
+        }
         
-        # 2. Check if member is active
-        if not self.member_service.is_member_active(reg_number):
-            return False, {
-                'code': 'MEMBER_INACTIVE',
-                'message': 'Your membership is inactive',
-                'details': 'Please contact club administration'
-            }
+        stages = (
+            self._check_time_window,
+            self._check_session_code,
+            self._load_member,
+            self._check_member_active,
+            self._check_duplicate,
+            self._write_attendance
+        )
         
-        # 3. Check time window
-        is_valid_time, reason = is_within_time_window()
-        if not is_valid_time:
-            return False, {
+        for stage in stages:
+            error = stage(context)
+            if error:
+                return False, error
+        
+        return True, {
+            'reg_number': reg_number,
+            'full_name': context['member'].full_name,
+            'session_date': context['date_str'],
+            'department': context['session']['department'],
+            'message': 'Attendance marked successfully'
+        }
+    
+    @traced('mark_attendance.check_time_window')
+    def _check_time_window(self, context):
+        """Stage 1: Check the attendance window is open."""
+        now = get_current_datetime()
+        window, reason = is_within_time_window(now)
+        if window is None:
+            if now.weekday() == 4 and now.hour >= ATTENDANCE_START_HOUR:
+                # Usual Friday hours with nothing scheduled: the session code
+                # check reports it as INVALID_SESSION_CODE, as it always has
+                context['date_str'] = now.strftime('%Y-%m-%d')
+                return None
+            return {
                 'code': 'TIME_WINDOW_CLOSED',
                 'message': 'Attendance marking window closed',
                 'details': reason
             }
         
-        # 4. Get current Friday date
-        friday_date = get_current_friday_date()
-        date_str = friday_date.strftime('%Y-%m-%d')
-        
-        # 5. Validate session code
-        code_valid, error, session = validate_session_code(session_code, date_str)
+        context['date_str'] = window.date_str
+        return None
+    
+    @traced('mark_attendance.check_session_code')
+    def _check_session_code(self, context):
+        """Stage 2: Validate the session code for the open session."""
+        code_valid, error, session = validate_session_code(context['session_code'], context['date_str'])
         if not code_valid:
-            return False, {
+            return {
                 'code': 'INVALID_SESSION_CODE',
                 'message': error or 'Invalid session code',
                 'details': 'The session code provided is incorrect'
             }
         
-        # 6. Check if already marked attendance
-        if self.has_marked_attendance(reg_number, date_str):
-            return False, {
+        context['session'] = session
+        return None
+    
+    @traced('mark_attendance.load_member')
+    def _load_member(self, context):
+        """Stage 3: Fetch the member record once."""
+        try:
+            member = self.member_service.get_member_info(context['reg_number'])
+        except Exception as e:
+            return self._storage_error(e)
+        
+        if not member:
+            return {
+                'code': 'MEMBER_NOT_FOUND',
+                'message': 'Member not found',
+                'details': 'Registration number not in database. Please register first.'
+            }
+        
+        context['member'] = member
+        return None
+    
+    @traced('mark_attendance.check_member_active')
+    def _check_member_active(self, context):
+        """Stage 4: Check the member is active."""
+        if not context['member'].active:
+            return {
+                'code': 'MEMBER_INACTIVE',
+                'message': 'Your membership is inactive',
+                'details': 'Please contact club administration'
+            }
+        return None
+    
+    @traced('mark_attendance.check_duplicate')
+    def _check_duplicate(self, context):
+        """Stage 5: Check attendance is not already marked."""
+        date_str = context['date_str']
+        try:
+            already_marked = self.has_marked_attendance(context['reg_number'], date_str)
+        except Exception as e:
+            return self._storage_error(e)
+        
+        if already_marked:
+            return {
                 'code': 'DUPLICATE_ATTENDANCE',
                 'message': 'Attendance already marked',
                 'details': f'You have already marked attendance for {date_str}'
             }
-        
-        # 7. Mark attendance
+        return None
+    
+    @traced('mark_attendance.write_attendance')
+    def _write_attendance(self, context):
+        """Stage 6: Record the attendance."""
+        date_str = context['date_str']
         try:
-            self.sheets.mark_attendance(reg_number, date_str)
+            self.storage.mark_attendance(context['reg_number'], date_str)
+        except DuplicateAttendanceError:
+            return {
+                'code': 'DUPLICATE_ATTENDANCE',
+                'message': 'Attendance already marked',
+                'details': f'You have already marked attendance for {date_str}'
+            }
+        except MemberNotFoundError:
+            return {
+                'code': 'MEMBER_NOT_FOUND',
+                'message': 'Member not found',
+                'details': 'Registration number not in database. Please register first.'
+            }
+        except Exception as e:
+            return self._storage_error(e)
+        
+        self.history_service.record_attendance(
+            context['reg_number'], date_str, context['member'].registration_date
+        )
+        return None
+    
+    def _storage_error(self, error):
+        """
+        Build the error response for a failed storage call.
+        
+        Args:
+            error: Exception raised by the storage backend
             
-            # Get member info for response
-            member = self.member_service.get_member_info(reg_number)
+        Returns:
+            dict: Error with code SERVICE_BUSY for retryable overload, else SHEETS_API_ERROR
+        """
+        if isinstance(error, StorageBusyError):
+            return {
+                'code': 'SERVICE_BUSY',
+                'message': 'Too many attendance requests, please try again shortly',
+                'details': str(error)
+            }
+        return {
+            'code': 'SHEETS_API_ERROR',
+            'message': 'Database error',
+            'details': str(error)
+        }
+    
+    def mark_attendance_bulk(self, date_str, reg_numbers):
+        """
+        Mark attendance for a list of members collected offline.
+        
+        Entries are normalized and checked against the cached member
+        index and marked set; every accepted entry is then written with
+        one storage call. The time window and session code are not
+        checked, since leaders enter lists after the session.
+        
+        Args:
+            date_str: Session date (YYYY-MM-DD)
+            reg_numbers: Registration numbers as collected
             
-            return True, {
-                'reg_number': reg_number,
-                'full_name': member['full_name'],
-                'session_date': date_str,
-                'department': session['department'],
-                'message': 'Attendance marked successfully'
+        Returns:
+            tuple: (success, error_or_report)
+        """
+        if not get_session(date_str):
+            return False, {
+                'code': 'INVALID_SESSION_DATE',
+                'message': 'No session is scheduled on this date',
+                'details': date_str
             }
-        except Exception as e:
+        
+        if date_str > get_current_datetime().strftime('%Y-%m-%d'):
             return False, {
-                'code': 'SHEETS_API_ERROR',
-                'message': 'Database error',
-                'details': str(e)
+                'code': 'SESSION_NOT_STARTED',
+                'message': 'Attendance cannot be recorded for a future session',
+                'details': date_str
             }
+        
+        if len(reg_numbers) > MAX_BULK_ATTENDANCE:
+            return False, {
+                'code': 'TOO_MANY_ENTRIES',
+                'message': f'At most {MAX_BULK_ATTENDANCE} entries can be marked at once',
+                'details': f'List has {len(reg_numbers)} entries'
+            }
+        
+        results = []
+        seen = set()
+        accepted = {}
+        registration_dates = {}
+        
+        try:
+            for raw in reg_numbers:
+                result = {'input': raw, 'status': 'rejected'}
+                results.append(result)
+                
+                is_valid, error, reg_number = validate_reg_number(
+                    raw.strip().upper() if isinstance(raw, str) else raw
+                )
+                if not is_valid:
+                    result.update(code='INVALID_REG_NUMBER', message=error)
+                    continue
+                result['reg_number'] = reg_number
+                
+                if reg_number in seen:
+                    result.update(code='DUPLICATE_IN_LIST', message='Listed more than once')
+                    continue
+                seen.add(reg_number)
+                
+                member = self.member_service.get_member_info(reg_number)
+                if not member:
+                    result.update(code='MEMBER_NOT_FOUND', message='Member not found')
+                    continue
+                if not member.active:
+                    result.update(code='MEMBER_INACTIVE', message='Membership is inactive')
+                    continue
+                
+                if self.has_marked_attendance(reg_number, date_str):
+                    result.update(code='DUPLICATE_ATTENDANCE', message='Attendance already marked')
+                    continue
+                
+                result['full_name'] = member.full_name
+                accepted[reg_number] = result
+                registration_dates[reg_number] = member.registration_date
+            
+            not_marked = self.storage.mark_attendance_many(list(accepted), date_str) if accepted else {}
+        except Exception as e:
+            return False, self._storage_error(e)
+        
+        messages = {
+            'DUPLICATE_ATTENDANCE': 'Attendance already marked',
+            'MEMBER_NOT_FOUND': 'Member not found in attendance sheet'
+        }
+        for reg_number, result in accepted.items():
+            code = not_marked.get(reg_number)
+            if code:
+                result.update(code=code, message=messages.get(code, 'Attendance not recorded'))
+            else:
+                result['status'] = 'marked'
+                self.history_service.record_attendance(reg_number, date_str, registration_dates[reg_number])
+        
+        marked = sum(1 for result in results if result['status'] == 'marked')
+        return True, {
+            'session_date': date_str,
+            'total': len(results),
+            'marked': marked,
+            'rejected': len(results) - marked,
+            'results': results
+        }
     
     def has_marked_attendance(self, reg_number, date_str):
         """
@@ -106,11 +315,12 @@ class AttendanceService:
         Returns:
             bool: True if already marked
         """
-        return self.sheets.get_attendance(reg_number, date_str)
+        return self.storage.get_attendance(reg_number, date_str)
 
 
 # Singleton instance
 _attendance_service = None
+_attendance_service_lock = threading.Lock()
 
 
 def get_attendance_service():
@@ -122,5 +332,8 @@ def get_attendance_service():
     """
     global _attendance_service
     if _attendance_service is None:
-        _attendance_service = AttendanceService()
+        # Services are created on first request, possibly from several threads at once
+        with _attendance_service_lock:
+            if _attendance_service is None:
+                _attendance_service = AttendanceService()
     return _attendance_service
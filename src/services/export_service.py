@@ -0,0 +1,175 @@
+"""Export service for streaming member and attendance data."""
+
+import csv
+import io
+import json
+import threading
+from config.settings import EXPORT_CHUNK_ROWS
+from models import Member
+from services.storage import get_storage_backend
+from utils.helpers import parse_departments
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+
+# Lines buffered before each chunk is handed to the response
+LINES_PER_CHUNK = 100
+
+
+def _stream_csv(header, rows):
+    """
+    Encode rows as CSV, a batch of lines at a time.
+    
+    Args:
+        header: Column names
+        rows: Iterable of value lists
+        
+    Yields:
+        str: CSV text
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % LINES_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    
+    yield buffer.getvalue()
+
+
+def _stream_ndjson(objects):
+    """
+    Encode objects as newline-delimited JSON, a batch of lines at a time.
+    
+    Args:
+        objects: Iterable of JSON-serializable dictionaries
+        
+    Yields:
+        str: NDJSON text
+    """
+    lines = []
+    for obj in objects:
+        lines.append(json.dumps(obj))
+        if len(lines) == LINES_PER_CHUNK:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+class ExportService:
+    """
+    Service for data exports.
+    
+    Exports are generators: rows are read from storage in chunks and
+    encoded as they are sent, so memory use stays flat however many
+    members there are.
+    """
+    
+    def __init__(self):
+        """Initialize export service."""
+        self.storage = get_storage_backend()
+    
+    def _in_department(self, member, department):
+        """Check whether a member belongs to a department (None matches all)."""
+        return department is None or department in parse_departments(member.departments)
+    
+    def export_members(self, export_format, department=None):
+        """
+        Stream the member roster.
+        
+        Args:
+            export_format: 'csv' or 'ndjson'
+            department: Only include members of this department (optional)
+            
+        Returns:
+            generator: Encoded text chunks
+        """
+        members = (
+            member for member in self.storage.list_members()
+            if self._in_department(member, department)
+        )
+        
+        if export_format == 'ndjson':
+            return _stream_ndjson(member.to_dict() for member in members)
+        
+        fields = Member.__slots__
+        return _stream_csv(fields, ([getattr(member, field) for field in fields] for member in members))
+    
+    def export_attendance(self, export_format, start_date=None, end_date=None, department=None):
+        """
+        Stream the attendance matrix.
+        
+        Session dates are resolved before streaming starts, so storage
+        errors here surface before any response is sent.
+        
+        Args:
+            export_format: 'csv' or 'ndjson'
+            start_date: First date to include, YYYY-MM-DD (optional)
+            end_date: Last date to include, YYYY-MM-DD (optional)
+            department: Only include members of this department (optional)
+            
+        Returns:
+            generator: Encoded text chunks
+        """
+        dates = [
+            date_str for date_str in self.storage.list_attendance_dates()
+            if (start_date is None or date_str >= start_date)
+            and (end_date is None or date_str <= end_date)
+        ]
+        
+        allowed = None
+        if department is not None:
+            allowed = {
+                member.reg_number for member in self.storage.list_members()
+                if self._in_department(member, department)
+            }
+        
+        entries = (
+            entry for entry in self.storage.iter_attendance_matrix(dates, EXPORT_CHUNK_ROWS)
+            if allowed is None or entry[0] in allowed
+        )
+        
+        if export_format == 'ndjson':
+            return _stream_ndjson(
+                {
+                    'reg_number': reg_number,
+                    'full_name': full_name,
+                    'present': sorted(present),
+                    'attended': len(present)
+                }
+                for reg_number, full_name, present in entries
+            )
+        
+        header = ['reg_number', 'full_name'] + dates + ['attended']
+        return _stream_csv(header, (
+            [reg_number, full_name]
+            + ['Present' if date_str in present else '' for date_str in dates]
+            + [len(present)]
+            for reg_number, full_name, present in entries
+        ))
+
+
+# Singleton instance
+_export_service = None
+_export_service_lock = threading.Lock()
+
+
+def get_export_service():
+    """
+    Get singleton instance of ExportService.
+    
+    Returns:
+        ExportService: Service instance
+    """
+    global _export_service
+    if _export_service is None:
+        # Services are created on first request, possibly from several threads at once
+        with _export_service_lock:
+            if _export_service is None:
+                _export_service = ExportService()
+    return _export_service
@@ -0,0 +1,438 @@
+"""In-memory stand-in for a gspread spreadsheet, for offline load testing."""
+
+import json
+import random
+import threading
+import time
+from collections import Counter, deque
+import gspread
+from gspread.utils import a1_range_to_grid_range, numericise_all
+from config.settings import (
+    MEMBERS_SHEET,
+    ATTENDANCE_SHEET,
+    REPORTS_SHEET,
+    FAKE_SHEETS_LATENCY_MS,
+    FAKE_SHEETS_JITTER_MS,
+    FAKE_SHEETS_READ_QUOTA_PER_MINUTE,
+    FAKE_SHEETS_WRITE_QUOTA_PER_MINUTE
+)
+
+MEMBER_HEADERS = [
+    'Reg Number',
+    'Full Name',
+    'Email',
+    'Phone',
+    'Gender',
+    'Year of Study',
+    'Course',
+    'Departments',
+    'Active',
+    'Role',
+    'Registration Date'
+]
+
+ATTENDANCE_HEADERS = ['Reg Number', 'Full Name']
+
+
+class FakeResponse:
+    """Minimal HTTP response, shaped like what gspread.exceptions.APIError expects."""
+    
+    def __init__(self, status_code, message, status):
+        """
+        Initialize response.
+        
+        Args:
+            status_code: HTTP status code
+            message: Error message
+            status: Google API status string
+        """
+        self.status_code = status_code
+        self._body = {
+            'error': {
+                'code': status_code,
+                'message': message,
+                'status': status
+            }
+        }
+        self.text = json.dumps(self._body)
+    
+    def json(self):
+        """Return the decoded response body."""
+        return self._body
+
+
+class FakeCell:
+    """Cell returned by FakeWorksheet.cell."""
+    
+    def __init__(self, row, col, value):
+        """Initialize cell."""
+        self.row = row
+        self.col = col
+        self.value = value
+
+
+class QuotaLimiter:
+    """Sliding one-minute request limiter, mirroring the Sheets per-minute quotas."""
+    
+    def __init__(self, read_per_minute, write_per_minute):
+        """
+        Initialize limiter.
+        
+        Args:
+            read_per_minute: Read requests allowed per minute (0 disables)
+            write_per_minute: Write requests allowed per minute (0 disables)
+        """
+        self.limits = {'read': read_per_minute, 'write': write_per_minute}
+        self._calls = {'read': deque(), 'write': deque()}
+        self._lock = threading.Lock()
+    
+    def acquire(self, kind):
+        """
+        Record a request, or raise a 429 APIError if over quota.
+        
+        Args:
+            kind: 'read' or 'write'
+        """
+        limit = self.limits[kind]
+        if not limit:
+            return
+        
+        now = time.monotonic()
+        with self._lock:
+            calls = self._calls[kind]
+            while calls and now - calls[0] >= 60:
+                calls.popleft()
+            
+            if len(calls) >= limit:
+                raise gspread.exceptions.APIError(FakeResponse(
+                    429,
+                    f"Quota exceeded for quota metric '{kind.title()} requests' "
+                    f"and limit '{kind.title()} requests per minute per user'",
+                    'RESOURCE_EXHAUSTED'
+                ))
+            
+            calls.append(now)
+
+
+class FakeSpreadsheet:
+    """In-memory spreadsheet with simulated latency and quotas."""
+    
+    def __init__(self, latency_ms=FAKE_SHEETS_LATENCY_MS, jitter_ms=FAKE_SHEETS_JITTER_MS,
+                 read_quota=FAKE_SHEETS_READ_QUOTA_PER_MINUTE,
+                 write_quota=FAKE_SHEETS_WRITE_QUOTA_PER_MINUTE):
+        """
+        Initialize spreadsheet.
+        
+        Args:
+            latency_ms: Base latency added to every API call
+            jitter_ms: Maximum random latency added on top of the base
+            read_quota: Read requests allowed per minute (0 disables)
+            write_quota: Write requests allowed per minute (0 disables)
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.limiter = QuotaLimiter(read_quota, write_quota)
+        self._worksheets = {}
+        self._lock = threading.RLock()
+        self._call_counts = Counter()
+        self._counts_lock = threading.Lock()
+    
+    def _api_call(self, title, method, kind):
+        """
+        Simulate the network side of an API call.
+        
+        Args:
+            title: Worksheet title
+            method: Worksheet method name
+            kind: 'read' or 'write'
+        """
+        with self._counts_lock:
+            self._call_counts[(title, method)] += 1
+        
+        delay_ms = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+        
+        self.limiter.acquire(kind)
+    
+    def add_worksheet(self, title, rows=None):
+        """
+        Add a worksheet.
+        
+        Args:
+            title: Worksheet title
+            rows: Initial rows (list of lists)
+            
+        Returns:
+            FakeWorksheet: The new worksheet
+        """
+        with self._lock:
+            worksheet = FakeWorksheet(self, title, rows or [])
+            self._worksheets[title] = worksheet
+            return worksheet
+    
+    def worksheet(self, title):
+        """
+        Get a worksheet by title.
+        
+        Args:
+            title: Worksheet title
+            
+        Returns:
+            FakeWorksheet: Worksheet
+        """
+        self._api_call(title, 'worksheet', 'read')
+        try:
+            return self._worksheets[title]
+        except KeyError:
+            raise gspread.exceptions.WorksheetNotFound(title)
+    
+    def get_call_counts(self):
+        """
+        Get API call counts.
+        
+        Returns:
+            dict: Call counts keyed by 'worksheet.method'
+        """
+        with self._counts_lock:
+            return {f"{title}.{method}": count for (title, method), count in self._call_counts.items()}
+    
+    def get_total_calls(self):
+        """
+        Get the total number of API calls made.
+        
+        Returns:
+            int: Call count
+        """
+        with self._counts_lock:
+            return sum(self._call_counts.values())
+    
+    def reset_call_counts(self):
+        """Reset API call counts."""
+        with self._counts_lock:
+            self._call_counts.clear()
+
+
+class FakeWorksheet:
+    """In-memory worksheet implementing the gspread calls the services use."""
+    
+    def __init__(self, spreadsheet, title, rows):
+        """
+        Initialize worksheet.
+        
+        Args:
+            spreadsheet: Owning FakeSpreadsheet
+            title: Worksheet title
+            rows: Initial rows (list of lists)
+        """
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self._rows = [[str(value) for value in row] for row in rows]
+        self._lock = spreadsheet._lock
+    
+    def _call(self, method, kind='read'):
+        """Simulate the API call for a worksheet method."""
+        self.spreadsheet._api_call(self.title, method, kind)
+    
+    def _grid_range(self, range_name):
+        """Convert an A1 range to 0-based, end-exclusive row/column bounds."""
+        if '!' in range_name:
+            range_name = range_name.split('!', 1)[1]
+        grid = a1_range_to_grid_range(range_name)
+        
+        start_row = grid.get('startRowIndex', 0)
+        end_row = grid.get('endRowIndex', max(len(self._rows), start_row))
+        start_col = grid.get('startColumnIndex', 0)
+        end_col = grid.get('endColumnIndex', max([len(row) for row in self._rows] + [start_col]))
+        return start_row, end_row, start_col, end_col
+    
+    def _read_range(self, range_name=None):
+        """Read a range, trimming trailing empty rows and cells like the API does."""
+        if range_name is None:
+            start_row, end_row, start_col, end_col = 0, len(self._rows), 0, None
+        else:
+            start_row, end_row, start_col, end_col = self._grid_range(range_name)
+            # The grid ends at the last row, as on a sheet with no spare rows
+            if start_row > 0 and start_row >= len(self._rows):
+                raise gspread.exceptions.APIError(FakeResponse(
+                    400,
+                    f"Range ('{self.title}'!{range_name}) exceeds grid limits. Max rows: {len(self._rows)}",
+                    'INVALID_ARGUMENT'
+                ))
+        
+        values = []
+        for row in self._rows[start_row:end_row]:
+            cells = row[start_col:end_col]
+            while cells and cells[-1] == '':
+                cells.pop()
+            values.append(cells)
+        
+        while values and not values[-1]:
+            values.pop()
+        return values
+    
+    def _set_cell(self, row, col, value):
+        """Set a cell (1-based), growing the grid as needed."""
+        while len(self._rows) < row:
+            self._rows.append([])
+        cells = self._rows[row - 1]
+        while len(cells) < col:
+            cells.append('')
+        cells[col - 1] = '' if value is None else str(value)
+    
+    def _write_range(self, range_name, values):
+        """Write a 2D block of values starting at the range's top-left cell."""
+        start_row, _, start_col, _ = self._grid_range(range_name)
+        for row_offset, row in enumerate(values):
+            for col_offset, value in enumerate(row):
+                self._set_cell(start_row + row_offset + 1, start_col + col_offset + 1, value)
+    
+    @property
+    def row_count(self):
+        """Number of rows in use."""
+        return len(self._rows)
+    
+    def get_all_values(self):
+        """Get all values as a list of lists."""
+        self._call('get_all_values')
+        with self._lock:
+            return self._read_range()
+    
+    def get_all_records(self, **kwargs):
+        """Get all rows after the header as dictionaries keyed by header."""
+        self._call('get_all_records')
+        with self._lock:
+            values = self._read_range()
+        
+        if not values:
+            return []
+        
+        headers = values[0]
+        records = []
+        for row in values[1:]:
+            row = numericise_all(row + [''] * (len(headers) - len(row)), empty2zero=False, default_blank='')
+            records.append(dict(zip(headers, row)))
+        return records
+    
+    def get_values(self, range_name=None, **kwargs):
+        """Get values for an A1 range."""
+        self._call('get_values')
+        with self._lock:
+            return self._read_range(range_name)
+    
+    def batch_get(self, ranges, **kwargs):
+        """Get values for several A1 ranges in one call."""
+        self._call('batch_get')
+        with self._lock:
+            return [self._read_range(range_name) for range_name in ranges]
+    
+    def row_values(self, row, **kwargs):
+        """Get the values of a row (1-based)."""
+        self._call('row_values')
+        with self._lock:
+            if row > len(self._rows):
+                return []
+            cells = list(self._rows[row - 1])
+        while cells and cells[-1] == '':
+            cells.pop()
+        return cells
+    
+    def col_values(self, col, **kwargs):
+        """Get the values of a column (1-based)."""
+        self._call('col_values')
+        with self._lock:
+            values = [row[col - 1] if len(row) >= col else '' for row in self._rows]
+        while values and values[-1] == '':
+            values.pop()
+        return values
+    
+    def cell(self, row, col, **kwargs):
+        """Get a single cell (1-based)."""
+        self._call('cell')
+        with self._lock:
+            value = ''
+            if row <= len(self._rows) and col <= len(self._rows[row - 1]):
+                value = self._rows[row - 1][col - 1]
+        return FakeCell(row, col, value)
+    
+    def update_cell(self, row, col, value):
+        """Update a single cell (1-based)."""
+        self._call('update_cell', 'write')
+        with self._lock:
+            self._set_cell(row, col, value)
+        return {'updatedCells': 1}
+    
+    def update(self, range_name, values=None, **kwargs):
+        """Update a range with a 2D list of values."""
+        self._call('update', 'write')
+        with self._lock:
+            self._write_range(range_name, values or [])
+        return {'updatedRange': f"'{self.title}'!{range_name}"}
+    
+    def batch_update(self, data, **kwargs):
+        """Update several ranges in one call."""
+        self._call('batch_update', 'write')
+        with self._lock:
+            for item in data:
+                self._write_range(item['range'], item['values'])
+        return {'totalUpdatedRanges': len(data)}
+    
+    def _append(self, method, values):
+        """Append rows after the last row in use."""
+        self._call(method, 'write')
+        with self._lock:
+            first_row = len(self._read_range()) + 1
+            for offset, row in enumerate(values):
+                for col_offset, value in enumerate(row):
+                    self._set_cell(first_row + offset, col_offset + 1, value)
+            last_row = first_row + len(values) - 1
+        
+        last_col = gspread.utils.rowcol_to_a1(last_row, max([len(row) for row in values] + [1]))
+        return {
+            'updates': {
+                'updatedRange': f"'{self.title}'!A{first_row}:{last_col}",
+                'updatedRows': len(values)
+            }
+        }
+    
+    def append_rows(self, values, value_input_option='RAW', **kwargs):
+        """Append rows after the last row in use."""
+        return self._append('append_rows', values)
+    
+    def append_row(self, values, value_input_option='RAW', **kwargs):
+        """Append a single row after the last row in use."""
+        return self._append('append_row', [values])
+
+
+def create_fake_spreadsheet(**kwargs):
+    """
+    Create a fake spreadsheet with empty Members, Attendance and Reports sheets.
+    
+    Args:
+        **kwargs: Passed to FakeSpreadsheet
+        
+    Returns:
+        FakeSpreadsheet: Spreadsheet
+    """
+    spreadsheet = FakeSpreadsheet(**kwargs)
+    spreadsheet.add_worksheet(MEMBERS_SHEET, [MEMBER_HEADERS])
+    spreadsheet.add_worksheet(ATTENDANCE_SHEET, [ATTENDANCE_HEADERS])
+    spreadsheet.add_worksheet(REPORTS_SHEET, [])
+    return spreadsheet
+
+
+# Singleton instance
+_fake_spreadsheet = None
+
+
+def get_fake_spreadsheet():
+    """
+    Get singleton instance of FakeSpreadsheet.
+    
+    Returns:
+        FakeSpreadsheet: Spreadsheet instance
+    """
+    global _fake_spreadsheet
+    if _fake_spreadsheet is None:
+        _fake_spreadsheet = create_fake_spreadsheet()
+    return _fake_spreadsheet
@@ -0,0 +1,301 @@
+"""History service for per-member attendance rollups."""
+
+import threading
+import time
+from bisect import bisect_left, insort
+from config.settings import HISTORY_ROLLUP_TTL_SECONDS
+from config.sessions import get_schedule, get_session
+from services.storage import get_storage_backend, StorageBusyError
+from services.member_service import get_member_service
+from utils.session_manager import get_current_datetime
+
+
+class MemberRollup:
+    """
+    Attendance summary for one member.
+    
+    streak is the length of the member's latest run of consecutive
+    sessions attended, and streak_end the index of its last session.
+    """
+    
+    __slots__ = ('dates', 'streak', 'streak_end')
+    
+    def __init__(self):
+        """Initialize an empty rollup."""
+        self.dates = []
+        self.streak = 0
+        self.streak_end = -1
+
+
+def _advance_streak(rollup, position, first_eligible):
+    """
+    Extend a rollup's latest run with an attended session, or start a new run.
+    
+    The run carries on if the previous session was attended, or if every
+    session since the run ended was before the member registered.
+    
+    Args:
+        rollup: MemberRollup
+        position: Index of the attended session, after streak_end
+        first_eligible: Index of the member's first session after registering
+    """
+    if rollup.streak_end == position - 1 or position <= first_eligible:
+        rollup.streak += 1
+    else:
+        rollup.streak = 1
+    rollup.streak_end = position
+
+
+class HistoryService:
+    """
+    Service for member attendance history.
+    
+    Rollups are built from one pass over the attendance matrix, then kept
+    current by record_attendance as marks succeed in this process. They
+    are rebuilt every HISTORY_ROLLUP_TTL_SECONDS to pick up marks made by
+    other workers or edited in the sheet.
+    """
+    
+    def __init__(self):
+        """Initialize history service."""
+        self.storage = get_storage_backend()
+        self.member_service = get_member_service()
+        
+        self._sessions = []  # Session dates, oldest first
+        self._session_index = {}  # date -> index in _sessions
+        self._rollups = None  # reg_number -> MemberRollup
+        self._built_at = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._marks_during_build = None
+    
+    def _scheduled_dates(self, today):
+        """Dates with attendance recorded, plus scheduled sessions up to today."""
+        dates = set(self.storage.list_attendance_dates())
+        dates.update(get_schedule().dates_through(today))
+        return sorted(dates)
+    
+    def _first_eligible(self, registration_date):
+        """Index of the first session on or after the registration date."""
+        return bisect_left(self._sessions, str(registration_date or '')[:10])
+    
+    def _replay_streak(self, rollup, first_eligible):
+        """Recount a rollup's latest run from all of its dates."""
+        rollup.streak = 0
+        rollup.streak_end = -1
+        for date_str in rollup.dates:
+            _advance_streak(rollup, self._session_index[date_str], first_eligible)
+    
+    def _build(self):
+        """Build rollups for every member from the attendance matrix."""
+        today = get_current_datetime().strftime('%Y-%m-%d')
+        sessions = self._scheduled_dates(today)
+        session_index = {date_str: index for index, date_str in enumerate(sessions)}
+        registered = {
+            member.reg_number: str(member.registration_date or '')[:10]
+            for member in self.storage.list_members()
+        }
+        
+        rollups = {}
+        for reg_number, _, present in self.storage.iter_attendance_matrix(sessions):
+            rollup = MemberRollup()
+            rollup.dates = sorted(present)
+            first_eligible = bisect_left(sessions, registered.get(reg_number, ''))
+            for date_str in rollup.dates:
+                _advance_streak(rollup, session_index[date_str], first_eligible)
+            rollups[reg_number] = rollup
+        
+        return sessions, session_index, rollups
+    
+    def _ensure_rollups(self):
+        """
+        Build rollups on first use and rebuild them once expired.
+        
+        While an expired copy is rebuilt, other requests keep reading it;
+        marks recorded during the build are replayed onto the new copy.
+        """
+        expired = (
+            self._built_at is None
+            or time.monotonic() - self._built_at >= HISTORY_ROLLUP_TTL_SECONDS
+        )
+        if not expired:
+            return
+        
+        # Only the first build makes callers wait
+        if not self._build_lock.acquire(blocking=self._rollups is None):
+            return
+        try:
+            if self._built_at is not None and time.monotonic() - self._built_at < HISTORY_ROLLUP_TTL_SECONDS:
+                return
+            
+            with self._lock:
+                self._marks_during_build = []
+            try:
+                sessions, session_index, rollups = self._build()
+            except Exception:
+                with self._lock:
+                    self._marks_during_build = None
+                raise
+            
+            with self._lock:
+                marks = self._marks_during_build
+                self._marks_during_build = None
+                self._sessions = sessions
+                self._session_index = session_index
+                self._rollups = rollups
+                self._built_at = time.monotonic()
+            
+            for reg_number, date_str, registration_date in marks:
+                self.record_attendance(reg_number, date_str, registration_date)
+        finally:
+            self._build_lock.release()
+    
+    def _add_session(self, date_str):
+        """
+        Add a session date that was not known when the rollups were built.
+        
+        Returns:
+            bool: True if added; False if it falls before the latest known
+            session, in which case the rollups are rebuilt on next read
+        """
+        if self._sessions and date_str < self._sessions[-1]:
+            self._built_at = None
+            return False
+        
+        self._session_index[date_str] = len(self._sessions)
+        self._sessions.append(date_str)
+        return True
+    
+    def _add_scheduled_sessions(self, today):
+        """Add scheduled sessions that have started since the last build."""
+        with self._lock:
+            last = self._sessions[-1] if self._sessions else ''
+            for date_str in get_schedule().dates_through(today):
+                if date_str > last:
+                    self._add_session(date_str)
+    
+    def record_attendance(self, reg_number, date_str, registration_date=None):
+        """
+        Apply a successful mark to the rollups.
+        
+        Args:
+            reg_number: Member registration number
+            date_str: Session date (YYYY-MM-DD)
+            registration_date: Member registration date, for streaks
+        """
+        with self._lock:
+            if self._marks_during_build is not None:
+                self._marks_during_build.append((reg_number, date_str, registration_date))
+            if self._rollups is None:
+                return
+            
+            if date_str not in self._session_index and not self._add_session(date_str):
+                return
+            
+            rollup = self._rollups.get(reg_number)
+            if rollup is None:
+                rollup = self._rollups[reg_number] = MemberRollup()
+            if date_str in rollup.dates:
+                return
+            
+            insort(rollup.dates, date_str)
+            position = self._session_index[date_str]
+            first_eligible = self._first_eligible(registration_date)
+            if position > rollup.streak_end:
+                _advance_streak(rollup, position, first_eligible)
+            else:
+                # An older session, e.g. from a bulk list: recount the run
+                self._replay_streak(rollup, first_eligible)
+    
+    def get_member_history(self, reg_number):
+        """
+        Get a member's attendance history.
+        
+        Args:
+            reg_number: Normalized registration number
+            
+        Returns:
+            tuple: (success, error_or_data)
+        """
+        try:
+            member = self.member_service.get_member_info(reg_number)
+            if not member:
+                return False, {
+                    'code': 'MEMBER_NOT_FOUND',
+                    'message': 'Member not found',
+                    'details': 'Registration number not in database. Please register first.'
+                }
+            self._ensure_rollups()
+        except StorageBusyError as e:
+            return False, {'code': 'SERVICE_BUSY', 'message': 'Too many requests, please try again shortly', 'details': str(e)}
+        except Exception as e:
+            return False, {'code': 'SHEETS_API_ERROR', 'message': str(e)}
+        
+        today = get_current_datetime().strftime('%Y-%m-%d')
+        if not self._sessions or self._sessions[-1] < today:
+            self._add_scheduled_sessions(today)
+        
+        with self._lock:
+            sessions = self._sessions
+            rollup = self._rollups.get(reg_number) or MemberRollup()
+            dates = list(rollup.dates)
+            streak = rollup.streak
+            streak_end = rollup.streak_end
+            last = len(sessions) - 1
+        
+        attended_today = bool(dates) and dates[-1] == today
+        first_eligible = self._first_eligible(member.registration_date)
+        held = bisect_left(sessions, today)  # Sessions before today
+        
+        # Today's session only counts once the member has attended it
+        expected = max(held - first_eligible, 0) + (1 if attended_today else 0)
+        expected += bisect_left(dates, sessions[first_eligible]) if first_eligible <= last else len(dates)
+        
+        # The run is current if it reaches the latest session that has closed
+        last_closed = last if attended_today or last < 0 or sessions[last] < today else last - 1
+        current_streak = streak if streak_end >= last_closed and streak_end >= 0 else 0
+        
+        attended = set(dates)
+        start = min(first_eligible, bisect_left(sessions, dates[0])) if dates else first_eligible
+        # Like expected, leave out today's session until the member has attended it
+        end = last if last >= 0 and sessions[last] == today and not attended_today else last + 1
+        history = [
+            {
+                'date': date_str,
+                'department': (get_session(date_str) or {}).get('department'),
+                'present': date_str in attended
+            }
+            for date_str in sessions[start:end]
+        ]
+        
+        return True, {
+            'reg_number': member.reg_number,
+            'full_name': member.full_name,
+            'attended': len(dates),
+            'expected': expected,
+            'rate': round(len(dates) / expected, 4) if expected else 0.0,
+            'current_streak': current_streak,
+            'last_attended': dates[-1] if dates else None,
+            'history': history
+        }
+
+
+# Singleton instance
+_history_service = None
+_history_service_lock = threading.Lock()
+
+
+def get_history_service():
+    """
+    Get singleton instance of HistoryService.
+    
+    Returns:
+        HistoryService: Service instance
+    """
+    global _history_service
+    if _history_service is None:
+        # Services are created on first request, possibly from several threads at once
+        with _history_service_lock:
+            if _history_service is None:
+                _history_service = HistoryService()
+    return _history_service
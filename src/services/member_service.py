@@ -1,8 +1,16 @@
 """Member service for member-related operations."""
 
-from services.sheets_service import get_sheets_service
+import threading
+from services.storage import (
+    get_storage_backend,
+    DuplicateMemberError,
+    StorageBusyError
+)
+from config.settings import MAX_IMPORT_ROWS
 from utils.validators import validate_member_data
 from utils.helpers import format_departments
+from utils.metrics import counts_results
+from utils.tracing import span, traced
 
 
 class MemberService:
@@ -10,7 +18,7 @@ class MemberService:
     
     def __init__(self):
         """Initialize member service."""
-        self.sheets = get_sheets_service()
+        self.storage = get_storage_backend()
     
     def check_member_exists(self, reg_number):
         """
@@ -22,7 +30,7 @@ class MemberService:
         Returns:
             bool: True if exists, False otherwise
         """
-        member = self.sheets.get_member(reg_number)
+        member = self.storage.get_member(reg_number)
         return member is not None
     
     def get_member_info(self, reg_number):
@@ -33,9 +41,9 @@ class MemberService:
             reg_number: Registration number
             
         Returns:
-            dict: Member information or None
+            Member: Member record or None
         """
-        return self.sheets.get_member(reg_number)
+        return self.storage.get_member(reg_number)
     
     def is_member_active(self, reg_number):
         """
@@ -47,8 +55,10 @@ class MemberService:
         Returns:
             bool: True if active
         """
-        return self.sheets.is_member_active(reg_number)
+        return self.storage.is_member_active(reg_number)
     
+    @counts_results('register_member')
+    @traced('register_member')
     def register_member(self, member_data):
         """
         Register a new member.
@@ -60,33 +70,151 @@ class MemberService:
             tuple: (success, error_or_data)
         """
         # Validate data and get normalized version
-        is_valid, errors, normalized_data = validate_member_data(member_data)
+        with span('register_member.validate'):
+            is_valid, errors, normalized_data = validate_member_data(member_data)
         if not is_valid:
             return False, {'code': 'VALIDATION_ERROR', 'message': 'Invalid input data', 'details': errors}
         
-        # Use normalized data (with leading zeros removed)
-        # Check if already exists
-        if self.check_member_exists(normalized_data['reg_number']):
-            return False, {'code': 'DUPLICATE_REGISTRATION', 'message': 'Registration number already exists'}
-        
         # Format departments
         normalized_data['departments'] = format_departments(normalized_data['departments'])
         
-        # Add to database
         try:
-            self.sheets.add_member(normalized_data)
+            # Use normalized data (with leading zeros removed)
+            # Check if already exists
+            with span('register_member.check_exists'):
+                exists = self.check_member_exists(normalized_data['reg_number'])
+            if exists:
+                return False, {'code': 'DUPLICATE_REGISTRATION', 'message': 'Registration number already exists'}
+            
+            # Add to database
+            with span('register_member.add_member'):
+                self.storage.add_member(normalized_data)
             
             return True, {
                 'reg_number': normalized_data['reg_number'],
                 'full_name': normalized_data['full_name'],
                 'message': 'Registration successful'
             }
+        except DuplicateMemberError:
+            return False, {'code': 'DUPLICATE_REGISTRATION', 'message': 'Registration number already exists'}
+        except StorageBusyError as e:
+            return False, {'code': 'SERVICE_BUSY', 'message': 'Too many requests, please try again shortly', 'details': str(e)}
+        except Exception as e:
+            return False, {'code': 'SHEETS_API_ERROR', 'message': str(e)}
+    
+    @counts_results('import_members')
+    def import_members(self, rows, dry_run=False):
+        """
+        Register many members at once.
+        
+        Every row is validated like a single registration. Rows that fail
+        validation, repeat an earlier row's registration number or match an
+        existing member are reported and skipped; the rest are written with
+        a single storage call.
+        
+        Args:
+            rows: List of (line_number, member_data) tuples
+            dry_run: Validate and report without writing
+            
+        Returns:
+            tuple: (success, error_or_report)
+        """
+        if len(rows) > MAX_IMPORT_ROWS:
+            return False, {
+                'code': 'TOO_MANY_ROWS',
+                'message': f'At most {MAX_IMPORT_ROWS} rows can be imported at once',
+                'details': f'File has {len(rows)} rows'
+            }
+        
+        errors = []
+        accepted = []
+        first_lines = {}
+        
+        try:
+            for line_number, member_data in rows:
+                is_valid, field_errors, normalized_data = validate_member_data(member_data)
+                if not is_valid:
+                    errors.append(_import_error(
+                        line_number, member_data.get('reg_number'),
+                        'VALIDATION_ERROR', 'Invalid input data', field_errors
+                    ))
+                    continue
+                
+                reg_number = normalized_data['reg_number']
+                if reg_number in first_lines:
+                    errors.append(_import_error(
+                        line_number, reg_number,
+                        'DUPLICATE_IN_FILE', f'Same registration number as line {first_lines[reg_number]}'
+                    ))
+                    continue
+                first_lines[reg_number] = line_number
+                
+                if self.check_member_exists(reg_number):
+                    errors.append(_import_error(
+                        line_number, reg_number,
+                        'DUPLICATE_REGISTRATION', 'Registration number already exists'
+                    ))
+                    continue
+                
+                normalized_data['departments'] = format_departments(normalized_data['departments'])
+                normalized_data['year_of_study'] = int(normalized_data['year_of_study'])
+                accepted.append((line_number, normalized_data))
+            
+            skipped = set()
+            if accepted and not dry_run:
+                skipped = set(self.storage.add_members([data for _, data in accepted]))
+        except StorageBusyError as e:
+            return False, {'code': 'SERVICE_BUSY', 'message': 'Too many requests, please try again shortly', 'details': str(e)}
         except Exception as e:
             return False, {'code': 'SHEETS_API_ERROR', 'message': str(e)}
+        
+        # Registered by someone else between the check and the write
+        for line_number, data in accepted:
+            if data['reg_number'] in skipped:
+                errors.append(_import_error(
+                    line_number, data['reg_number'],
+                    'DUPLICATE_REGISTRATION', 'Registration number already exists'
+                ))
+        errors.sort(key=lambda error: error['line'])
+        
+        return True, {
+            'total_rows': len(rows),
+            'accepted': len(accepted) - len(skipped),
+            'imported': 0 if dry_run else len(accepted) - len(skipped),
+            'rejected': len(errors),
+            'dry_run': dry_run,
+            'errors': errors
+        }
+
+
+def _import_error(line_number, reg_number, code, message, details=None):
+    """
+    Build a per-row import error.
+    
+    Args:
+        line_number: CSV line of the row
+        reg_number: Registration number as given (may be None)
+        code: Error code
+        message: Error message
+        details: Field errors (optional)
+        
+    Returns:
+        dict: Row error
+    """
+    error = {
+        'line': line_number,
+        'reg_number': reg_number,
+        'code': code,
+        'message': message
+    }
+    if details:
+        error['details'] = details
+    return error
 
 
 # Singleton instance
 _member_service = None
+_member_service_lock = threading.Lock()
 
 
 def get_member_service():
@@ -98,5 +226,8 @@ def get_member_service():
     """
     global _member_service
     if _member_service is None:
-        _member_service = MemberService()
+        # Services are created on first request, possibly from several threads at once
+        with _member_service_lock:
+            if _member_service is None:
+                _member_service = MemberService()
     return _member_service
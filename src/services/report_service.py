@@ -0,0 +1,270 @@
+"""Report service for publishing attendance aggregates to the Reports sheet."""
+
+import json
+import logging
+import os
+import threading
+import time
+from config.settings import (
+    REPORTS_CHECK_INTERVAL_SECONDS,
+    REPORTS_RETRY_MAX_SECONDS,
+    REPORTS_STATE_FILE
+)
+from services.storage import get_storage_backend, StorageBusyError
+from utils.session_manager import get_current_datetime, get_last_closed_window
+
+logger = logging.getLogger(__name__)
+
+SESSION_HEADERS = ['Date', 'Department', 'Description', 'Attended', 'Expected', 'Turnout %']
+DEPARTMENT_HEADERS = ['Department', 'Members', 'Sessions', 'Attended', 'Turnout %', 'Member Turnout %']
+
+
+def _percent(rate):
+    """
+    Convert a 0-1 rate to a percentage with one decimal.
+    
+    Whole percentages are returned as int, so the value reads back from
+    the sheet as the same text it was written with.
+    """
+    percent = round(rate * 100, 1)
+    return int(percent) if percent.is_integer() else percent
+
+
+def _changed_cells(current, report):
+    """
+    Compare the published report with a new one.
+    
+    Args:
+        current: Rows read from the report, as strings
+        report: New report rows
+        
+    Returns:
+        list: (row, col, value) for every cell that differs, including
+        cells to clear where the new report is smaller
+    """
+    cells = []
+    for row in range(max(len(current), len(report))):
+        old = current[row] if row < len(current) else []
+        new = report[row] if row < len(report) else []
+        for col in range(max(len(old), len(new))):
+            value = new[col] if col < len(new) else ''
+            if str(value) != (old[col] if col < len(old) else ''):
+                cells.append((row + 1, col + 1, value))
+    return cells
+
+
+def get_published_window(path=REPORTS_STATE_FILE):
+    """
+    Get the last attendance window the report was published after.
+    
+    Args:
+        path: Report state file
+        
+    Returns:
+        str: Session date (YYYY-MM-DD), or None if never recorded
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f).get('window')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def record_published_window(date_str, path=REPORTS_STATE_FILE):
+    """
+    Record that the report was published after a window closed.
+    
+    Args:
+        date_str: Session date of the window (YYYY-MM-DD)
+        path: Report state file
+    """
+    path = str(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({'window': date_str, 'published_at': get_current_datetime().isoformat()}, f)
+    os.replace(temp_path, path)
+
+
+class ReportService:
+    """
+    Service for the published attendance report.
+    
+    Aggregates are computed in Python from the analytics matrix rather
+    than with sheet formulas over the attendance matrix, and written
+    with one storage call covering only the cells that changed.
+    """
+    
+    def __init__(self):
+        """Initialize report service."""
+        # numpy is slow to import, so analytics is only loaded with the report service
+        from services.analytics_service import get_analytics_service
+        
+        self.storage = get_storage_backend()
+        self.analytics = get_analytics_service()
+    
+    def build_report(self):
+        """
+        Lay out the session and department aggregates as report rows.
+        
+        Returns:
+            list: Rows of cell values
+        """
+        sessions = self.analytics.session_report()
+        departments = self.analytics.department_report()
+        
+        rows = [['Session Turnout'], SESSION_HEADERS]
+        for session in sessions['sessions']:
+            rows.append([
+                session['date'],
+                session['department'] or '',
+                session['description'] or '',
+                session['attended'],
+                session['expected'],
+                _percent(session['turnout'])
+            ])
+        
+        rows += [[], ['Department Turnout'], DEPARTMENT_HEADERS]
+        for department in departments['departments']:
+            rows.append([
+                department['department'],
+                department['members'],
+                department['sessions'],
+                department['attended'],
+                _percent(department['turnout']),
+                _percent(department['member_turnout'])
+            ])
+        
+        return rows
+    
+    def materialize(self):
+        """
+        Recompute the report from fresh attendance data and publish it.
+        
+        The published report is read first, so a missing Reports sheet
+        fails before the attendance data is reloaded.
+        
+        Returns:
+            tuple: (success, error_or_data)
+        """
+        try:
+            current = self.storage.get_report_values()
+            self.analytics.get_matrix(refresh=True)
+            report = self.build_report()
+            cells = _changed_cells(current, report)
+            self.storage.update_report_cells(cells)
+        except StorageBusyError as e:
+            return False, {'code': 'SERVICE_BUSY', 'message': 'Too many requests, please try again shortly', 'details': str(e)}
+        except Exception as e:
+            return False, {'code': 'SHEETS_API_ERROR', 'message': str(e)}
+        
+        return True, {
+            'rows': len(report),
+            'cells_written': len(cells)
+        }
+
+
+class ReportScheduler:
+    """
+    Background thread that publishes the report after each attendance window.
+    
+    The report is due when the last closed window is later than the one
+    recorded by record_published_window, so a restart after a window
+    closes still publishes it. Failures are retried with exponential
+    backoff, up to REPORTS_RETRY_MAX_SECONDS apart.
+    """
+    
+    def __init__(self, interval=REPORTS_CHECK_INTERVAL_SECONDS):
+        """
+        Initialize scheduler.
+        
+        Args:
+            interval: Seconds between window checks
+        """
+        self.interval = interval
+        self._failures = 0
+        self._retry_at = 0.0
+        self._stopping = threading.Event()
+        self._thread = None
+    
+    def check(self, current_datetime=None):
+        """
+        Materialize the report if a window has closed since it was last published.
+        
+        Args:
+            current_datetime: datetime to check (default: now)
+            
+        Returns:
+            bool: True if the report was published
+        """
+        window = get_last_closed_window(current_datetime)
+        if window is None or time.monotonic() < self._retry_at:
+            return False
+        
+        published = get_published_window()
+        if published is not None and published >= window.date_str:
+            return False
+        
+        success, result = get_report_service().materialize()
+        if not success:
+            self._failures += 1
+            delay = min(self.interval * 2 ** self._failures, REPORTS_RETRY_MAX_SECONDS)
+            self._retry_at = time.monotonic() + delay
+            logger.warning(
+                "Report materialization failed: %s %s; retrying in %d s",
+                result['code'], result['message'], delay
+            )
+            return False
+        
+        self._failures = 0
+        self._retry_at = 0.0
+        record_published_window(window.date_str)
+        logger.info("Report published for %s: %d cells written", window.date_str, result['cells_written'])
+        return True
+    
+    def _run(self):
+        """Check the window every interval until stopped."""
+        while not self._stopping.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Report scheduler check failed")
+    
+    def start(self):
+        """Start the background thread."""
+        if self._thread is not None:
+            return
+        
+        self._thread = threading.Thread(target=self._run, name='report-scheduler', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the background thread."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+# Singleton instance
+_report_service = None
+_report_service_lock = threading.Lock()
+
+
+def get_report_service():
+    """
+    Get singleton instance of ReportService.
+    
+    Returns:
+        ReportService: Service instance
+    """
+    global _report_service
+    if _report_service is None:
+        # Services are created on first request, possibly from several threads at once
+        with _report_service_lock:
+            if _report_service is None:
+                _report_service = ReportService()
+    return _report_service
@@ -0,0 +1,301 @@
+"""Quota-aware wrapper around gspread worksheet calls."""
+
+import random
+import threading
+import time
+from config.settings import (
+    SHEETS_READ_REQUESTS_PER_MINUTE,
+    SHEETS_WRITE_REQUESTS_PER_MINUTE,
+    SHEETS_QUOTA_WAIT_SECONDS,
+    SHEETS_MAX_RETRIES,
+    SHEETS_BACKOFF_BASE_SECONDS,
+    SHEETS_BACKOFF_MAX_SECONDS
+)
+from services.storage import StorageBusyError
+from utils.metrics import record_sheets_call
+from utils.tracing import count_sheets_call, span
+
+READ_METHODS = frozenset([
+    'get_all_records',
+    'get_all_values',
+    'get_values',
+    'batch_get',
+    'row_values',
+    'col_values',
+    'cell',
+    'acell',
+    'find',
+    'findall'
+])
+
+WRITE_METHODS = frozenset([
+    'update',
+    'update_cell',
+    'update_cells',
+    'update_acell',
+    'batch_update',
+    'append_row',
+    'append_rows',
+    'insert_row',
+    'insert_rows',
+    'delete_rows',
+    'clear'
+])
+
+# Writes that add or remove rows. A failed attempt may still have been
+# applied, and repeating it would apply it twice, so these are only retried
+# when the request was rejected for quota.
+NON_IDEMPOTENT_METHODS = frozenset([
+    'append_row',
+    'append_rows',
+    'insert_row',
+    'insert_rows',
+    'delete_rows'
+])
+
+RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+
+class SheetsError(Exception):
+    """Base class for Google Sheets API errors."""
+    
+    def __init__(self, message, status_code=None):
+        """
+        Initialize error.
+        
+        Args:
+            message: Error message
+            status_code: HTTP status code, if the API returned one
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class SheetsRetryableError(SheetsError, StorageBusyError):
+    """Transient error (5xx or network) that persisted through all retries."""
+
+
+class SheetsQuotaError(SheetsRetryableError):
+    """Request quota exhausted (HTTP 429 or client-side quota wait timed out)."""
+
+
+class SheetsFatalError(SheetsError):
+    """Non-retryable client error (4xx)."""
+
+
+class SheetsNotFoundError(SheetsFatalError):
+    """Spreadsheet, worksheet or range not found."""
+
+
+def classify_error(error):
+    """
+    Convert an exception raised by gspread into a typed SheetsError.
+    
+    Args:
+        error: Exception raised by a worksheet call
+        
+    Returns:
+        SheetsError: Typed error, or None if the error is not an API or
+        network error and should propagate unchanged
+    """
+    import gspread
+    import requests
+    
+    if isinstance(error, SheetsError):
+        return error
+    
+    if isinstance(error, (gspread.exceptions.WorksheetNotFound, gspread.exceptions.SpreadsheetNotFound)):
+        return SheetsNotFoundError(f"Not found: {error}", 404)
+    
+    if isinstance(error, gspread.exceptions.APIError):
+        status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+        message = f"Sheets API error {status_code}: {error}"
+        if status_code == 429:
+            return SheetsQuotaError(message, status_code)
+        if status_code in RETRYABLE_STATUS_CODES:
+            return SheetsRetryableError(message, status_code)
+        if status_code == 404:
+            return SheetsNotFoundError(message, status_code)
+        return SheetsFatalError(message, status_code)
+    
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return SheetsRetryableError(f"Network error: {error}")
+    
+    return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    
+    Holds up to capacity tokens and refills continuously so that no
+    sliding one-minute window can see more than per_minute acquisitions.
+    """
+    
+    def __init__(self, per_minute, capacity=None):
+        """
+        Initialize bucket.
+        
+        Args:
+            per_minute: Requests allowed per minute
+            capacity: Burst size (default: a tenth of the per-minute quota)
+        """
+        self.capacity = capacity or max(1, per_minute // 10)
+        self.refill_per_second = max(per_minute - self.capacity, 1) / 60.0
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now):
+        """Add tokens earned since the last update."""
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+        self._updated_at = now
+    
+    def acquire(self, timeout=None):
+        """
+        Take one token, waiting for a refill if necessary.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            bool: True if a token was taken, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.refill_per_second
+            
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class QuotaAwareWorksheet:
+    """
+    Proxy for a gspread worksheet that rate-limits, retries and types errors.
+    
+    Read and write methods take a token from the matching bucket before
+    each attempt. Retryable failures (429, 5xx, network) are retried with
+    jittered exponential backoff, except that row appends, inserts and
+    deletes are only retried after a 429; anything else is raised
+    immediately as a SheetsError subclass.
+    """
+    
+    def __init__(self, worksheet, read_bucket, write_bucket):
+        """
+        Initialize proxy.
+        
+        Args:
+            worksheet: gspread Worksheet (or compatible) to wrap
+            read_bucket: TokenBucket for read requests
+            write_bucket: TokenBucket for write requests
+        """
+        self._worksheet = worksheet
+        self._title = getattr(worksheet, 'title', '')
+        self._read_bucket = read_bucket
+        self._write_bucket = write_bucket
+    
+    def __getattr__(self, name):
+        """Wrap API methods; pass other attributes through."""
+        attribute = getattr(self._worksheet, name)
+        if name in READ_METHODS:
+            return self._wrap(attribute, name, self._read_bucket)
+        if name in WRITE_METHODS:
+            return self._wrap(attribute, name, self._write_bucket)
+        return attribute
+    
+    def _wrap(self, method, name, bucket):
+        """Build the rate-limited, retrying version of a worksheet method."""
+        def call(*args, **kwargs):
+            return self._call(method, name, bucket, args, kwargs)
+        return call
+    
+    def _call(self, method, name, bucket, args, kwargs):
+        """
+        Call a worksheet method under the quota and retry policy.
+        
+        The whole call, including quota waits and retries, is one span.
+        
+        Raises:
+            SheetsError: Typed error once retries are exhausted or on fatal errors
+        """
+        with span(f"sheets.{self._title}.{name}"):
+            return self._call_with_retries(method, name, bucket, args, kwargs)
+    
+    def _call_with_retries(self, method, name, bucket, args, kwargs):
+        """Make attempts at a worksheet call until one succeeds or fails for good."""
+        attempt = 0
+        while True:
+            if not bucket.acquire(timeout=SHEETS_QUOTA_WAIT_SECONDS):
+                raise SheetsQuotaError(
+                    f"Timed out after {SHEETS_QUOTA_WAIT_SECONDS}s waiting for Sheets quota ({name})"
+                )
+            
+            count_sheets_call()
+            started = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            except Exception as e:
+                error = classify_error(e)
+                retryable = isinstance(error, SheetsRetryableError)
+                record_sheets_call(self._title, name, 'retryable' if retryable else 'error', time.perf_counter() - started)
+                if error is None:
+                    raise
+                
+                if not retryable or attempt >= SHEETS_MAX_RETRIES:
+                    raise error from e
+                if name in NON_IDEMPOTENT_METHODS and not isinstance(error, SheetsQuotaError):
+                    raise error from e
+            else:
+                record_sheets_call(self._title, name, 'ok', time.perf_counter() - started)
+                return result
+            
+            # Full jitter: sleep a random time up to the exponential cap
+            backoff = min(SHEETS_BACKOFF_MAX_SECONDS, SHEETS_BACKOFF_BASE_SECONDS * (2 ** attempt))
+            time.sleep(random.uniform(0, backoff))
+            attempt += 1
+
+
+# Shared buckets, so every worksheet in the process draws from the same quota
+_read_bucket = None
+_write_bucket = None
+_buckets_lock = threading.Lock()
+
+
+def get_quota_buckets():
+    """
+    Get the process-wide read and write token buckets.
+    
+    Returns:
+        tuple: (read_bucket, write_bucket)
+    """
+    global _read_bucket, _write_bucket
+    with _buckets_lock:
+        if _read_bucket is None:
+            _read_bucket = TokenBucket(SHEETS_READ_REQUESTS_PER_MINUTE)
+            _write_bucket = TokenBucket(SHEETS_WRITE_REQUESTS_PER_MINUTE)
+    return _read_bucket, _write_bucket
+
+
+def wrap_worksheet(worksheet):
+    """
+    Wrap a worksheet with the shared quota buckets.
+    
+    Args:
+        worksheet: gspread Worksheet (or compatible)
+        
+    Returns:
+        QuotaAwareWorksheet: Wrapped worksheet
+    """
+    read_bucket, write_bucket = get_quota_buckets()
+    return QuotaAwareWorksheet(worksheet, read_bucket, write_bucket)
@@ -0,0 +1,301 @@
+"""Pool of authorized Google Sheets clients shared by request threads."""
+
+import copy
+import threading
+import time
+from datetime import datetime, timezone
+from config.settings import (
+    GOOGLE_CREDENTIALS,
+    SPREADSHEET_ID,
+    SHEETS_CLIENT_POOL_SIZE,
+    SHEETS_CLIENT_CHECKOUT_TIMEOUT_SECONDS,
+    SHEETS_TOKEN_REFRESH_MARGIN_SECONDS
+)
+from services.sheets_client import SheetsRetryableError
+
+SCOPES = [
+    'https://spreadsheets.google.com/feeds',
+    'https://www.googleapis.com/auth/drive'
+]
+
+
+class PooledClient:
+    """
+    One authorized gspread client and its worksheet handles.
+    
+    Each client owns a requests session (gspread's AuthorizedSession), so
+    connections to the API are kept alive between operations.
+    """
+    
+    def __init__(self, client, worksheets):
+        """
+        Initialize pooled client.
+        
+        Args:
+            client: gspread Client, or None for the fake spreadsheet
+            worksheets: Dictionary of worksheet title to worksheet
+        """
+        self.client = client
+        self.worksheets = worksheets
+    
+    def seconds_until_expiry(self):
+        """
+        Get the remaining lifetime of the access token.
+        
+        Returns:
+            float: Seconds until expiry, 0 if there is no token yet, or
+            None if the client has no expiring credentials
+        """
+        credentials = getattr(self.client, 'auth', None)
+        if credentials is None:
+            return None
+        if not credentials.token or credentials.expiry is None:
+            return 0
+        
+        # google-auth stores expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (credentials.expiry - now).total_seconds()
+    
+    def open_worksheet(self, title):
+        """
+        Open another worksheet of the spreadsheet on this client.
+        
+        Args:
+            title: Worksheet title
+            
+        Returns:
+            Worksheet: The worksheet, also kept in worksheets
+        """
+        spreadsheet = next(iter(self.worksheets.values())).spreadsheet
+        worksheet = spreadsheet.worksheet(title)
+        self.worksheets[title] = worksheet
+        return worksheet
+    
+    def refresh_token(self):
+        """Fetch a new access token over this client's session."""
+        from google.auth.transport.requests import Request
+        
+        self.client.auth.refresh(Request(self.client.session))
+
+
+class SheetsClientPool:
+    """
+    Bounded, thread-safe pool of authorized clients.
+    
+    Operations check out a client, make one API call and return it, so
+    concurrent requests overlap their round trips on separate sessions
+    instead of sharing one. Clients are created on demand up to size;
+    when all are busy, callers wait for one to be returned. Tokens close
+    to expiry are refreshed at checkout, before the API call that would
+    otherwise stall on the refresh.
+    """
+    
+    def __init__(self, factory, size=SHEETS_CLIENT_POOL_SIZE,
+                 checkout_timeout=SHEETS_CLIENT_CHECKOUT_TIMEOUT_SECONDS,
+                 refresh_margin=SHEETS_TOKEN_REFRESH_MARGIN_SECONDS):
+        """
+        Initialize pool and create the first client.
+        
+        Args:
+            factory: Callable taking the first PooledClient (None when
+                creating it) and returning a new PooledClient
+            size: Maximum number of clients
+            checkout_timeout: Seconds to wait for a free client
+            refresh_margin: Refresh tokens expiring within this many seconds
+        """
+        self._factory = factory
+        self.size = max(1, size)
+        self.checkout_timeout = checkout_timeout
+        self.refresh_margin = refresh_margin
+        self._condition = threading.Condition()
+        self._idle = []
+        self._checkouts = 0
+        self._waits = 0
+        self._refreshes = 0
+        
+        # Created eagerly so connection errors surface at startup
+        self.template = factory(None)
+        self._idle.append(self.template)
+        self._created = 1
+    
+    def _acquire(self):
+        """Take an idle client, reserve a slot for a new one, or wait."""
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._condition:
+            self._checkouts += 1
+            waited = False
+            while True:
+                if self._idle:
+                    # Most recently used first, so its connection is still open
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    return None
+                
+                if not waited:
+                    self._waits += 1
+                    waited = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise SheetsRetryableError(
+                        f"Timed out after {self.checkout_timeout}s waiting for a Sheets client"
+                    )
+                self._condition.wait(remaining)
+    
+    def _release(self, pooled):
+        """Return a client to the pool."""
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+    
+    def _discard_slot(self):
+        """Give up a slot reserved for a client that could not be created."""
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+    
+    def checkout(self):
+        """
+        Check out a client for one operation.
+        
+        Returns:
+            PooledClient: Client to use; must be passed to checkin()
+        """
+        pooled = self._acquire()
+        if pooled is None:
+            try:
+                pooled = self._factory(self.template)
+            except Exception:
+                self._discard_slot()
+                raise
+        
+        try:
+            remaining = pooled.seconds_until_expiry()
+            if remaining is not None and remaining < self.refresh_margin:
+                pooled.refresh_token()
+                with self._condition:
+                    self._refreshes += 1
+        except Exception:
+            # AuthorizedSession refreshes on the request itself if this failed
+            pass
+        
+        return pooled
+    
+    def checkin(self, pooled):
+        """
+        Return a client after an operation.
+        
+        Args:
+            pooled: PooledClient from checkout()
+        """
+        self._release(pooled)
+    
+    def get_stats(self):
+        """
+        Get pool metrics.
+        
+        Returns:
+            dict: Pool size, clients created and idle, checkouts, waits and token refreshes
+        """
+        with self._condition:
+            return {
+                'size': self.size,
+                'created': self._created,
+                'idle': len(self._idle),
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'token_refreshes': self._refreshes
+            }
+
+
+class PooledWorksheet:
+    """
+    Worksheet stand-in that runs each method call on a pooled client.
+    
+    Plain attributes (title, row_count, ...) are read from the pool's
+    first client; methods check out a client for the duration of the call.
+    """
+    
+    def __init__(self, pool, title):
+        """
+        Initialize worksheet proxy.
+        
+        Args:
+            pool: SheetsClientPool
+            title: Worksheet title
+        """
+        self._pool = pool
+        self._title = title
+    
+    def __getattr__(self, name):
+        """Route method calls through the pool; pass other attributes through."""
+        attribute = getattr(self._pool.template.worksheets[self._title], name)
+        if not callable(attribute):
+            return attribute
+        
+        def call(*args, **kwargs):
+            pooled = self._pool.checkout()
+            try:
+                return getattr(pooled.worksheets[self._title], name)(*args, **kwargs)
+            finally:
+                self._pool.checkin(pooled)
+        return call
+
+
+def create_client_factory(titles):
+    """
+    Build a factory that authorizes clients for the configured spreadsheet.
+    
+    The first client opens the spreadsheet and looks up the worksheets;
+    later clients reuse that metadata, so growing the pool costs no API
+    calls beyond their own token fetch.
+    
+    Args:
+        titles: Worksheet titles to open
+        
+    Returns:
+        callable: Factory for SheetsClientPool
+    """
+    def factory(template):
+        # gspread and oauth2client are slow to import, so only load them when connecting
+        import gspread
+        from oauth2client.service_account import ServiceAccountCredentials
+        
+        credentials = ServiceAccountCredentials.from_json_keyfile_dict(GOOGLE_CREDENTIALS, SCOPES)
+        client = gspread.authorize(credentials)
+        
+        if template is None:
+            spreadsheet = client.open_by_key(SPREADSHEET_ID)
+            worksheets = {title: spreadsheet.worksheet(title) for title in titles}
+        else:
+            template_sheets = template.worksheets
+            spreadsheet = copy.copy(next(iter(template_sheets.values())).spreadsheet)
+            spreadsheet.client = client
+            worksheets = {
+                title: gspread.Worksheet(spreadsheet, dict(worksheet._properties))
+                for title, worksheet in template_sheets.items()
+            }
+        
+        return PooledClient(client, worksheets)
+    return factory
+
+
+def create_fake_client_factory(spreadsheet, titles):
+    """
+    Build a factory for the in-memory fake spreadsheet.
+    
+    Fake clients share worksheets, but the pool still bounds how many
+    calls are in flight at once, as it does for real clients.
+    
+    Args:
+        spreadsheet: FakeSpreadsheet
+        titles: Worksheet titles to open
+        
+    Returns:
+        callable: Factory for SheetsClientPool
+    """
+    def factory(template):
+        if template is None:
+            return PooledClient(None, {title: spreadsheet.worksheet(title) for title in titles})
+        return PooledClient(None, template.worksheets)
+    return factory
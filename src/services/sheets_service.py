@@ -1,93 +1,442 @@
 """Google Sheets service for data operations."""
 
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-from datetime import datetime
-import pytz
+import re
+import threading
+import time
 from config.settings import (
-    GOOGLE_CREDENTIALS,
-    SPREADSHEET_ID,
     MEMBERS_SHEET,
     ATTENDANCE_SHEET,
-    TIMEZONE
+    REPORTS_SHEET,
+    SHEETS_FAKE,
+    MEMBER_CACHE_TTL_SECONDS,
+    MEMBER_CACHE_FULL_CHECK_SECONDS,
+    ATTENDANCE_GEOMETRY_TTL_SECONDS,
+    MARKED_SET_TTL_SECONDS,
+    EXPORT_CHUNK_ROWS,
+    ATTENDANCE_WRITE_BEHIND,
+    WRITE_BEHIND_JOURNAL,
+    WRITE_BEHIND_MAX_QUEUE,
+    WRITE_BEHIND_BATCH_SIZE,
+    WRITE_BEHIND_FLUSH_INTERVAL_MS,
+    WRITE_BEHIND_ENQUEUE_TIMEOUT_SECONDS
 )
+from models import Member
+from services.storage import StorageBackend
+from services.sheets_client import (
+    SheetsError,
+    SheetsFatalError,
+    SheetsQuotaError,
+    SheetsRetryableError,
+    wrap_worksheet
+)
+from services.sheets_pool import (
+    SheetsClientPool,
+    PooledWorksheet,
+    create_client_factory,
+    create_fake_client_factory
+)
+from services.write_behind import AttendanceWriteQueue, WriteQueueFullError
+from utils.clock import get_clock
+from utils.metrics import record_cache
+from utils.tracing import traced
+
+# Attendance sheet headers that are session dates
+DATE_HEADER = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+def _record_to_member(record):
+    """
+    Convert a Members sheet record to member data.
+    
+    Args:
+        record: Row dictionary keyed by sheet headers
+        
+    Returns:
+        Member: Member record
+    """
+    return Member(
+        reg_number=record.get('Reg Number'),
+        full_name=record.get('Full Name'),
+        email=record.get('Email'),
+        phone=record.get('Phone'),
+        gender=record.get('Gender'),
+        year_of_study=record.get('Year of Study'),
+        course=record.get('Course'),
+        departments=record.get('Departments'),
+        active=record.get('Active', 'TRUE') == 'TRUE',
+        role=record.get('Role', 'Member'),
+        registration_date=record.get('Registration Date')
+    )
+
+
+def _member_row(member_data, registration_date):
+    """
+    Build a Members sheet row for a new member.
+    
+    Args:
+        member_data: Dictionary containing member information
+        registration_date: Registration date (YYYY-MM-DD)
+        
+    Returns:
+        list: Row values in sheet column order
+    """
+    return [
+        member_data['reg_number'],
+        member_data['full_name'],
+        member_data['email'],
+        member_data['phone'],
+        member_data['gender'],
+        member_data['year_of_study'],
+        member_data['course'],
+        member_data['departments'],
+        'TRUE',  # Active
+        member_data.get('role', 'Member'),
+        registration_date
+    ]
+
+
+def _values_to_record(headers, row):
+    """
+    Convert a row of cell values to a record keyed by header.
+    
+    Numeric strings are converted the same way get_all_records does.
+    
+    Args:
+        headers: Header row values
+        row: Row values (may be shorter than headers)
+        
+    Returns:
+        dict: Record
+    """
+    from gspread.utils import numericise_all
+    
+    row = list(row[:len(headers)]) + [''] * (len(headers) - len(row))
+    values = numericise_all(row, empty2zero=False, default_blank='')
+    return dict(zip(headers, values))
+
+
+def _cell_ranges(cells):
+    """
+    Group cells into batch_update ranges, one per run of adjacent cells in a row.
+    
+    Args:
+        cells: List of (row, col, value) tuples, 1-based
+        
+    Returns:
+        list: batch_update data entries
+    """
+    runs = []
+    for row, col, value in sorted(cells, key=lambda cell: cell[:2]):
+        if runs and runs[-1][0] == row and runs[-1][1] + len(runs[-1][2]) == col:
+            runs[-1][2].append(value)
+        else:
+            runs.append((row, col, [value]))
+    
+    return [
+        {
+            'range': f"{_column_letter(col)}{row}:{_column_letter(col + len(values) - 1)}{row}",
+            'values': [values]
+        }
+        for row, col, values in runs
+    ]
+
+
+def _column_letter(col):
+    """
+    Get the A1 column letter(s) for a 1-based column index.
+    
+    Args:
+        col: Column index (1-based)
+        
+    Returns:
+        str: Column letter(s), e.g. 'A' or 'AB'
+    """
+    from gspread.utils import rowcol_to_a1
+    
+    return rowcol_to_a1(1, col)[:-1]
+
+
+def _exceeds_grid(error):
+    """
+    Check whether a read failed because its range starts below the sheet's grid.
+    
+    The API rejects such a range with a 400 instead of returning no rows,
+    which happens when a worksheet's grid ends exactly at its last row.
+    
+    Args:
+        error: SheetsFatalError raised by a read
+        
+    Returns:
+        bool: True if the range was past the last row of the grid
+    """
+    return error.status_code == 400 and 'exceeds grid limits' in str(error)
+
+
+def _row_from_append_response(response):
+    """
+    Extract the 1-based row index written by an append_row call.
+    
+    Args:
+        response: Response returned by Worksheet.append_row
+        
+    Returns:
+        int: Row index, or None if it cannot be determined
+    """
+    from gspread.utils import a1_to_rowcol
+    
+    try:
+        updated_range = response['updates']['updatedRange']
+        first_cell = updated_range.split('!')[-1].split(':')[0]
+        row, _ = a1_to_rowcol(first_cell)
+        return row
+    except Exception:
+        return None
 
 
-class GoogleSheetsService:
+class GoogleSheetsService(StorageBackend):
     """Service for Google Sheets operations."""
     
     def __init__(self):
         """Initialize Google Sheets connection."""
-        self.client = None
-        self.spreadsheet = None
+        self.pool = None
         self.members_sheet = None
         self.attendance_sheet = None
+        
+        # Member index: reg_number -> member data
+        self._member_index = {}
+        self._member_index_loaded_at = None
+        self._member_index_lock = threading.Lock()
+        
+        # Incremental refresh state for the member index
+        self._member_headers = None
+        self._member_row_keys = []  # (reg_number, active) per loaded sheet row
+        self._member_full_check_at = None
+        
+        # Attendance sheet geometry: date -> column, reg_number -> row
+        self._date_columns = {}
+        self._reg_rows = {}
+        self._header_length = 0
+        self._geometry_loaded_at = None
+        self._geometry_lock = threading.Lock()
+        
+        # Per-session marked sets: date -> (reg numbers marked present, loaded at)
+        self._marked_sets = {}
+        self._marked_sets_lock = threading.Lock()
+        
         self._connect()
+        
+        # Optional write-behind queue for attendance marks
+        self._write_queue = None
+        if ATTENDANCE_WRITE_BEHIND:
+            self._write_queue = AttendanceWriteQueue(
+                self._flush_attendance_marks,
+                WRITE_BEHIND_JOURNAL,
+                max_size=WRITE_BEHIND_MAX_QUEUE,
+                batch_size=WRITE_BEHIND_BATCH_SIZE,
+                flush_interval_ms=WRITE_BEHIND_FLUSH_INTERVAL_MS,
+                enqueue_timeout=WRITE_BEHIND_ENQUEUE_TIMEOUT_SECONDS
+            )
+            self._write_queue.start()
     
     def _connect(self):
-        """Establish connection to Google Sheets."""
+        """
+        Establish connection to Google Sheets.
+        
+        Opens a pool of authorized clients; the worksheets route each
+        call through the pool, under the shared quota limits and retries.
+        """
+        started = time.perf_counter()
+        titles = (MEMBERS_SHEET, ATTENDANCE_SHEET)
+        
+        if SHEETS_FAKE:
+            from services.fake_sheets import get_fake_spreadsheet
+            factory = create_fake_client_factory(get_fake_spreadsheet(), titles)
+        else:
+            factory = create_client_factory(titles)
+        
         try:
-            # Define the scope
-            scope = [
-                'https://spreadsheets.google.com/feeds',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            
-            # Load credentials from settings dictionary
-            credentials = ServiceAccountCredentials.from_json_keyfile_dict(
-                GOOGLE_CREDENTIALS,
-                scope
-            )
-            
-            # Authorize and create client
-            self.client = gspread.authorize(credentials)
-            
-            # Open spreadsheet
-            self.spreadsheet = self.client.open_by_key(SPREADSHEET_ID)
-            
-            # Get worksheets
-            self.members_sheet = self.spreadsheet.worksheet(MEMBERS_SHEET)
-            self.attendance_sheet = self.spreadsheet.worksheet(ATTENDANCE_SHEET)
-            
+            self.pool = SheetsClientPool(factory)
         except Exception as e:
             raise Exception(f"Failed to connect to Google Sheets: {str(e)}")
+        
+        self.members_sheet = wrap_worksheet(PooledWorksheet(self.pool, MEMBERS_SHEET))
+        self.attendance_sheet = wrap_worksheet(PooledWorksheet(self.pool, ATTENDANCE_SHEET))
+        self.connect_ms = round((time.perf_counter() - started) * 1000, 1)
+    
+    def _member_index_expired(self):
+        """Check whether the member index needs a reload."""
+        if self._member_index_loaded_at is None:
+            return True
+        return time.monotonic() - self._member_index_loaded_at >= MEMBER_CACHE_TTL_SECONDS
+    
+    def _apply_member_rows(self, rows, index, row_keys):
+        """
+        Add sheet rows to a member index.
+        
+        Args:
+            rows: Row values from the Members sheet, in sheet order
+            index: Member index to update
+            row_keys: Loaded row keys to extend
+        """
+        for row in rows:
+            record = _values_to_record(self._member_headers, row)
+            reg_number = record.get('Reg Number')
+            member = _record_to_member(record)
+            
+            row_keys.append((reg_number, member.active))
+            if reg_number:
+                index[reg_number] = member
+    
+    def _load_member_index(self):
+        """Load all members from the Members sheet into the index."""
+        values = self.members_sheet.get_values()
+        
+        self._member_headers = values[0] if values else []
+        index = {}
+        row_keys = []
+        self._apply_member_rows(values[1:], index, row_keys)
+        
+        # Swap in the new index so concurrent lookups never see it half built
+        self._member_index = index
+        self._member_row_keys = row_keys
+        
+        now = time.monotonic()
+        self._member_index_loaded_at = now
+        self._member_full_check_at = now
+    
+    def _member_rows_changed(self):
+        """
+        Check loaded rows against the sheet using only the narrow key columns.
+        
+        Reads the Reg Number and Active columns and compares them with the
+        rows already in the index, catching manual edits and deletions
+        without downloading whole rows.
+        
+        Returns:
+            bool: True if the loaded rows no longer match the sheet
+        """
+        headers = self._member_headers
+        if 'Reg Number' not in headers:
+            return True
+        
+        reg_col = _column_letter(headers.index('Reg Number') + 1)
+        ranges = [f"{reg_col}2:{reg_col}"]
+        if 'Active' in headers:
+            active_col = _column_letter(headers.index('Active') + 1)
+            ranges.append(f"{active_col}2:{active_col}")
+        
+        try:
+            columns = self.members_sheet.batch_get(ranges)
+        except SheetsFatalError as e:
+            if not _exceeds_grid(e):
+                raise
+            columns = [[]]  # No rows below the header
+        reg_numbers = [row[0] if row else '' for row in columns[0]]
+        actives = [row[0] if row else '' for row in columns[1]] if len(columns) > 1 else []
+        
+        if len(reg_numbers) < len(self._member_row_keys):
+            return True
+        
+        for index, (reg_number, active) in enumerate(self._member_row_keys):
+            sheet_active = actives[index] if index < len(actives) else ''
+            if 'Active' not in headers:
+                sheet_active = 'TRUE'
+            if str(reg_numbers[index]) != str(reg_number or '') or (sheet_active == 'TRUE') != active:
+                return True
+        
+        return False
+    
+    def _refresh_member_index(self):
+        """
+        Bring the member index up to date.
+        
+        Members are append-only, so normally only rows past the last loaded
+        row are fetched. Every MEMBER_CACHE_FULL_CHECK_SECONDS the key
+        columns are compared with the index, and the index is fully
+        reloaded if any loaded row has changed.
+        """
+        if self._member_headers is None:
+            self._load_member_index()
+            return
+        
+        now = time.monotonic()
+        if now - self._member_full_check_at >= MEMBER_CACHE_FULL_CHECK_SECONDS:
+            self._member_full_check_at = now
+            if self._member_rows_changed():
+                self._load_member_index()
+                return
+        
+        next_row = len(self._member_row_keys) + 2  # Row 1 is the header
+        last_col = _column_letter(max(len(self._member_headers), 1))
+        try:
+            rows = self.members_sheet.get_values(f"A{next_row}:{last_col}")
+        except SheetsFatalError as e:
+            if not _exceeds_grid(e):
+                raise
+            rows = []  # No rows appended since the last load
+        self._apply_member_rows(rows, self._member_index, self._member_row_keys)
+        
+        self._member_index_loaded_at = now
+    
+    def invalidate_member_cache(self):
+        """Force a full reload of the member index on next lookup."""
+        with self._member_index_lock:
+            self._member_index_loaded_at = None
+            self._member_headers = None
+    
+    def _ensure_member_index(self):
+        """Refresh the member index if it is missing or expired."""
+        if self._member_index_expired():
+            with self._member_index_lock:
+                # Another thread may have refreshed while we waited
+                if self._member_index_expired():
+                    record_cache('member_index', False)
+                    self._refresh_member_index()
+                    return
+        record_cache('member_index', True)
     
+    @traced('storage.get_member')
     def get_member(self, reg_number):
         """
         Get member by registration number.
         
+        Lookups are served from the in-memory member index, which is
+        refreshed from the sheet once MEMBER_CACHE_TTL_SECONDS have passed.
+        
         Args:
             reg_number: Registration number
             
         Returns:
-            dict: Member data or None if not found
+            Member: Member record or None if not found
         """
         try:
-            # Get all records
-            records = self.members_sheet.get_all_records()
-            
-            # Find member
-            for record in records:
-                if record.get('Reg Number') == reg_number:
-                    return {
-                        'reg_number': record.get('Reg Number'),
-                        'full_name': record.get('Full Name'),
-                        'email': record.get('Email'),
-                        'phone': record.get('Phone'),
-                        'gender': record.get('Gender'),
-                        'year_of_study': record.get('Year of Study'),
-                        'course': record.get('Course'),
-                        'departments': record.get('Departments'),
-                        'active': record.get('Active', 'TRUE') == 'TRUE',
-                        'role': record.get('Role', 'Member'),
-                        'registration_date': record.get('Registration Date')
-                    }
+            self._ensure_member_index()
             
-            return None
+            # Member records are never modified in place, so no copy is needed
+            return self._member_index.get(reg_number)
             
+        except SheetsError:
+            raise
         except Exception as e:
             raise Exception(f"Error fetching member: {str(e)}")
     
+    def list_members(self):
+        """
+        List all members.
+        
+        Returns:
+            list: Member records in sheet order
+        """
+        try:
+            self._ensure_member_index()
+            return list(self._member_index.values())
+            
+        except SheetsError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error listing members: {str(e)}")
+    
+    @traced('storage.add_member')
     def add_member(self, member_data):
         """
         Add new member to Members sheet.
@@ -99,40 +448,171 @@ class GoogleSheetsService:
             bool: True if successful
         """
         try:
-            # Get timezone
-            tz = pytz.timezone(TIMEZONE)
-            registration_date = datetime.now(tz).strftime('%Y-%m-%d')
-            
-            # Prepare row data (match sheet columns)
-            row = [
-                member_data['reg_number'],
-                member_data['full_name'],
-                member_data['email'],
-                member_data['phone'],
-                member_data['gender'],
-                member_data['year_of_study'],
-                member_data['course'],
-                member_data['departments'],
-                'TRUE',  # Active
-                member_data.get('role', 'Member'),
-                registration_date
-            ]
+            registration_date = get_clock().now().strftime('%Y-%m-%d')
             
             # Append row
-            self.members_sheet.append_row(row, value_input_option='USER_ENTERED')
+            self.members_sheet.append_row(
+                _member_row(member_data, registration_date),
+                value_input_option='USER_ENTERED'
+            )
             
             # Also add to attendance sheet (reg number and name only)
             attendance_row = [
                 member_data['reg_number'],
                 member_data['full_name']
             ]
-            self.attendance_sheet.append_row(attendance_row, value_input_option='USER_ENTERED')
+            response = self.attendance_sheet.append_row(attendance_row, value_input_option='USER_ENTERED')
             
+            self._remember_added_members([member_data], registration_date, response)
             return True
             
+        except SheetsRetryableError as e:
+            self._forget_after_failed_append(e)
+            raise
+        except SheetsError:
+            raise
         except Exception as e:
             raise Exception(f"Error adding member: {str(e)}")
     
+    def add_members(self, members_data):
+        """
+        Add several members with one append per sheet.
+        
+        Members already in the index are skipped rather than appended twice.
+        
+        Args:
+            members_data: List of member information dictionaries
+            
+        Returns:
+            list: Registration numbers skipped because they already exist
+        """
+        try:
+            self._ensure_member_index()
+            skipped = [data['reg_number'] for data in members_data if data['reg_number'] in self._member_index]
+            members_data = [data for data in members_data if data['reg_number'] not in self._member_index]
+            if not members_data:
+                return skipped
+            
+            registration_date = get_clock().now().strftime('%Y-%m-%d')
+            
+            self.members_sheet.append_rows(
+                [_member_row(data, registration_date) for data in members_data],
+                value_input_option='USER_ENTERED'
+            )
+            response = self.attendance_sheet.append_rows(
+                [[data['reg_number'], data['full_name']] for data in members_data],
+                value_input_option='USER_ENTERED'
+            )
+            
+            self._remember_added_members(members_data, registration_date, response)
+            return skipped
+            
+        except SheetsRetryableError as e:
+            self._forget_after_failed_append(e)
+            raise
+        except SheetsError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error adding members: {str(e)}")
+    
+    def _forget_after_failed_append(self, error):
+        """
+        Drop the cached member index and row map after a failed append.
+        
+        Appends are not retried, and unless the request was rejected for
+        quota it may have reached the sheet, so the next read re-checks it.
+        
+        Args:
+            error: SheetsRetryableError raised by the append
+        """
+        if not isinstance(error, SheetsQuotaError):
+            self.invalidate_member_cache()
+            self.invalidate_attendance_geometry()
+    
+    def _remember_added_members(self, members_data, registration_date, response):
+        """
+        Update the row map and member index after appending members.
+        
+        Args:
+            members_data: Member information dictionaries, in appended order
+            registration_date: Registration date written to the sheet
+            response: Attendance sheet append response
+        """
+        # Keep the row map in sync with the appended rows
+        first_row = _row_from_append_response(response)
+        with self._geometry_lock:
+            if first_row is None:
+                self._geometry_loaded_at = None
+            elif self._geometry_loaded_at is not None:
+                for offset, data in enumerate(members_data):
+                    self._reg_rows[data['reg_number']] = first_row + offset
+        
+        # Write-through to the member index
+        with self._member_index_lock:
+            for data in members_data:
+                self._member_index[data['reg_number']] = Member.from_dict(dict(
+                    data,
+                    active=True,
+                    role=data.get('role', 'Member'),
+                    registration_date=registration_date
+                ))
+    
+    def _geometry_expired(self):
+        """Check whether the cached attendance sheet geometry needs a reload."""
+        if self._geometry_loaded_at is None:
+            return True
+        return time.monotonic() - self._geometry_loaded_at >= ATTENDANCE_GEOMETRY_TTL_SECONDS
+    
+    def _load_attendance_geometry(self):
+        """Load the date header row and reg number column of the Attendance sheet."""
+        header_row = self.attendance_sheet.row_values(1)
+        reg_numbers = self.attendance_sheet.col_values(1)  # Column A (Reg Number)
+        
+        self._date_columns = {
+            value: index + 1 for index, value in enumerate(header_row) if value
+        }
+        self._reg_rows = {
+            value: index + 1 for index, value in enumerate(reg_numbers) if index > 0 and value
+        }
+        self._header_length = len(header_row)
+        self._geometry_loaded_at = time.monotonic()
+    
+    def _ensure_attendance_geometry(self, force=False):
+        """Load the attendance sheet geometry if missing, expired or forced."""
+        if force or self._geometry_expired():
+            with self._geometry_lock:
+                if force or self._geometry_expired():
+                    record_cache('attendance_geometry', False)
+                    self._load_attendance_geometry()
+                    return
+        record_cache('attendance_geometry', True)
+    
+    def invalidate_attendance_geometry(self):
+        """Force the attendance sheet geometry to reload on next use."""
+        with self._geometry_lock:
+            self._geometry_loaded_at = None
+    
+    def _get_attendance_row_index(self, reg_number):
+        """
+        Get the Attendance sheet row for a member.
+        
+        Reloads the geometry once on a miss, in case the row was added
+        to the sheet by hand.
+        
+        Args:
+            reg_number: Member registration number
+            
+        Returns:
+            int: Row index (1-based) or None if not found
+        """
+        self._ensure_attendance_geometry()
+        row_index = self._reg_rows.get(reg_number)
+        if row_index is None:
+            self._ensure_attendance_geometry(force=True)
+            row_index = self._reg_rows.get(reg_number)
+        return row_index
+    
+    @traced('storage.get_attendance_column_index')
     def get_attendance_column_index(self, date_str):
         """
         Get column index for a date, create if doesn't exist.
@@ -144,22 +624,34 @@ class GoogleSheetsService:
             int: Column index (1-based)
         """
         try:
-            # Get header row
-            header_row = self.attendance_sheet.row_values(1)
+            self._ensure_attendance_geometry()
             
             # Check if date column exists
-            if date_str in header_row:
-                return header_row.index(date_str) + 1  # 1-based index
+            col_index = self._date_columns.get(date_str)
+            if col_index is not None:
+                return col_index
             
-            # Date column doesn't exist, create it
-            next_col = len(header_row) + 1
-            self.attendance_sheet.update_cell(1, next_col, date_str)
+            with self._geometry_lock:
+                # Another thread may have created it while we waited
+                col_index = self._date_columns.get(date_str)
+                if col_index is not None:
+                    return col_index
+                
+                # Date column doesn't exist, create it
+                next_col = self._header_length + 1
+                self.attendance_sheet.update_cell(1, next_col, date_str)
+                
+                self._date_columns[date_str] = next_col
+                self._header_length = next_col
             
             return next_col
             
+        except SheetsError:
+            raise
         except Exception as e:
             raise Exception(f"Error managing attendance column: {str(e)}")
     
+    @traced('storage.mark_attendance')
     def mark_attendance(self, reg_number, date_str):
         """
         Mark attendance for a member on a specific date.
@@ -176,21 +668,318 @@ class GoogleSheetsService:
             col_index = self.get_attendance_column_index(date_str)
             
             # Find member's row
-            reg_numbers = self.attendance_sheet.col_values(1)  # Column A (Reg Number)
-            
-            try:
-                row_index = reg_numbers.index(reg_number) + 1  # 1-based index
-            except ValueError:
+            row_index = self._get_attendance_row_index(reg_number)
+            if row_index is None:
                 raise Exception(f"Member {reg_number} not found in attendance sheet")
             
-            # Mark as Present
-            self.attendance_sheet.update_cell(row_index, col_index, 'Present')
+            if self._write_queue is not None:
+                # Acknowledge once journaled; the flusher writes it later
+                self._write_queue.enqueue(reg_number, date_str)
+            else:
+                # Mark as Present
+                self.attendance_sheet.update_cell(row_index, col_index, 'Present')
+            
+            self._add_to_marked_set(reg_number, date_str)
             
             return True
             
+        except (SheetsError, WriteQueueFullError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error marking attendance: {str(e)}")
+    
+    def _attendance_updates(self, marks):
+        """
+        Build batch_update ranges for attendance marks.
+        
+        Args:
+            marks: List of (reg_number, date_str) tuples
+            
+        Returns:
+            tuple: (updates, missing) where missing lists marks whose
+            member has no Attendance sheet row
+        """
+        from gspread.utils import rowcol_to_a1
+        
+        updates = []
+        missing = []
+        for reg_number, date_str in marks:
+            col_index = self.get_attendance_column_index(date_str)
+            row_index = self._get_attendance_row_index(reg_number)
+            if row_index is None:
+                missing.append((reg_number, date_str))
+                continue
+            updates.append({
+                'range': rowcol_to_a1(row_index, col_index),
+                'values': [['Present']]
+            })
+        return updates, missing
+    
+    def _flush_attendance_marks(self, marks):
+        """
+        Write queued attendance marks with a single batch_update.
+        
+        Args:
+            marks: List of (reg_number, date_str) tuples
+        """
+        # Marks whose member row was removed since they were queued are dropped
+        updates, _ = self._attendance_updates(marks)
+        if updates:
+            self.attendance_sheet.batch_update(updates)
+    
+    def mark_attendance_many(self, reg_numbers, date_str):
+        """
+        Mark attendance for several members with a single batch_update.
+        
+        Marks are written directly, even when write-behind is enabled.
+        
+        Args:
+            reg_numbers: Member registration numbers
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            dict: Error code for each registration number that was not
+            marked (DUPLICATE_ATTENDANCE or MEMBER_NOT_FOUND)
+        """
+        try:
+            not_marked = {}
+            marks = []
+            for reg_number in reg_numbers:
+                if self.get_attendance(reg_number, date_str):
+                    not_marked[reg_number] = 'DUPLICATE_ATTENDANCE'
+                else:
+                    marks.append((reg_number, date_str))
+            
+            updates, missing = self._attendance_updates(marks)
+            for reg_number, _ in missing:
+                not_marked[reg_number] = 'MEMBER_NOT_FOUND'
+            
+            if updates:
+                self.attendance_sheet.batch_update(updates)
+            
+            for reg_number, _ in marks:
+                if reg_number not in not_marked:
+                    self._add_to_marked_set(reg_number, date_str)
+            
+            return not_marked
+            
+        except SheetsError:
+            raise
         except Exception as e:
             raise Exception(f"Error marking attendance: {str(e)}")
     
+    def flush_attendance_marks(self):
+        """
+        Flush queued attendance marks immediately.
+        
+        Returns:
+            int: Number of marks flushed
+        """
+        if self._write_queue is None:
+            return 0
+        return self._write_queue.flush()
+    
+    def list_attendance_dates(self):
+        """
+        List the date columns of the Attendance sheet.
+        
+        Returns:
+            list: Date strings (YYYY-MM-DD), oldest first
+        """
+        try:
+            self._ensure_attendance_geometry()
+            return sorted(value for value in self._date_columns if DATE_HEADER.match(value))
+            
+        except SheetsError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error listing attendance dates: {str(e)}")
+    
+    def iter_attendance_matrix(self, dates, chunk_size=EXPORT_CHUNK_ROWS):
+        """
+        Iterate over the Attendance sheet, chunk_size rows per read.
+        
+        Only columns up to the last requested date are read. Marks still
+        waiting in the write-behind queue count as present.
+        
+        Args:
+            dates: Date strings (YYYY-MM-DD) to include
+            chunk_size: Rows to read per API call
+            
+        Yields:
+            tuple: (reg_number, full_name, set of dates present)
+        """
+        self._ensure_attendance_geometry()
+        columns = [(date_str, self._date_columns[date_str]) for date_str in dates if date_str in self._date_columns]
+        last_col = _column_letter(max([2] + [col for _, col in columns]))
+        last_row = max(self._reg_rows.values(), default=1)
+        pending = {}
+        if self._write_queue is not None:
+            pending = {date_str: self._write_queue.get_pending(date_str) for date_str in dates}
+        
+        start = 2
+        while True:
+            end = start + chunk_size - 1
+            try:
+                values = self.attendance_sheet.get_values(f"A{start}:{last_col}{end}")
+            except SheetsFatalError as e:
+                if not _exceeds_grid(e):
+                    raise
+                break  # The sheet ends before this chunk
+            
+            for row in values:
+                if not row or not row[0]:
+                    continue
+                reg_number = row[0]
+                present = {
+                    date_str for date_str, col in columns
+                    if len(row) >= col and row[col - 1] == 'Present'
+                }
+                present.update(date_str for date_str, regs in pending.items() if reg_number in regs)
+                yield reg_number, row[1] if len(row) > 1 else '', present
+            
+            # Short chunks are trimmed at the last filled row; keep going only
+            # while rows known from the row map remain
+            if len(values) < chunk_size and end >= last_row:
+                break
+            start = end + 1
+    
+    def get_write_queue_stats(self):
+        """
+        Get write-behind queue metrics.
+        
+        Returns:
+            dict: Queue metrics or None if write-behind is disabled
+        """
+        if self._write_queue is None:
+            return None
+        return self._write_queue.get_stats()
+    
+    def get_client_pool_stats(self):
+        """
+        Get Sheets client pool metrics.
+        
+        Returns:
+            dict: Pool metrics
+        """
+        return self.pool.get_stats()
+    
+    def _reports_call(self, method, *args):
+        """
+        Run one call on the Reports sheet.
+        
+        The Reports sheet is optional, so each client opens it on first
+        use instead of at connect time.
+        
+        Args:
+            method: Worksheet method name
+            *args: Arguments for the method
+            
+        Returns:
+            Result of the worksheet call
+        """
+        pooled = self.pool.checkout()
+        try:
+            worksheet = pooled.worksheets.get(REPORTS_SHEET) or pooled.open_worksheet(REPORTS_SHEET)
+            return getattr(wrap_worksheet(worksheet), method)(*args)
+        finally:
+            self.pool.checkin(pooled)
+    
+    def get_report_values(self):
+        """
+        Read the Reports sheet.
+        
+        Returns:
+            list: Rows of cell values as strings, trailing empty cells trimmed
+        """
+        try:
+            return self._reports_call('get_values')
+            
+        except SheetsError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error reading report: {str(e)}")
+    
+    def update_report_cells(self, cells):
+        """
+        Overwrite cells of the Reports sheet with a single batch update.
+        
+        Args:
+            cells: List of (row, col, value) tuples, 1-based
+        """
+        if not cells:
+            return
+        
+        try:
+            self._reports_call('batch_update', _cell_ranges(cells))
+            
+        except SheetsError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error writing report: {str(e)}")
+    
+    def _load_marked_set(self, date_str):
+        """
+        Build the set of members marked present for a date.
+        
+        Reads only the date's column; rows are mapped back to reg numbers
+        through the cached row map.
+        
+        Args:
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            set: Registration numbers
+        """
+        self._ensure_attendance_geometry()
+        
+        marked = set()
+        col_index = self._date_columns.get(date_str)
+        if col_index is not None:
+            statuses = self.attendance_sheet.col_values(col_index)
+            reg_by_row = {row_index: reg_number for reg_number, row_index in self._reg_rows.items()}
+            for row_index, status in enumerate(statuses, start=1):
+                if status == 'Present' and row_index in reg_by_row:
+                    marked.add(reg_by_row[row_index])
+        
+        # Include marks still waiting in the write-behind queue
+        if self._write_queue is not None:
+            marked |= self._write_queue.get_pending(date_str)
+        
+        return marked
+    
+    def _get_marked_set(self, date_str):
+        """
+        Get the marked set for a date, loading it on first use or expiry.
+        
+        Args:
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            set: Registration numbers marked present
+        """
+        entry = self._marked_sets.get(date_str)
+        if entry is not None and time.monotonic() - entry[1] < MARKED_SET_TTL_SECONDS:
+            record_cache('marked_set', True)
+            return entry[0]
+        
+        with self._marked_sets_lock:
+            entry = self._marked_sets.get(date_str)
+            hit = entry is not None and time.monotonic() - entry[1] < MARKED_SET_TTL_SECONDS
+            if not hit:
+                entry = (self._load_marked_set(date_str), time.monotonic())
+                self._marked_sets[date_str] = entry
+            record_cache('marked_set', hit)
+            return entry[0]
+    
+    def _add_to_marked_set(self, reg_number, date_str):
+        """Record a successful mark in the date's marked set, if loaded."""
+        with self._marked_sets_lock:
+            entry = self._marked_sets.get(date_str)
+            if entry is not None:
+                entry[0].add(reg_number)
+    
+    @traced('storage.get_attendance')
     def get_attendance(self, reg_number, date_str):
         """
         Check if member has marked attendance for a date.
@@ -203,24 +992,39 @@ class GoogleSheetsService:
             bool: True if attendance marked, False otherwise
         """
         try:
-            # Get all records
-            records = self.attendance_sheet.get_all_records()
+            # Marks still waiting in the write-behind queue count as present
+            if self._write_queue is not None and self._write_queue.is_pending(reg_number, date_str):
+                return True
             
-            # Find member's attendance
-            for record in records:
-                if record.get('Reg Number') == reg_number:
-                    # Check if date column exists and has value
-                    attendance_status = record.get(date_str, '')
-                    return attendance_status == 'Present'
-            
-            return False
+            return reg_number in self._get_marked_set(date_str)
             
+        except SheetsError:
+            raise
         except Exception as e:
-            # If column doesn't exist yet, attendance is not marked
-            if 'not found' in str(e).lower():
-                return False
             raise Exception(f"Error checking attendance: {str(e)}")
     
+    def list_attendance(self, date_str):
+        """
+        List members marked present on a date.
+        
+        Args:
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            list: Registration numbers in sheet order
+        """
+        try:
+            marked = self._get_marked_set(date_str)
+            with self._marked_sets_lock:
+                marked = list(marked)
+            
+            return sorted(marked, key=lambda reg_number: self._reg_rows.get(reg_number, 0))
+            
+        except SheetsError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error listing attendance: {str(e)}")
+    
     def is_member_active(self, reg_number):
         """
         Check if member is active.
@@ -234,11 +1038,12 @@ class GoogleSheetsService:
         member = self.get_member(reg_number)
         if not member:
             return False
-        return member.get('active', False)
+        return member.active
 
 
 # Singleton instance
 _sheets_service = None
+_sheets_service_lock = threading.Lock()
 
 
 def get_sheets_service():
@@ -250,5 +1055,8 @@ def get_sheets_service():
     """
     global _sheets_service
     if _sheets_service is None:
-        _sheets_service = GoogleSheetsService()
+        # Services are created on first request, possibly from several threads at once
+        with _sheets_service_lock:
+            if _sheets_service is None:
+                _sheets_service = GoogleSheetsService()
     return _sheets_service
@@ -0,0 +1,451 @@
+"""SQLite storage backend for local and offline deployments."""
+
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+from config.settings import SQLITE_DATABASE_PATH, EXPORT_CHUNK_ROWS
+from models import Member
+from services.storage import (
+    StorageBackend,
+    DuplicateMemberError,
+    DuplicateAttendanceError,
+    MemberNotFoundError
+)
+from utils.clock import get_clock
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    reg_number TEXT PRIMARY KEY,
+    full_name TEXT NOT NULL,
+    email TEXT,
+    phone TEXT,
+    gender TEXT,
+    year_of_study INTEGER,
+    course TEXT,
+    departments TEXT,
+    active INTEGER NOT NULL DEFAULT 1,
+    role TEXT NOT NULL DEFAULT 'Member',
+    registration_date TEXT
+);
+
+CREATE TABLE IF NOT EXISTS attendance (
+    reg_number TEXT NOT NULL REFERENCES members(reg_number),
+    date TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'Present',
+    marked_at TEXT NOT NULL,
+    PRIMARY KEY (reg_number, date)
+);
+
+CREATE INDEX IF NOT EXISTS idx_attendance_date ON attendance(date);
+
+CREATE TABLE IF NOT EXISTS report_cells (
+    row INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (row, col)
+);
+"""
+
+INSERT_MEMBER = (
+    'INSERT INTO members (reg_number, full_name, email, phone, gender, '
+    'year_of_study, course, departments, active, role, registration_date) '
+    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)'
+)
+
+
+def _member_params(member_data, registration_date):
+    """
+    Build INSERT_MEMBER parameters for a new member.
+    
+    Args:
+        member_data: Dictionary containing member information
+        registration_date: Registration date (YYYY-MM-DD)
+        
+    Returns:
+        tuple: Statement parameters
+    """
+    return (
+        member_data['reg_number'],
+        member_data['full_name'],
+        member_data['email'],
+        member_data['phone'],
+        member_data['gender'],
+        int(member_data['year_of_study']),
+        member_data['course'],
+        member_data['departments'],
+        member_data.get('role', 'Member'),
+        registration_date
+    )
+
+
+def _row_to_member(row):
+    """
+    Convert a members table row to member data.
+    
+    Args:
+        row: sqlite3.Row from the members table
+        
+    Returns:
+        Member: Member record
+    """
+    return Member(
+        reg_number=row['reg_number'],
+        full_name=row['full_name'],
+        email=row['email'],
+        phone=row['phone'],
+        gender=row['gender'],
+        year_of_study=row['year_of_study'],
+        course=row['course'],
+        departments=row['departments'],
+        active=bool(row['active']),
+        role=row['role'],
+        registration_date=row['registration_date']
+    )
+
+
+class SQLiteService(StorageBackend):
+    """Service for SQLite storage operations."""
+    
+    def __init__(self, database_path=SQLITE_DATABASE_PATH):
+        """
+        Initialize SQLite database.
+        
+        Args:
+            database_path: Path of the database file, or ':memory:'
+        """
+        started = time.perf_counter()
+        self.database_path = str(database_path)
+        self._local = threading.local()
+        self._memory_connection = None
+        self._write_lock = contextlib.nullcontext()
+        
+        if self.database_path == ':memory:':
+            # A single shared connection, since each in-memory connection is its own
+            # database; writes are serialized so one thread's BEGIN never meets another's
+            self._memory_connection = self._open_connection()
+            self._write_lock = threading.RLock()
+        else:
+            directory = os.path.dirname(self.database_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        
+        self._connection().executescript(SCHEMA)
+        self.connect_ms = round((time.perf_counter() - started) * 1000, 1)
+    
+    def _open_connection(self):
+        """Open a configured database connection."""
+        connection = sqlite3.connect(
+            self.database_path,
+            timeout=10,
+            check_same_thread=False,
+            isolation_level=None  # Autocommit: each statement is its own transaction
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA foreign_keys = ON')
+        if self.database_path != ':memory:':
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+        return connection
+    
+    def _connection(self):
+        """Get the connection for the current thread."""
+        if self._memory_connection is not None:
+            return self._memory_connection
+        
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._open_connection()
+            self._local.connection = connection
+        return connection
+    
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Run a block in one transaction, yielding the connection."""
+        with self._write_lock:
+            connection = self._connection()
+            connection.execute('BEGIN')
+            try:
+                yield connection
+                connection.execute('COMMIT')
+            except Exception:
+                connection.execute('ROLLBACK')
+                raise
+    
+    def get_member(self, reg_number):
+        """
+        Get member by registration number.
+        
+        Args:
+            reg_number: Registration number
+            
+        Returns:
+            Member: Member record or None if not found
+        """
+        row = self._connection().execute(
+            'SELECT * FROM members WHERE reg_number = ?',
+            (reg_number,)
+        ).fetchone()
+        return _row_to_member(row) if row else None
+    
+    def add_member(self, member_data):
+        """
+        Add new member.
+        
+        Args:
+            member_data: Dictionary containing member information
+            
+        Returns:
+            bool: True if successful
+            
+        Raises:
+            DuplicateMemberError: If the registration number already exists
+        """
+        registration_date = get_clock().now().strftime('%Y-%m-%d')
+        
+        try:
+            with self._write_lock:
+                self._connection().execute(INSERT_MEMBER, _member_params(member_data, registration_date))
+        except sqlite3.IntegrityError:
+            raise DuplicateMemberError(f"Member {member_data['reg_number']} already exists")
+        
+        return True
+    
+    def add_members(self, members_data):
+        """
+        Add several members in one transaction.
+        
+        Args:
+            members_data: List of member information dictionaries
+            
+        Returns:
+            list: Registration numbers skipped because they already exist
+        """
+        registration_date = get_clock().now().strftime('%Y-%m-%d')
+        
+        skipped = []
+        with self._transaction() as connection:
+            for member_data in members_data:
+                try:
+                    connection.execute(INSERT_MEMBER, _member_params(member_data, registration_date))
+                except sqlite3.IntegrityError:
+                    skipped.append(member_data['reg_number'])
+        
+        return skipped
+    
+    def list_members(self):
+        """
+        List all members.
+        
+        Returns:
+            list: Member records in registration order
+        """
+        rows = self._connection().execute(
+            'SELECT * FROM members ORDER BY rowid'
+        ).fetchall()
+        return [_row_to_member(row) for row in rows]
+    
+    def mark_attendance(self, reg_number, date_str):
+        """
+        Mark attendance for a member on a specific date.
+        
+        Args:
+            reg_number: Member registration number
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            bool: True if successful
+            
+        Raises:
+            DuplicateAttendanceError: If attendance is already recorded
+            MemberNotFoundError: If the member does not exist
+        """
+        marked_at = get_clock().now().isoformat()
+        
+        try:
+            with self._write_lock:
+                self._connection().execute(
+                    'INSERT INTO attendance (reg_number, date, status, marked_at) '
+                    'VALUES (?, ?, ?, ?)',
+                    (reg_number, date_str, 'Present', marked_at)
+                )
+        except sqlite3.IntegrityError as e:
+            if 'FOREIGN KEY' in str(e):
+                raise MemberNotFoundError(f"Member {reg_number} not found")
+            raise DuplicateAttendanceError(
+                f"Attendance already marked for {reg_number} on {date_str}"
+            )
+        
+        return True
+    
+    def mark_attendance_many(self, reg_numbers, date_str):
+        """
+        Mark attendance for several members in one transaction.
+        
+        Args:
+            reg_numbers: Member registration numbers
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            dict: Error code for each registration number that was not
+            marked (DUPLICATE_ATTENDANCE or MEMBER_NOT_FOUND)
+        """
+        marked_at = get_clock().now().isoformat()
+        
+        not_marked = {}
+        with self._transaction() as connection:
+            for reg_number in reg_numbers:
+                try:
+                    connection.execute(
+                        'INSERT INTO attendance (reg_number, date, status, marked_at) '
+                        'VALUES (?, ?, ?, ?)',
+                        (reg_number, date_str, 'Present', marked_at)
+                    )
+                except sqlite3.IntegrityError as e:
+                    if 'FOREIGN KEY' in str(e):
+                        not_marked[reg_number] = 'MEMBER_NOT_FOUND'
+                    else:
+                        not_marked[reg_number] = 'DUPLICATE_ATTENDANCE'
+        
+        return not_marked
+    
+    def get_attendance(self, reg_number, date_str):
+        """
+        Check if member has marked attendance for a date.
+        
+        Args:
+            reg_number: Member registration number
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            bool: True if attendance marked, False otherwise
+        """
+        row = self._connection().execute(
+            "SELECT 1 FROM attendance WHERE reg_number = ? AND date = ? AND status = 'Present'",
+            (reg_number, date_str)
+        ).fetchone()
+        return row is not None
+    
+    def list_attendance(self, date_str):
+        """
+        List members marked present on a date.
+        
+        Args:
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            list: Registration numbers
+        """
+        rows = self._connection().execute(
+            "SELECT reg_number FROM attendance WHERE date = ? AND status = 'Present' ORDER BY marked_at",
+            (date_str,)
+        ).fetchall()
+        return [row['reg_number'] for row in rows]
+    
+    def list_attendance_dates(self):
+        """
+        List dates that have attendance recorded.
+        
+        Returns:
+            list: Date strings (YYYY-MM-DD), oldest first
+        """
+        rows = self._connection().execute(
+            'SELECT DISTINCT date FROM attendance ORDER BY date'
+        ).fetchall()
+        return [row['date'] for row in rows]
+    
+    def iter_attendance_matrix(self, dates, chunk_size=EXPORT_CHUNK_ROWS):
+        """
+        Iterate over every member's attendance, chunk_size members at a time.
+        
+        Args:
+            dates: Date strings (YYYY-MM-DD) to include
+            chunk_size: Members to read per query
+            
+        Yields:
+            tuple: (reg_number, full_name, set of dates present)
+        """
+        dates = set(dates)
+        connection = self._connection()
+        last_rowid = 0
+        
+        while True:
+            members = connection.execute(
+                'SELECT rowid, reg_number, full_name FROM members WHERE rowid > ? ORDER BY rowid LIMIT ?',
+                (last_rowid, chunk_size)
+            ).fetchall()
+            if not members:
+                break
+            
+            present = {}
+            if dates:
+                reg_numbers = [member['reg_number'] for member in members]
+                rows = connection.execute(
+                    "SELECT reg_number, date FROM attendance WHERE status = 'Present' "
+                    f"AND date BETWEEN ? AND ? AND reg_number IN ({', '.join('?' * len(reg_numbers))})",
+                    [min(dates), max(dates)] + reg_numbers
+                ).fetchall()
+                for row in rows:
+                    if row['date'] in dates:
+                        present.setdefault(row['reg_number'], set()).add(row['date'])
+            
+            for member in members:
+                yield member['reg_number'], member['full_name'], present.get(member['reg_number'], set())
+            last_rowid = members[-1]['rowid']
+    
+    def get_report_values(self):
+        """
+        Read the published report.
+        
+        Returns:
+            list: Rows of cell values as strings, trailing empty cells trimmed
+        """
+        rows = self._connection().execute(
+            "SELECT row, col, value FROM report_cells WHERE value != '' ORDER BY row, col"
+        ).fetchall()
+        
+        values = []
+        for row in rows:
+            while len(values) < row['row']:
+                values.append([])
+            cells = values[row['row'] - 1]
+            while len(cells) < row['col'] - 1:
+                cells.append('')
+            cells.append(row['value'])
+        return values
+    
+    def update_report_cells(self, cells):
+        """
+        Overwrite cells of the published report in one transaction.
+        
+        Args:
+            cells: List of (row, col, value) tuples, 1-based
+        """
+        with self._transaction() as connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO report_cells (row, col, value) VALUES (?, ?, ?)',
+                [(row, col, '' if value is None else str(value)) for row, col, value in cells]
+            )
+
+
+# Singleton instance
+_sqlite_service = None
+_sqlite_service_lock = threading.Lock()
+
+
+def get_sqlite_service():
+    """
+    Get singleton instance of SQLiteService.
+    
+    Returns:
+        SQLiteService: Service instance
+    """
+    global _sqlite_service
+    if _sqlite_service is None:
+        # Services are created on first request, possibly from several threads at once
+        with _sqlite_service_lock:
+            if _sqlite_service is None:
+                _sqlite_service = SQLiteService()
+    return _sqlite_service
@@ -0,0 +1,252 @@
+"""Storage backend interface and backend selection."""
+
+from config.settings import STORAGE_BACKEND, EXPORT_CHUNK_ROWS
+
+
+class DuplicateMemberError(Exception):
+    """Raised when adding a member whose registration number already exists."""
+
+
+class DuplicateAttendanceError(Exception):
+    """Raised when attendance is already recorded for a member and date."""
+
+
+class MemberNotFoundError(Exception):
+    """Raised when marking attendance for a registration number that is not a member."""
+
+
+class StorageBusyError(Exception):
+    """Raised when storage is temporarily overloaded and the request can be retried later."""
+
+
+class StorageBackend:
+    """
+    Interface for member and attendance storage.
+    
+    MemberService and AttendanceService only talk to storage through
+    these methods, so any backend implementing them can be selected
+    with STORAGE_BACKEND in config/settings.py.
+    """
+    
+    # Time taken to connect to the backend, in milliseconds
+    connect_ms = None
+    
+    def get_member(self, reg_number):
+        """
+        Get member by registration number.
+        
+        Args:
+            reg_number: Registration number
+            
+        Returns:
+            Member: Member record or None if not found
+        """
+        raise NotImplementedError
+    
+    def add_member(self, member_data):
+        """
+        Add a new member.
+        
+        Args:
+            member_data: Dictionary containing member information
+            
+        Returns:
+            bool: True if successful
+        """
+        raise NotImplementedError
+    
+    def add_members(self, members_data):
+        """
+        Add several members.
+        
+        Backends override this to write all members in one request; the
+        default adds them one at a time.
+        
+        Args:
+            members_data: List of member information dictionaries
+            
+        Returns:
+            list: Registration numbers skipped because they already exist
+        """
+        skipped = []
+        for member_data in members_data:
+            try:
+                self.add_member(member_data)
+            except DuplicateMemberError:
+                skipped.append(member_data['reg_number'])
+        return skipped
+    
+    def is_member_active(self, reg_number):
+        """
+        Check if member is active.
+        
+        Args:
+            reg_number: Registration number
+            
+        Returns:
+            bool: True if active, False otherwise
+        """
+        member = self.get_member(reg_number)
+        if not member:
+            return False
+        return member.active
+    
+    def list_members(self):
+        """
+        List all members.
+        
+        Returns:
+            list: Member records
+        """
+        raise NotImplementedError
+    
+    def mark_attendance(self, reg_number, date_str):
+        """
+        Mark attendance for a member on a specific date.
+        
+        Args:
+            reg_number: Member registration number
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            bool: True if successful
+            
+        Raises:
+            DuplicateAttendanceError: If attendance is already recorded
+            MemberNotFoundError: If the member does not exist
+        """
+        raise NotImplementedError
+    
+    def mark_attendance_many(self, reg_numbers, date_str):
+        """
+        Mark attendance for several members on one date.
+        
+        Backends override this to write all marks in one request; the
+        default marks them one at a time.
+        
+        Args:
+            reg_numbers: Member registration numbers
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            dict: Error code for each registration number that was not
+            marked (DUPLICATE_ATTENDANCE or MEMBER_NOT_FOUND)
+        """
+        not_marked = {}
+        for reg_number in reg_numbers:
+            try:
+                self.mark_attendance(reg_number, date_str)
+            except DuplicateAttendanceError:
+                not_marked[reg_number] = 'DUPLICATE_ATTENDANCE'
+            except MemberNotFoundError:
+                not_marked[reg_number] = 'MEMBER_NOT_FOUND'
+        return not_marked
+    
+    def get_attendance(self, reg_number, date_str):
+        """
+        Check if member has marked attendance for a date.
+        
+        Args:
+            reg_number: Member registration number
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            bool: True if attendance marked, False otherwise
+        """
+        raise NotImplementedError
+    
+    def list_attendance(self, date_str):
+        """
+        List members marked present on a date.
+        
+        Args:
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            list: Registration numbers
+        """
+        raise NotImplementedError
+    
+    def list_attendance_dates(self):
+        """
+        List dates that have attendance recorded.
+        
+        Returns:
+            list: Date strings (YYYY-MM-DD), oldest first
+        """
+        raise NotImplementedError
+    
+    def iter_attendance_matrix(self, dates, chunk_size=EXPORT_CHUNK_ROWS):
+        """
+        Iterate over every member's attendance on the given dates.
+        
+        Backends override this to read members in chunks of chunk_size,
+        so memory use does not grow with membership; the default loads
+        all members and one attendance list per date.
+        
+        Args:
+            dates: Date strings (YYYY-MM-DD) to include
+            chunk_size: Members to read per storage call
+            
+        Yields:
+            tuple: (reg_number, full_name, set of dates present)
+        """
+        present = {date_str: set(self.list_attendance(date_str)) for date_str in dates}
+        for member in self.list_members():
+            yield member.reg_number, member.full_name, {
+                date_str for date_str in dates if member.reg_number in present[date_str]
+            }
+    
+    def get_report_values(self):
+        """
+        Read the published report.
+        
+        Returns:
+            list: Rows of cell values as strings, trailing empty cells trimmed
+        """
+        raise NotImplementedError
+    
+    def update_report_cells(self, cells):
+        """
+        Overwrite cells of the published report in one write.
+        
+        Args:
+            cells: List of (row, col, value) tuples, 1-based
+        """
+        raise NotImplementedError
+    
+    def get_write_queue_stats(self):
+        """
+        Get write-behind queue metrics.
+        
+        Returns:
+            dict: Queue metrics or None if the backend has no write queue
+        """
+        return None
+    
+    def get_client_pool_stats(self):
+        """
+        Get API client pool metrics.
+        
+        Returns:
+            dict: Pool metrics or None if the backend has no client pool
+        """
+        return None
+
+
+def get_storage_backend():
+    """
+    Get the storage backend selected by STORAGE_BACKEND.
+    
+    Returns:
+        StorageBackend: Backend instance
+    """
+    if STORAGE_BACKEND == 'sheets':
+        from services.sheets_service import get_sheets_service
+        return get_sheets_service()
+    
+    if STORAGE_BACKEND == 'sqlite':
+        from services.sqlite_service import get_sqlite_service
+        return get_sqlite_service()
+    
+    raise ValueError(f"Unknown storage backend: {STORAGE_BACKEND}")
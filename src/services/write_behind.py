@@ -0,0 +1,409 @@
+"""Write-behind queue for batching attendance marks."""
+
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from services.storage import StorageBusyError
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _try_lock(journal):
+    """
+    Take an exclusive lock on an open journal without waiting.
+    
+    The lock is held until the file is closed or the process exits, so a
+    journal that can be locked belongs to no running process.
+    
+    Args:
+        journal: Open journal file
+        
+    Returns:
+        bool: True if locked, False if another process holds the lock
+    """
+    try:
+        if fcntl is not None:
+            fcntl.flock(journal.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            journal.seek(0)
+            msvcrt.locking(journal.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _read_journal(journal):
+    """
+    Read the marks a journal still holds.
+    
+    Args:
+        journal: Open journal file
+        
+    Returns:
+        list: (reg_number, date_str) marks journaled and not yet flushed
+    """
+    journal.seek(0)
+    pending = {}
+    for line in journal:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if 'flushed' in entry:
+            for reg_number, date_str in entry['flushed']:
+                pending.pop((reg_number, date_str), None)
+        else:
+            pending[(entry['reg_number'], entry['date'])] = True
+    return list(pending)
+
+
+class WriteQueueFullError(StorageBusyError):
+    """Raised when the write-behind queue stays full past the enqueue timeout."""
+
+
+class AttendanceWriteQueue:
+    """
+    Bounded, journaled queue of pending attendance marks.
+    
+    Marks are appended to a journal file before being acknowledged, so a
+    crash between enqueue and flush does not lose them. A background thread
+    hands pending marks to flush_func every flush_interval_ms, or sooner once
+    batch_size marks are waiting.
+    
+    Each process journals to its own locked file (journal_path with the PID
+    added, plus a random suffix if that name is locked by another live
+    process), which is only ever appended to: flushed marks are recorded with
+    a marker line, and the file is emptied once nothing is pending. At
+    startup, marks in the journals of processes that have exited are taken
+    over, so workers never rewrite each other's marks.
+    """
+    
+    def __init__(self, flush_func, journal_path, max_size=1000, batch_size=50,
+                 flush_interval_ms=2000, enqueue_timeout=5):
+        """
+        Initialize write queue.
+        
+        Args:
+            flush_func: Callable taking a list of (reg_number, date_str) marks
+            journal_path: Journal path; each process adds its PID to the name
+            max_size: Maximum number of pending marks
+            batch_size: Pending marks that trigger an early flush
+            flush_interval_ms: Maximum time between flushes
+            enqueue_timeout: Seconds to wait for room when the queue is full
+        """
+        self.flush_func = flush_func
+        self.base_path = str(journal_path)
+        root, extension = os.path.splitext(self.base_path)
+        self.journal_path = f"{root}.{os.getpid()}{extension}"
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.enqueue_timeout = enqueue_timeout
+        
+        self._pending = deque()
+        self._pending_keys = set()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._journal = None
+        self._thread = None
+        self._stopping = False
+        
+        self._stats = {
+            'enqueued_total': 0,
+            'flushed_total': 0,
+            'flush_count': 0,
+            'flush_errors': 0,
+            'rejected_total': 0,
+            'last_flush_latency_ms': None,
+            'max_flush_latency_ms': None,
+            'total_flush_latency_ms': 0.0,
+            'last_error': None
+        }
+        
+        self._replay_journal()
+    
+    def _open_journal(self):
+        """
+        Open and lock this process's journal.
+        
+        If another live process already holds the lock (containers sharing
+        the data volume can have the same PID), a random suffix is added to
+        the name until a journal of our own is found.
+        """
+        directory = os.path.dirname(self.journal_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        while True:
+            journal = open(self.journal_path, 'a+', encoding='utf-8')
+            if _try_lock(journal):
+                self._journal = journal
+                return
+            journal.close()
+            root, extension = os.path.splitext(self.base_path)
+            self.journal_path = f"{root}.{os.getpid()}-{uuid.uuid4().hex[:8]}{extension}"
+    
+    def _journal_paths(self):
+        """Get the journals of every process, plus the shared one used before per-process journals."""
+        root, extension = os.path.splitext(self.base_path)
+        return [self.base_path] + glob.glob(f"{glob.escape(root)}.*{extension}")
+    
+    def _replay_journal(self):
+        """
+        Load marks from this process's journal and take over orphaned ones.
+        
+        A journal is orphaned when its lock can be taken. Its marks are
+        copied into this process's journal before it is deleted.
+        """
+        self._open_journal()
+        marks = _read_journal(self._journal)  # Left by an exited process with the same PID
+        
+        orphans = []
+        adopted = []
+        try:
+            for path in self._journal_paths():
+                if path == self.journal_path:
+                    continue
+                try:
+                    journal = open(path, 'r', encoding='utf-8')
+                except OSError:
+                    continue
+                orphans.append(journal)
+                # Skip journals still in use, or deleted by a process that took them over first
+                if not _try_lock(journal) or os.fstat(journal.fileno()).st_nlink == 0:
+                    continue
+                adopted_marks = _read_journal(journal)
+                marks += adopted_marks
+                adopted.append((path, adopted_marks))
+            
+            self._write_journal([
+                {'reg_number': reg_number, 'date': date_str}
+                for _, adopted_marks in adopted
+                for reg_number, date_str in adopted_marks
+            ])
+        finally:
+            for journal in orphans:
+                journal.close()
+        
+        for path, _ in adopted:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        
+        for key in marks:
+            if key not in self._pending_keys:
+                self._pending.append(key)
+                self._pending_keys.add(key)
+    
+    def _write_journal(self, entries):
+        """Durably append entries to this process's journal."""
+        if not entries:
+            return
+        if self._journal is None:
+            self._open_journal()
+        
+        self._journal.write(''.join(json.dumps(entry) + '\n' for entry in entries))
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+    
+    def _append_journal(self, key):
+        """Durably append a mark to the journal."""
+        self._write_journal([{'reg_number': key[0], 'date': key[1]}])
+    
+    def _record_flushed(self, batch):
+        """Record flushed marks, emptying the journal once nothing is pending."""
+        if self._pending:
+            self._write_journal([{'flushed': [list(key) for key in batch]}])
+        elif self._journal is not None:
+            self._journal.truncate(0)
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+    
+    def enqueue(self, reg_number, date_str):
+        """
+        Queue an attendance mark.
+        
+        Blocks while the queue is full, up to enqueue_timeout seconds.
+        
+        Args:
+            reg_number: Member registration number
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            bool: True once the mark is journaled
+            
+        Raises:
+            WriteQueueFullError: If no room became available in time
+        """
+        key = (reg_number, date_str)
+        deadline = time.monotonic() + self.enqueue_timeout
+        
+        with self._condition:
+            if key in self._pending_keys:
+                return True
+            
+            while len(self._pending) >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['rejected_total'] += 1
+                    raise WriteQueueFullError(
+                        f"Attendance write queue is full ({self.max_size} pending marks)"
+                    )
+                self._condition.notify_all()
+                self._condition.wait(remaining)
+            
+            self._append_journal(key)
+            self._pending.append(key)
+            self._pending_keys.add(key)
+            self._stats['enqueued_total'] += 1
+            
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify_all()
+        
+        return True
+    
+    def is_pending(self, reg_number, date_str):
+        """
+        Check if a mark is waiting to be flushed.
+        
+        Args:
+            reg_number: Member registration number
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            bool: True if pending
+        """
+        return (reg_number, date_str) in self._pending_keys
+    
+    def get_pending(self, date_str):
+        """
+        Get members with marks waiting to be flushed for a date.
+        
+        Args:
+            date_str: Date string (YYYY-MM-DD)
+            
+        Returns:
+            set: Registration numbers
+        """
+        with self._condition:
+            return {reg_number for reg_number, date in self._pending_keys if date == date_str}
+    
+    def flush(self):
+        """
+        Write all pending marks with a single call to flush_func.
+        
+        Marks stay queued (and journaled) if the flush fails.
+        
+        Returns:
+            int: Number of marks flushed
+        """
+        with self._flush_lock:
+            with self._condition:
+                batch = list(self._pending)
+            
+            if not batch:
+                return 0
+            
+            started = time.perf_counter()
+            try:
+                self.flush_func(batch)
+            except Exception as e:
+                with self._condition:
+                    self._stats['flush_errors'] += 1
+                    self._stats['last_error'] = str(e)
+                return 0
+            latency_ms = (time.perf_counter() - started) * 1000
+            
+            with self._condition:
+                for _ in batch:
+                    key = self._pending.popleft()
+                    self._pending_keys.discard(key)
+                self._record_flushed(batch)
+                
+                self._stats['flushed_total'] += len(batch)
+                self._stats['flush_count'] += 1
+                self._stats['last_flush_latency_ms'] = latency_ms
+                self._stats['total_flush_latency_ms'] += latency_ms
+                if (self._stats['max_flush_latency_ms'] is None
+                        or latency_ms > self._stats['max_flush_latency_ms']):
+                    self._stats['max_flush_latency_ms'] = latency_ms
+                
+                # Wake producers waiting for room
+                self._condition.notify_all()
+            
+            return len(batch)
+    
+    def _run(self):
+        """Background flusher loop."""
+        failed = False
+        while True:
+            with self._condition:
+                # After a failed flush, wait a full interval before retrying
+                if not self._stopping and (failed or len(self._pending) < self.batch_size):
+                    self._condition.wait(self.flush_interval)
+                if self._stopping:
+                    break
+            failed = self.flush() == 0 and bool(self._pending)
+    
+    def start(self):
+        """Start the background flusher and register flush-on-shutdown."""
+        if self._thread is not None:
+            return
+        
+        self._thread = threading.Thread(
+            target=self._run,
+            name='attendance-write-behind',
+            daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+    
+    def stop(self):
+        """Stop the background flusher and flush any pending marks."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+        
+        self.flush()
+        
+        # Nothing left to replay: remove the journal rather than leave one per PID
+        with self._condition:
+            if not self._pending and self._journal is not None:
+                self._journal.close()
+                self._journal = None
+                os.remove(self.journal_path)
+    
+    def get_stats(self):
+        """
+        Get queue metrics.
+        
+        Returns:
+            dict: Queue depth, throughput and flush latency figures
+        """
+        with self._condition:
+            stats = dict(self._stats)
+            stats['queue_depth'] = len(self._pending)
+            stats['max_queue'] = self.max_size
+        
+        total_latency = stats.pop('total_flush_latency_ms')
+        stats['avg_flush_latency_ms'] = (
+            total_latency / stats['flush_count'] if stats['flush_count'] else None
+        )
+        return stats
@@ -0,0 +1,77 @@
+"""Authentication for leader-only and metrics endpoints."""
+
+import hmac
+from functools import wraps
+from flask import request, jsonify
+from config.settings import LEADER_API_TOKEN, METRICS_API_TOKEN
+from utils.helpers import format_error_response
+
+
+def _has_bearer_token(expected):
+    """Check the request's Authorization header carries the expected bearer token."""
+    header = request.headers.get('Authorization', '')
+    scheme, _, token = header.partition(' ')
+    return scheme.lower() == 'bearer' and hmac.compare_digest(token.strip().encode(), expected.encode())
+
+
+def require_leader_token(view):
+    """
+    Restrict a view to club leaders.
+    
+    The request must carry LEADER_API_TOKEN as a bearer token
+    (Authorization: Bearer <token>). While no token is configured,
+    leader endpoints are disabled.
+    
+    Args:
+        view: Flask view function
+        
+    Returns:
+        function: Wrapped view
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not LEADER_API_TOKEN:
+            return jsonify(format_error_response(
+                'LEADER_ENDPOINTS_DISABLED',
+                'Leader endpoints are not configured on this server'
+            )), 403
+        
+        if not _has_bearer_token(LEADER_API_TOKEN):
+            return jsonify(format_error_response(
+                'UNAUTHORIZED',
+                'A valid leader token is required'
+            )), 401
+        
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def require_metrics_token(view):
+    """
+    Restrict a view to the metrics scraper.
+    
+    The request must carry METRICS_API_TOKEN as a bearer token. While no
+    token is configured, the metrics endpoint is disabled.
+    
+    Args:
+        view: Flask view function
+        
+    Returns:
+        function: Wrapped view
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not METRICS_API_TOKEN:
+            return jsonify(format_error_response(
+                'METRICS_DISABLED',
+                'Metrics are not configured on this server'
+            )), 403
+        
+        if not _has_bearer_token(METRICS_API_TOKEN):
+            return jsonify(format_error_response(
+                'UNAUTHORIZED',
+                'A valid metrics token is required'
+            )), 401
+        
+        return view(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,94 @@
+"""Application clock, replaceable so tests and benchmarks can freeze time."""
+
+import threading
+from datetime import datetime, timedelta
+import pytz
+from config.settings import TIMEZONE
+
+# Resolved once; pytz.timezone() repeats the zone lookup on every call
+TZ = pytz.timezone(TIMEZONE)
+
+
+class SystemClock:
+    """Wall-clock time in the configured timezone."""
+    
+    def now(self):
+        """
+        Get the current time.
+        
+        Returns:
+            datetime: Current datetime with timezone
+        """
+        return datetime.now(TZ)
+
+
+class FrozenClock:
+    """Clock that stays at a set time until it is moved."""
+    
+    def __init__(self, frozen):
+        """
+        Initialize frozen clock.
+        
+        Args:
+            frozen: Time to report; naive datetimes are taken as local time
+        """
+        self._lock = threading.Lock()
+        self.set(frozen)
+    
+    def now(self):
+        """
+        Get the frozen time.
+        
+        Returns:
+            datetime: Frozen datetime with timezone
+        """
+        return self._now
+    
+    def set(self, frozen):
+        """
+        Move the clock to a new time.
+        
+        Args:
+            frozen: Time to report; naive datetimes are taken as local time
+        """
+        with self._lock:
+            self._now = frozen if frozen.tzinfo else TZ.localize(frozen)
+    
+    def advance(self, **kwargs):
+        """
+        Move the clock forward.
+        
+        Args:
+            **kwargs: timedelta arguments, e.g. minutes=5
+        """
+        with self._lock:
+            self._now = TZ.normalize(self._now + timedelta(**kwargs))
+
+
+_clock = SystemClock()
+
+
+def get_clock():
+    """
+    Get the application clock.
+    
+    Returns:
+        SystemClock or FrozenClock: Current clock
+    """
+    return _clock
+
+
+def set_clock(clock):
+    """
+    Replace the application clock.
+    
+    Args:
+        clock: Object with a now() method returning an aware datetime
+        
+    Returns:
+        The previous clock, to restore afterwards
+    """
+    global _clock
+    previous = _clock
+    _clock = clock
+    return previous
@@ -1,5 +1,20 @@
 """Helper utilities."""
 
+import csv
+import io
+
+# Columns required in a member import CSV
+MEMBER_CSV_FIELDS = (
+    'reg_number',
+    'full_name',
+    'email',
+    'phone',
+    'gender',
+    'year_of_study',
+    'course',
+    'departments'
+)
+
 
 def format_departments(departments):
     """
@@ -39,6 +54,49 @@ def parse_departments(departments_str):
     return [d.strip() for d in departments_str.split(',') if d.strip()]
 
 
+def parse_member_csv(text):
+    """
+    Parse a member import CSV.
+    
+    Headers are matched case-insensitively with spaces treated as
+    underscores, so both field names (reg_number) and Members sheet
+    headers (Reg Number) work. Departments may be separated by commas
+    or semicolons. Blank lines are skipped.
+    
+    Args:
+        text: CSV file contents
+        
+    Returns:
+        list: (line_number, member_data) tuples; the header is line 1
+        
+    Raises:
+        ValueError: If required columns are missing
+    """
+    reader = csv.reader(io.StringIO(text))
+    header = next(reader, None)
+    if not header:
+        raise ValueError("CSV file is empty")
+    
+    columns = [name.strip().lower().replace(' ', '_') for name in header]
+    missing = [field for field in MEMBER_CSV_FIELDS if field not in columns]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    
+    rows = []
+    for values in reader:
+        if not any(value.strip() for value in values):
+            continue
+        
+        data = {}
+        for column, value in zip(columns, values):
+            if column in MEMBER_CSV_FIELDS:
+                data[column] = value.strip()
+        data['departments'] = data.get('departments', '').replace(';', ',')
+        rows.append((reader.line_num, data))
+    
+    return rows
+
+
 def format_error_response(code, message, details=None):
     """
     Format standard error response.
@@ -0,0 +1,151 @@
+"""Prometheus metrics for requests, service results, Sheets API calls and caches."""
+
+import functools
+import inspect
+import time
+from flask import g, request
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    generate_latest,
+    multiprocess
+)
+from config.settings import PROMETHEUS_MULTIPROC_DIR
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Time spent handling HTTP requests',
+    ['method', 'route']
+)
+REQUESTS = Counter(
+    'http_requests',
+    'HTTP responses by status',
+    ['method', 'route', 'status']
+)
+SERVICE_RESULTS = Counter(
+    'service_results',
+    'Service operation results by error code (OK on success)',
+    ['operation', 'code']
+)
+SHEETS_CALLS = Counter(
+    'sheets_api_calls',
+    'Google Sheets API calls, one per attempt',
+    ['worksheet', 'method', 'outcome']
+)
+SHEETS_LATENCY = Histogram(
+    'sheets_api_call_duration_seconds',
+    'Google Sheets API call latency, one per attempt',
+    ['worksheet', 'method']
+)
+CACHE_LOOKUPS = Counter(
+    'cache_lookups',
+    'Cache lookups by result',
+    ['cache', 'result']
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _child(metric, *labels):
+    """Get a metric's child for label values; labels() locks on every call."""
+    return metric.labels(*labels)
+
+
+def record_cache(cache, hit):
+    """
+    Count a cache lookup.
+    
+    Args:
+        cache: Cache name
+        hit: True if served from the cache, False if it had to be (re)loaded
+    """
+    _child(CACHE_LOOKUPS, cache, 'hit' if hit else 'miss').inc()
+
+
+def record_sheets_call(worksheet, method, outcome, seconds):
+    """
+    Count one Sheets API attempt and its latency.
+    
+    Args:
+        worksheet: Worksheet title
+        method: Worksheet method name
+        outcome: 'ok', 'retryable' or 'error'
+        seconds: Time the attempt took
+    """
+    _child(SHEETS_CALLS, worksheet, method, outcome).inc()
+    _child(SHEETS_LATENCY, worksheet, method).observe(seconds)
+
+
+def counts_results(operation):
+    """
+    Count the results of a service method returning (success, error_or_data).
+    
+    Works on coroutine methods too, so the sync and async variants of an
+    operation are counted under the same label.
+    
+    Args:
+        operation: Operation label
+        
+    Returns:
+        Decorator
+    """
+    def record(success, result):
+        _child(SERVICE_RESULTS, operation, 'OK' if success else result.get('code', 'UNKNOWN')).inc()
+    
+    def decorator(method):
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(*args, **kwargs):
+                success, result = await method(*args, **kwargs)
+                record(success, result)
+                return success, result
+            return async_wrapper
+        
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            success, result = method(*args, **kwargs)
+            record(success, result)
+            return success, result
+        return wrapper
+    return decorator
+
+
+def register_metrics(app):
+    """
+    Time every request and count responses by route and status.
+    
+    Routes are labelled with their URL rule, so reg numbers and other
+    path parameters never become label values.
+    """
+    
+    @app.before_request
+    def start_timer():
+        g.metrics_started = time.perf_counter()
+    
+    @app.after_request
+    def record_request(response):
+        started = g.pop('metrics_started', None)
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            _child(REQUEST_LATENCY, request.method, route).observe(time.perf_counter() - started)
+            _child(REQUESTS, request.method, route, str(response.status_code)).inc()
+        return response
+
+
+def render_metrics():
+    """
+    Render all metrics in the Prometheus text format.
+    
+    With PROMETHEUS_MULTIPROC_DIR set, the values written by every worker
+    process are aggregated.
+    
+    Returns:
+        tuple: (body, content_type)
+    """
+    registry = REGISTRY
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry, PROMETHEUS_MULTIPROC_DIR)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
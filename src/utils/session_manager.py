@@ -1,14 +1,24 @@
 """Session management utilities."""
 
-from datetime import datetime, timedelta
-import pytz
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import datetime, time, timedelta
 from config.settings import (
-    TIMEZONE,
     ATTENDANCE_START_HOUR,
     ATTENDANCE_END_HOUR,
     ATTENDANCE_END_DAY_OFFSET
 )
-from config.sessions import get_session, get_current_friday_session
+from config.sessions import get_schedule, get_session
+from utils.clock import TZ, get_clock
+
+# Attendance window of one session: start <= time < end, timezone-aware
+AttendanceWindow = namedtuple('AttendanceWindow', ['date_str', 'start', 'end'])
+
+# (schedule, windows, window ends, window by date) for the schedule they were built from
+_windows = (None, (), (), {})
+
+# Window found by the last lookup; most requests fall inside it
+_last_window = None
 
 
 def get_current_datetime():
@@ -18,8 +28,103 @@ def get_current_datetime():
     Returns:
         datetime: Current datetime with timezone
     """
-    tz = pytz.timezone(TIMEZONE)
-    return datetime.now(tz)
+    return get_clock().now()
+
+
+def _build_window(date_str):
+    """Compute a session's attendance window."""
+    day = datetime.strptime(date_str, '%Y-%m-%d')
+    start = TZ.localize(day.replace(hour=ATTENDANCE_START_HOUR))
+    end = TZ.localize(day.replace(hour=ATTENDANCE_END_HOUR) + timedelta(days=ATTENDANCE_END_DAY_OFFSET))
+    return AttendanceWindow(date_str, start, end)
+
+
+def _get_windows():
+    """Get the cached windows, rebuilding them if the schedule was reloaded."""
+    global _windows
+    schedule = get_schedule()
+    if _windows[0] is not schedule:
+        windows = tuple(_build_window(date_str) for date_str in schedule.dates)
+        _windows = (
+            schedule,
+            windows,
+            tuple(window.end for window in windows),
+            {window.date_str: window for window in windows}
+        )
+    return _windows
+
+
+def get_attendance_windows():
+    """
+    Get the attendance window of every scheduled session.
+    
+    Windows are computed once per schedule and rebuilt when the
+    schedule is reloaded.
+    
+    Returns:
+        tuple: AttendanceWindow per session, oldest first
+    """
+    return _get_windows()[1]
+
+
+def get_session_window(date_str):
+    """
+    Get the attendance window of a scheduled session.
+    
+    Args:
+        date_str: Session date (YYYY-MM-DD)
+        
+    Returns:
+        AttendanceWindow: Window, or None if no session is scheduled
+    """
+    return _get_windows()[3].get(date_str)
+
+
+def get_last_closed_window(current_datetime=None):
+    """
+    Get the most recent attendance window that has closed.
+    
+    Args:
+        current_datetime: datetime to check (default: now)
+        
+    Returns:
+        AttendanceWindow: Closed window, or None if none has closed yet
+    """
+    if current_datetime is None:
+        current_datetime = get_current_datetime()
+    
+    _, windows, ends, _ = _get_windows()
+    index = bisect_right(ends, current_datetime)
+    return windows[index - 1] if index else None
+
+
+def get_window(current_datetime=None):
+    """
+    Get the attendance window that is open at a time, or the next one.
+    
+    Args:
+        current_datetime: datetime to check (default: now)
+        
+    Returns:
+        AttendanceWindow: Open or upcoming window, or None if none remain
+    """
+    global _last_window
+    if current_datetime is None:
+        current_datetime = get_current_datetime()
+    
+    schedule, windows, ends, _ = _get_windows()
+    window = _last_window
+    if window is not None and window.start <= current_datetime < window.end and window.date_str in schedule:
+        return window
+    
+    index = bisect_right(ends, current_datetime)
+    if index == len(windows):
+        return None
+    
+    window = windows[index]
+    if window.start <= current_datetime:
+        _last_window = window
+    return window
 
 
 def get_current_friday_date():
@@ -51,40 +156,37 @@ def get_current_friday_date():
 
 def is_within_time_window(current_datetime=None):
     """
-    Check if current time is within attendance marking window.
+    Check if current time is within a scheduled session's attendance window.
     
-    Window: Friday 13:00 → Saturday 00:00
+    Window: session day 13:00 → next day 00:00
     
     Args:
         current_datetime: datetime to check (default: now)
         
     Returns:
-        tuple: (is_within, reason)
+        tuple: (window, reason) with the open AttendanceWindow, or None and
+        the reason marking is closed
     """
     if current_datetime is None:
         current_datetime = get_current_datetime()
     
-    # Get current day and time
+    window = get_window(current_datetime)
+    if window is not None and window.start <= current_datetime:
+        return window, None
+    
+    # Closed: explain relative to this week's window
     current_day = current_datetime.weekday()  # 0=Monday, 4=Friday, 5=Saturday
-    current_time = current_datetime.time()
     
-    # Friday (day 4): From 13:00 onwards
     if current_day == 4:
-        start_time = datetime.strptime(f"{ATTENDANCE_START_HOUR}:00", "%H:%M").time()
-        if current_time >= start_time:
-            return True, None
-        else:
-            return False, f"Attendance marking starts at {ATTENDANCE_START_HOUR}:00 on Friday"
+        if current_datetime.hour < ATTENDANCE_START_HOUR:
+            return None, f"Attendance marking starts at {ATTENDANCE_START_HOUR}:00 on Friday"
+        return None, "No session scheduled for this week"
     
-    # Saturday (day 5): Until 00:00 (which is start of day)
     elif current_day == 5:
-        end_time = datetime.strptime(f"{ATTENDANCE_END_HOUR:02d}:00", "%H:%M").time()
-        # Since ATTENDANCE_END_HOUR is 0 (midnight), this means any time on Saturday is past window
-        return False, "Attendance marking window closed (ended at Saturday 00:00)"
+        return None, "Attendance marking window closed (ended at Saturday 00:00)"
     
-    # Other days
     else:
-        return False, "Attendance can only be marked from Friday 13:00 to Saturday 00:00"
+        return None, "Attendance can only be marked from Friday 13:00 to Saturday 00:00"
 
 
 def validate_session_code(session_code, date_str=None):
@@ -107,13 +209,14 @@ def validate_session_code(session_code, date_str=None):
         date_str = friday_date.strftime('%Y-%m-%d')
     
     # Get expected session for this date
-    session = get_session(date_str)
+    schedule = get_schedule()
+    session = schedule.get(date_str)
     
     if not session:
         return False, f"No session scheduled for {date_str}", None
     
-    # Validate code
-    if session_code.upper() != session['code'].upper():
+    # Validate code (codes are indexed case-folded)
+    if schedule.date_for_code(session_code) != date_str:
         return False, "Invalid session code", None
     
     return True, None, session
@@ -144,8 +247,13 @@ def get_current_session_info():
         dict: Session info with window status
     """
     now = get_current_datetime()
-    friday_date = get_current_friday_date()
-    date_str = friday_date.strftime('%Y-%m-%d')
+    
+    # Check time window; an open window is the current session, whatever its day
+    open_window, reason = is_within_time_window(now)
+    if open_window is not None:
+        date_str = open_window.date_str
+    else:
+        date_str = get_current_friday_date().strftime('%Y-%m-%d')
     
     session = get_session(date_str)
     
@@ -155,18 +263,13 @@ def get_current_session_info():
             'message': 'No session scheduled for this week'
         }
     
-    # Check time window
-    is_active, reason = is_within_time_window(now)
+    is_active = open_window is not None
+    window = get_session_window(date_str)
     
     # Calculate time remaining if active
     time_remaining = None
     if is_active:
-        # End time is Saturday 00:00
-        saturday = friday_date + timedelta(days=1)
-        end_datetime = datetime.combine(saturday, datetime.min.time())
-        end_datetime = pytz.timezone(TIMEZONE).localize(end_datetime)
-        
-        remaining = end_datetime - now
+        remaining = window.end - now
         hours = int(remaining.total_seconds() // 3600)
         minutes = int((remaining.total_seconds() % 3600) // 60)
         time_remaining = f"{hours}h {minutes}m"
@@ -175,16 +278,49 @@ def get_current_session_info():
         'has_session': True,
         'session': {
             'date': date_str,
-            'day': 'Friday',
+            'day': datetime.strptime(date_str, '%Y-%m-%d').strftime('%A'),
             'department': session['department'],
             'description': session['description'],
             'time': '13:30 - 15:30 EAT',
             'attendance_window': {
-                'start': f"{date_str}T{ATTENDANCE_START_HOUR:02d}:00:00+03:00",
-                'end': f"{(friday_date + timedelta(days=1)).strftime('%Y-%m-%d')}T{ATTENDANCE_END_HOUR:02d}:00:00+03:00",
+                'start': window.start.isoformat(),
+                'end': window.end.isoformat(),
                 'is_active': is_active,
                 'reason': reason,
                 'time_remaining': time_remaining
             }
         }
     }
+
+
+def get_session_info_expiry(current_datetime=None):
+    """
+    Get when the current session info will next change.
+    
+    That is the next window start or end, local midnight (when the
+    current Friday and the closed-window reason roll over), or, while a
+    window is open, the next change of time_remaining.
+    
+    Args:
+        current_datetime: datetime to check (default: now)
+        
+    Returns:
+        datetime: Timezone-aware expiry, after current_datetime
+    """
+    if current_datetime is None:
+        current_datetime = get_current_datetime()
+    
+    tomorrow = current_datetime.date() + timedelta(days=1)
+    boundaries = [TZ.localize(datetime.combine(tomorrow, time.min))]
+    
+    window = get_window(current_datetime)
+    if window is not None:
+        if current_datetime < window.start:
+            boundaries.append(window.start)
+        else:
+            boundaries.append(window.end)
+            # time_remaining is shown in whole minutes
+            seconds = (window.end - current_datetime).total_seconds() % 60
+            boundaries.append(current_datetime + timedelta(seconds=seconds or 60))
+    
+    return min(boundaries)
@@ -0,0 +1,181 @@
+"""Per-request span tracing, logged as one JSON line per request."""
+
+import contextlib
+import functools
+import json
+import logging
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from flask import g, request
+from config.settings import REQUEST_TRACING, TRACE_SHEETS_CALL_BUDGET, TRACE_DURATION_BUDGET_MS
+
+logger = logging.getLogger(__name__)
+
+# Trace of the request being handled; None outside requests (background threads)
+_current_trace = ContextVar('current_trace', default=None)
+_span_depth = ContextVar('span_depth', default=0)
+
+
+class Trace:
+    """Spans and upstream call count for one request."""
+    
+    def __init__(self):
+        """Start a trace now."""
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.started = time.perf_counter()
+        self.spans = []  # (name, depth, started, ended)
+        self.sheets_calls = 0
+        self._lock = threading.Lock()
+    
+    def add_sheets_call(self):
+        """Count one Sheets API attempt; async routes make them from several threads."""
+        with self._lock:
+            self.sheets_calls += 1
+    
+    def to_dict(self, duration_ms):
+        """
+        Build the log entry.
+        
+        Args:
+            duration_ms: Total request time
+            
+        Returns:
+            dict: Trace with spans in start order, times in ms from the start
+        """
+        return {
+            'trace_id': self.trace_id,
+            'duration_ms': round(duration_ms, 1),
+            'sheets_calls': self.sheets_calls,
+            'spans': [
+                {
+                    'name': name,
+                    'depth': depth,
+                    'start_ms': round((started - self.started) * 1000, 1),
+                    'duration_ms': round((ended - started) * 1000, 1)
+                }
+                for name, depth, started, ended in sorted(self.spans, key=lambda span: span[2])
+            ]
+        }
+
+
+@contextlib.contextmanager
+def span(name):
+    """
+    Time a block as a span of the current request's trace.
+    
+    Does nothing outside a traced request.
+    
+    Args:
+        name: Span name
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    
+    depth = _span_depth.get()
+    token = _span_depth.set(depth + 1)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _span_depth.reset(token)
+        trace.spans.append((name, depth, started, time.perf_counter()))
+
+
+def traced(name):
+    """
+    Run every call of a function in a span.
+    
+    Args:
+        name: Span name
+        
+    Returns:
+        Decorator
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count_sheets_call():
+    """Count a Sheets API attempt against the current request's budget."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_sheets_call()
+
+
+def _over_budget(trace, duration_ms):
+    """List the budgets a request exceeded (a budget of 0 is disabled)."""
+    over = []
+    if TRACE_SHEETS_CALL_BUDGET and trace.sheets_calls > TRACE_SHEETS_CALL_BUDGET:
+        over.append('sheets_calls')
+    if TRACE_DURATION_BUDGET_MS and duration_ms > TRACE_DURATION_BUDGET_MS:
+        over.append('duration')
+    return over
+
+
+def _log_trace(trace, method, route, status):
+    """
+    Log a finished request's trace.
+    
+    Args:
+        trace: Trace of the request
+        method: HTTP method
+        route: URL rule, or 'unmatched'
+        status: Response status code
+    """
+    duration_ms = (time.perf_counter() - trace.started) * 1000
+    over = _over_budget(trace, duration_ms)
+    level = logging.WARNING if over else logging.INFO
+    if logger.isEnabledFor(level):
+        entry = {'method': method, 'route': route, 'status': status}
+        entry.update(trace.to_dict(duration_ms))
+        if over:
+            entry['over_budget'] = over
+        logger.log(level, json.dumps(entry))
+
+
+def register_tracing(app):
+    """
+    Trace every request and log it when it finishes.
+    
+    Requests are logged at INFO, or at WARNING when they exceed
+    TRACE_SHEETS_CALL_BUDGET or TRACE_DURATION_BUDGET_MS. Streamed
+    responses are logged once their body has been sent. The entry is
+    only built if the logger will emit it.
+    """
+    if not REQUEST_TRACING:
+        return
+    
+    @app.before_request
+    def start_trace():
+        g.trace_token = _current_trace.set(Trace())
+    
+    @app.after_request
+    def log_trace(response):
+        trace = _current_trace.get()
+        if trace is None:
+            return response
+        
+        method = request.method
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        status = response.status_code
+        if response.is_streamed:
+            # Exports do their work while streaming: log once the body is sent
+            response.call_on_close(lambda: _log_trace(trace, method, route, status))
+        else:
+            _log_trace(trace, method, route, status)
+        return response
+    
+    @app.teardown_request
+    def end_trace(error):
+        token = g.pop('trace_token', None)
+        if token is not None:
+            _current_trace.reset(token)